@@ -0,0 +1,95 @@
+"""Benchmark the cache backends.
+
+Measures write throughput, read throughput and startup (reload) time for
+each backend at several collection sizes:
+
+    python -m benchmarks.bench_cache
+    python -m benchmarks.bench_cache --sizes 10000,100000 --backends sqlite,log --json cache.json
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.cache import MemoryCache, SQLiteCache, LogCache
+
+DEFAULT_SIZES = "10000,100000,1000000"
+DEFAULT_BACKENDS = "memory,sqlite,log"
+
+
+def open_backend(name: str, directory: Path):
+    """Open (or reopen) a backend rooted in ``directory``."""
+    if name == "memory":
+        return MemoryCache()
+    if name == "sqlite":
+        return SQLiteCache(str(directory / "cache.db"))
+    if name == "log":
+        return LogCache(str(directory / "cache"))
+    raise ValueError(f"Unknown backend {name!r}")
+
+
+def bench(name: str, size: int) -> dict:
+    """Run one backend at one collection size."""
+    ids = [str(i) for i in range(size)]
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        cache = open_backend(name, directory)
+
+        start = time.perf_counter()
+        for i, bookmark_id in enumerate(ids):
+            cache.update_status(
+                bookmark_id,
+                "dead" if i % 10 == 0 else "alive",
+                f"https://host{i % 1000}.example.com/{i}"
+            )
+        write_s = time.perf_counter() - start
+
+        sample = random.sample(ids, min(size, 100_000))
+        start = time.perf_counter()
+        for bookmark_id in sample:
+            cache.get_status(bookmark_id)
+        read_s = time.perf_counter() - start
+        cache.close()
+
+        startup_s = None
+        if name != "memory":
+            start = time.perf_counter()
+            reopened = open_backend(name, directory)
+            reopened.get_status(ids[-1])
+            startup_s = time.perf_counter() - start
+            reopened.close()
+
+    return {
+        "backend": name,
+        "size": size,
+        "writes_per_s": round(size / write_s),
+        "reads_per_s": round(len(sample) / read_s),
+        "startup_s": round(startup_s, 4) if startup_s is not None else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma separated bookmark counts")
+    parser.add_argument("--backends", default=DEFAULT_BACKENDS, help="comma separated backend names")
+    parser.add_argument("--json", dest="json_path", help="also write results to this JSON file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'backend':<8} {'size':>9} {'writes/s':>10} {'reads/s':>10} {'startup s':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        for name in args.backends.split(","):
+            row = bench(name, size)
+            results.append(row)
+            startup = "-" if row["startup_s"] is None else f"{row['startup_s']:.4f}"
+            print(f"{name:<8} {size:>9} {row['writes_per_s']:>10} {row['reads_per_s']:>10} {startup:>10}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
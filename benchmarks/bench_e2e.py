@@ -0,0 +1,132 @@
+"""End-to-end benchmark of one full check cycle.
+
+Runs ``LinkAceSentry.run_once`` against an in-process fake LinkAce API and
+a fleet of fake web hosts with configurable latency, error and redirect
+rates, then reports throughput, per-check latency percentiles, peak RSS
+and LinkAce API call counts:
+
+    python -m benchmarks.bench_e2e --bookmarks 5000 --hosts 20 --latency 0.05 --json e2e.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import time
+
+# Settings are loaded on import; the benchmark needs no real credentials.
+for _name, _value in {
+    "LINKACE_API_TOKEN": "bench",
+    "ADMIN_TOKEN": "bench",
+    "AWS_SNS_TOPIC_ARN": "arn:aws:sns:us-east-1:000000000000:bench",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from benchmarks.fakes import FakeLinkAce, start_fleet, synthetic_links  # noqa: E402
+from src.config import settings  # noqa: E402
+from src.service import LinkAceSentry  # noqa: E402
+
+
+def percentile(sorted_values, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+async def run(
+    bookmarks: int,
+    hosts: int,
+    latency: float,
+    error_rate: float,
+    redirect_rate: float,
+    concurrency: int,
+    seed: int = 1
+) -> dict:
+    fleet = await start_fleet(
+        hosts, latency=latency, error_rate=error_rate, redirect_rate=redirect_rate, seed=seed
+    )
+    linkace = await FakeLinkAce(synthetic_links(bookmarks, fleet)).start()
+
+    settings.LINKACE_BASE_URL = linkace.base_url
+    settings.CONCURRENCY = concurrency
+    settings.CACHE_BACKEND = "memory"
+    settings.NOTIFY_SINK = "fake"
+    settings.TRACE_EXPORT = "none"
+    settings.PROFILE_CYCLES = 0
+    sentry = LinkAceSentry()
+
+    latencies = []
+    check_url = sentry.checker.check_url
+
+    async def timed_check(url):
+        started = time.perf_counter()
+        try:
+            return await check_url(url)
+        finally:
+            latencies.append(time.perf_counter() - started)
+    sentry.checker.check_url = timed_check
+
+    start = time.perf_counter()
+    try:
+        await sentry.run_once()
+        elapsed = time.perf_counter() - start
+        notifications = sentry.cache.outbox_size()
+    finally:
+        await sentry.stop()
+        await linkace.stop()
+        for host in fleet:
+            await host.stop()
+
+    latencies.sort()
+    outcomes = {}
+    for host in fleet:
+        for status, count in host.outcomes.items():
+            outcomes[str(status)] = outcomes.get(str(status), 0) + count
+
+    return {
+        "bookmarks": bookmarks,
+        "hosts": hosts,
+        "latency_s": latency,
+        "error_rate": error_rate,
+        "redirect_rate": redirect_rate,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "checks": len(latencies),
+        "checks_per_s": round(len(latencies) / elapsed, 1),
+        "check_p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "check_p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        # Includes the fake servers, which run in the same process
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "linkace_calls": dict(sorted(linkace.calls.items())),
+        "web_responses": dict(sorted(outcomes.items())),
+        "notifications_queued": notifications,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bookmarks", type=int, default=5_000)
+    parser.add_argument("--hosts", type=int, default=20, help="number of fake web hosts")
+    parser.add_argument("--latency", type=float, default=0.05, help="median web host latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="fraction of checks answered 404/500")
+    parser.add_argument("--redirect-rate", type=float, default=0.1, help="fraction of checks redirected")
+    parser.add_argument("--concurrency", type=int, default=settings.CONCURRENCY)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    result = asyncio.run(run(
+        args.bookmarks, args.hosts, args.latency, args.error_rate,
+        args.redirect_rate, args.concurrency, args.seed
+    ))
+    print(json.dumps(result, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
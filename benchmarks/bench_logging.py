@@ -0,0 +1,99 @@
+"""Benchmark the per-check logging cost on the event loop thread.
+
+Compares the old hot path (five eager f-string INFO lines per check,
+written synchronously) with the current one (one lazy line per check at
+DEBUG, or at INFO for a sample, handed to a QueueListener thread):
+
+    python -m benchmarks.bench_logging --checks 100000 --json logging.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import tempfile
+import time
+from logging.handlers import QueueListener
+
+from src.log_setup import TEXT_FORMAT, DeferredQueueHandler, bookmark_log_level
+from src.models import CheckResult
+
+
+def old_style(logger: logging.Logger, i: int, url: str, result: CheckResult) -> None:
+    logger.info(f"Checking URL: {url}")
+    logger.info(f"Check result for {url}: {result}")
+    logger.info(f"Setting status for bookmark {i} to {'alive' if result.is_alive else 'dead'}")
+    logger.info(f"Link {url} is dead, queueing notification")
+    logger.info(f"Processed bookmark {i} ({url}) in {round(0.123, 2)}s with actions: add_dead")
+
+
+def new_style(logger: logging.Logger, i: int, url: str, result: CheckResult, sample_rate: float) -> None:
+    level = bookmark_log_level(sample_rate)
+    logger.log(level, "Link %s is %s, queueing notification", url, "dead")
+    logger.log(
+        level,
+        "Processed bookmark %s (%s) in %.2fs: %s, status %s, actions: %s",
+        i, url, 0.123, "dead", result.status_code or result.error, "add_dead"
+    )
+
+
+def measure(checks: int, emit) -> float:
+    result = CheckResult(is_alive=False, status_code=404, error="HTTP 404")
+    start = time.perf_counter()
+    for i in range(checks):
+        emit(i, f"https://example.com/page/{i}", result)
+    return (time.perf_counter() - start) / checks * 1e6
+
+
+def run(checks: int, sample_rate: float) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        def file_handler(name):
+            handler = logging.FileHandler(os.path.join(tmp, name))
+            handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+            return handler
+
+        def fresh_logger(name, handler):
+            logger = logging.getLogger(f"bench.{name}")
+            logger.handlers[:] = [handler]
+            logger.propagate = False
+            logger.setLevel(logging.INFO)
+            return logger
+
+        logger = fresh_logger("old", file_handler("old.log"))
+        results["old_sync_us_per_check"] = measure(checks, lambda i, u, r: old_style(logger, i, u, r))
+
+        for label, rate in (("new_debug_off", 0.0), ("new_sampled", sample_rate), ("new_all_info", 1.0)):
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler(f"{label}.log"))
+            listener.start()
+            logger = fresh_logger(label, DeferredQueueHandler(log_queue))
+            results[f"{label}_us_per_check"] = measure(
+                checks, lambda i, u, r: new_style(logger, i, u, r, rate)
+            )
+            listener.stop()
+
+    return {
+        "checks": checks,
+        "sample_rate": sample_rate,
+        **{k: round(v, 3) for k, v in results.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--checks", type=int, default=100_000)
+    parser.add_argument("--sample-rate", type=float, default=0.01, help="fraction of checks logged at INFO")
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    args = parser.parse_args()
+
+    result = run(args.checks, args.sample_rate)
+    print(json.dumps(result, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
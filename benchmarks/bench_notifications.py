@@ -0,0 +1,74 @@
+"""Benchmark outbox delivery against the in-process fake SNS.
+
+Fills an outbox with N notifications and drains it through OutboxSender
+into FakeSNSSink with simulated latency and throttling, without AWS:
+
+    python -m benchmarks.bench_notifications --messages 20000 --latency 0.03 --calls-per-second 30
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from src.cache import MemoryCache
+from src.services.notification_service import NotificationService
+from src.services.notification_sinks import FakeSNSSink
+from src.services.outbox_sender import OutboxSender
+
+
+async def run(messages: int, latency: float, calls_per_second: float, throttle_rate: float,
+              base_backoff: float) -> dict:
+    cache = MemoryCache()
+    for i in range(messages):
+        cache.enqueue_notification({
+            "Subject": f"Dead Link Found: {i}",
+            "Message": json.dumps({"type": "dead_link", "link": {"id": i}}),
+        })
+
+    sink = FakeSNSSink(
+        latency=latency,
+        throttle_rate=throttle_rate,
+        max_calls_per_second=calls_per_second or None,
+        seed=1
+    )
+    notifier = NotificationService(topic_arn="fake", sink=sink)
+    sender = OutboxSender(cache, notifier, base_backoff=base_backoff, max_backoff=base_backoff * 16)
+
+    start = time.perf_counter()
+    while cache.outbox_size():
+        await sender.drain()
+        if cache.outbox_size():
+            # Wait for the earliest deferred entry to become due again
+            await asyncio.sleep(base_backoff / 2)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "messages": messages,
+        "elapsed_s": round(elapsed, 3),
+        "messages_per_s": round(messages / elapsed),
+        "calls": notifier.metrics.calls,
+        "throttled": sink.throttled,
+        "latency_avg_s": round(notifier.metrics.latency_avg_s, 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds per fake SNS call")
+    parser.add_argument("--calls-per-second", type=float, default=0, help="simulated SNS quota (0 = none)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="probability a call is throttled")
+    parser.add_argument("--base-backoff", type=float, default=0.05, help="outbox retry backoff in seconds")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    result = asyncio.run(run(
+        args.messages, args.latency, args.calls_per_second, args.throttle_rate, args.base_backoff
+    ))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
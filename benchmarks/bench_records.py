@@ -0,0 +1,116 @@
+"""Benchmark construction cost and memory of the per-bookmark records.
+
+Compares the previous pydantic ``Bookmark``/``CheckResult`` models with the
+``NamedTuple`` records, building one of each per synthetic bookmark, and
+with the columnar ``BookmarkStore`` a cycle now keeps its bookmarks in:
+
+    python -m benchmarks.bench_records --records 1000000 --json records.json
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from src.models import Bookmark, CheckResult
+from src.store import BookmarkStore
+
+
+class PydanticBookmark(BaseModel):
+    id: str
+    url: str
+    tags: List[str] = []
+    title: Optional[str] = None
+    note: Optional[str] = None
+
+
+class PydanticCheckResult(BaseModel):
+    is_alive: bool
+    status_code: Optional[int] = None
+    final_url: Optional[str] = None
+    error: Optional[str] = None
+    redirected: bool = False
+
+
+def build_pydantic(pages):
+    records = []
+    for page in pages:
+        for data in page:
+            bookmark = PydanticBookmark(id=str(data['id']), url=data['url'], title=data.get('title', ''), tags=[])
+            records.append((bookmark, PydanticCheckResult(is_alive=True, status_code=200, final_url=bookmark.url)))
+    return records
+
+
+def build_records(pages):
+    records = []
+    for page in pages:
+        for data in page:
+            bookmark = Bookmark.from_api(data)
+            records.append((bookmark, CheckResult(is_alive=True, status_code=200, final_url=bookmark.url)))
+    return records
+
+
+def build_store(pages):
+    store = BookmarkStore()
+    for page in pages:
+        store.extend(page)
+    return store
+
+
+def measure(build, pages, count: int) -> dict:
+    gc.collect()
+    start = time.perf_counter()
+    records = build(pages)
+    elapsed = time.perf_counter() - start
+    del records
+
+    gc.collect()
+    tracemalloc.start()
+    records = build(pages)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return {
+        "ns_per_record": round(elapsed / count * 1e9, 1),
+        "mb_per_million": round(retained / count * 1e6 / 2**20, 1),
+    }
+
+
+def run(count: int, page_size: int = 100) -> dict:
+    links = [
+        {
+            "id": i,
+            "url": f"https://host{i % 500}.example.com/page/{i}",
+            "title": f"Bookmark {i}",
+            "tags": [{"name": f"tag{i % 50}"}],
+        }
+        for i in range(count)
+    ]
+    pages = [links[i:i + page_size] for i in range(0, count, page_size)]
+    return {
+        "records": count,
+        "pydantic": measure(build_pydantic, pages, count),
+        "namedtuple": measure(build_records, pages, count),
+        "store": measure(build_store, pages, count),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+    args = parser.parse_args()
+
+    result = run(args.records)
+    print(json.dumps(result, indent=2))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""In-process fake LinkAce API and fake web hosts for end-to-end runs.
+
+Both are minimal HTTP/1.1 keep-alive servers on ``asyncio.start_server``,
+cheap enough that thousands of requests per second leave most of the CPU
+to the code under test.
+"""
+
+import asyncio
+import json
+import random
+import re
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+REASONS = {200: "OK", 301: "Moved Permanently", 302: "Found", 404: "Not Found", 500: "Internal Server Error"}
+
+# (status, headers, body, delay in seconds)
+Response = Tuple[int, Dict[str, str], bytes, float]
+
+
+class FakeHTTPServer(ABC):
+    """Tiny HTTP/1.1 server; subclasses implement ``handle``."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> "FakeHTTPServer":
+        self._server = await asyncio.start_server(self._serve, self.host, self.port, backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    @abstractmethod
+    def handle(self, method: str, path: str, query: Dict[str, List[str]], body: bytes) -> Response:
+        """Response to one request."""
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                length = 0
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                body = await reader.readexactly(length) if length else b""
+
+                self.requests += 1
+                parts = urlsplit(target)
+                status, headers, payload, delay = self.handle(method, parts.path, parse_qs(parts.query), body)
+                if delay:
+                    await asyncio.sleep(delay)
+
+                head = [f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}", f"Content-Length: {len(payload)}"]
+                head += [f"{k}: {v}" for k, v in headers.items()]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+                if method != "HEAD":
+                    writer.write(payload)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+class FakeLinkAce(FakeHTTPServer):
+    """
+    LinkAce API serving synthetic bookmarks on both the v1 and v2 link routes.
+
+    Supports paginated listing plus GET and PUT of single links, and counts
+    every call by method and route.
+    """
+
+    ROUTE = re.compile(r"^/api/v[12]/links(?:/(\d+))?$")
+
+    def __init__(self, links: List[Dict], **kwargs):
+        super().__init__(**kwargs)
+        self.links = {link["id"]: link for link in links}
+        self.order = [link["id"] for link in links]
+        self.calls: Counter = Counter()
+
+    def handle(self, method, path, query, body):
+        match = self.ROUTE.match(path)
+        if not match:
+            return 404, {}, b"", 0.0
+        version = path.split("/")[2]
+        link_id = match.group(1)
+        self.calls[f"{method} /api/{version}/links{'/{id}' if link_id else ''}"] += 1
+
+        if link_id is None and method == "GET":
+            page = int(query.get("page", ["1"])[0])
+            per_page = int(query.get("per_page", ["25"])[0])
+            ids = self.order[(page - 1) * per_page:page * per_page]
+            total = len(self.order)
+            data = {
+                "data": [self.links[i] for i in ids],
+                "meta": {
+                    "current_page": page,
+                    "last_page": max(1, -(-total // per_page)),
+                    "per_page": per_page,
+                    "total": total,
+                },
+            }
+            return 200, {"Content-Type": "application/json"}, json.dumps(data).encode(), 0.0
+
+        link = self.links.get(int(link_id)) if link_id else None
+        if link is None:
+            return 404, {}, b"", 0.0
+        if method == "PUT":
+            link.update(json.loads(body or b"{}"))
+        return 200, {"Content-Type": "application/json"}, json.dumps(link).encode(), 0.0
+
+
+class FakeWebHost(FakeHTTPServer):
+    """
+    Web host answering every path with a random outcome.
+
+    Latency is log-normal around ``latency`` seconds. With ``redirect_rate``
+    a request is redirected to ``/final`` + path, and with ``error_rate`` it
+    fails with 404 or 500; ``/final/...`` paths always succeed.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.05,
+        redirect_rate: float = 0.1,
+        seed: Optional[int] = None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.redirect_rate = redirect_rate
+        self.outcomes: Counter = Counter()
+        self._random = random.Random(seed)
+
+    def handle(self, method, path, query, body):
+        delay = self.latency * self._random.lognormvariate(0, self.latency_sigma) if self.latency else 0.0
+        roll = self._random.random()
+        if path.startswith("/final/"):
+            outcome = (200, {}, b"ok", delay)
+        elif roll < self.error_rate:
+            outcome = (self._random.choice((404, 500)), {}, b"", delay)
+        elif roll < self.error_rate + self.redirect_rate:
+            outcome = (301, {"Location": f"/final{path}"}, b"", delay)
+        else:
+            outcome = (200, {}, b"ok", delay)
+        self.outcomes[outcome[0]] += 1
+        return outcome
+
+
+async def start_fleet(hosts: int, **host_options) -> List[FakeWebHost]:
+    """
+    Start ``hosts`` fake web hosts, each on its own loopback address
+    (127.0.0.2, 127.0.0.3, ...) so they count as distinct hosts.
+    """
+    seed = host_options.pop("seed", None)
+    fleet = []
+    for i in range(hosts):
+        host = FakeWebHost(host=f"127.0.{(i + 2) // 256}.{(i + 2) % 256}",
+                           seed=None if seed is None else seed + i, **host_options)
+        fleet.append(await host.start())
+    return fleet
+
+
+def synthetic_links(count: int, fleet: List[FakeWebHost]) -> List[Dict]:
+    """Bookmarks spread round-robin over the fleet."""
+    return [
+        {
+            "id": i,
+            "url": f"{fleet[i % len(fleet)].base_url}/page/{i}",
+            "title": f"Bookmark {i}",
+            "description": "",
+            "tags": [],
+            "status": 1,
+            "check_disabled": False,
+        }
+        for i in range(1, count + 1)
+    ]
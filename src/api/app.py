@@ -0,0 +1,40 @@
+"""Control plane API served from the service process."""
+
+import uvicorn
+from fastapi import FastAPI
+
+from ..config import settings
+from ..ondemand import RateLimiter
+from .routes import router
+
+
+def create_app(sentry) -> FastAPI:
+    """
+    Build the FastAPI app for a running ``LinkAceSentry``.
+
+    Handlers reach the service through ``request.app.state.sentry`` and use
+    its pooled clients, cache and metrics instead of creating their own.
+    """
+    app = FastAPI(title="LinkAce Sentry", docs_url=None, redoc_url=None)
+    app.state.sentry = sentry
+    app.state.check_limiter = RateLimiter(settings.CHECK_RATE_PER_MIN / 60, settings.CHECK_RATE_BURST)
+    app.include_router(router)
+    return app
+
+
+def create_server(sentry, host: str = None, port: int = None) -> uvicorn.Server:
+    """
+    Build a uvicorn server for the control plane.
+
+    ``await server.serve()`` runs it on the current event loop next to the
+    scheduler; set ``server.should_exit`` to stop it.
+    """
+    config = uvicorn.Config(
+        create_app(sentry),
+        host=host or settings.HTTP_HOST,
+        port=port or settings.HTTP_PORT,
+        lifespan="off",
+        access_log=False,
+        log_level="warning",
+    )
+    return uvicorn.Server(config)
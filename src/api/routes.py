@@ -1,23 +1,221 @@
-from fastapi import APIRouter, HTTPException
-from services.bookmark_checker import check_bookmarks
-from services.linkace_client import list_bookmarks
+import asyncio
+import hashlib
+import json
+import secrets
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST
+from pydantic import BaseModel, ConfigDict, Field
+from src import metrics as prometheus
+from src.config import settings
+from src.ondemand import bulk_check, is_http_url, ndjson_lines
 
 router = APIRouter()
 
+
+def get_sentry(request: Request):
+    return request.app.state.sentry
+
+
+def require_admin(request: Request):
+    """Reject requests without ``Authorization: Bearer <ADMIN_TOKEN>``."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+def get_job(job_id: str, sentry=Depends(get_sentry)):
+    job = sentry.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job")
+    return job
+
+
+def sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def progress_events(job):
+    """Yield a progress event whenever the job changes, then a final done event."""
+    sent = None
+    while not job.done:
+        if job.version != sent:
+            sent = job.version
+            yield sse("progress", job.to_dict())
+        else:
+            yield ": keepalive\n\n"
+        await asyncio.sleep(settings.PROGRESS_INTERVAL_S)
+    yield sse("done", job.to_dict())
+
+
+class ConfigUpdate(BaseModel):
+    """Body of ``PATCH /config``; omitted fields keep their value."""
+    model_config = ConfigDict(extra="forbid")
+
+    CONCURRENCY: Optional[int] = Field(None, ge=1)
+    HOST_CONCURRENCY: Optional[int] = Field(None, ge=0)
+    request_timeout_s: Optional[int] = Field(None, ge=1)
+    CHECK_DEADLINE_S: Optional[float] = Field(None, gt=0)
+    CHECK_INTERVAL_MIN: Optional[int] = Field(None, ge=1)
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    Streaming response that may be produced while the request body is still
+    being read.
+
+    ``StreamingResponse`` watches ``receive()`` for a disconnect while it
+    streams, which would swallow request body chunks; here a disconnect
+    surfaces through ``request.stream()`` instead.
+    """
+
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+
+
 @router.get("/healthz")
-async def health_check():
-    return {"status": "healthy"}
+async def health_check(sentry=Depends(get_sentry)):
+    health = sentry.health()
+    return JSONResponse(health, status_code=200 if health["status"] == "healthy" else 503)
 
 @router.get("/metrics")
 async def metrics():
-    # Placeholder for metrics endpoint
-    return {"metrics": "not implemented"}
-
-@router.post("/run-once")
-async def run_once():
-    try:
-        bookmarks = await list_bookmarks()
-        dead_links = await check_bookmarks(bookmarks)
-        return {"dead_links": dead_links}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+    return Response(content=prometheus.render(), media_type=CONTENT_TYPE_LATEST)
+
+@router.post("/run-once", dependencies=[Depends(require_admin)])
+async def run_once(sentry=Depends(get_sentry)):
+    """Start a check cycle in the background, or join the one already running."""
+    job, started = sentry.trigger_cycle()
+    body = {**job.to_dict(), "joined": not started, "events": f"/jobs/{job.id}/events"}
+    return JSONResponse(body, status_code=202 if started else 200)
+
+@router.get("/check", dependencies=[Depends(require_admin)])
+async def check(request: Request, url: str = Query(..., max_length=2048), sentry=Depends(get_sentry)):
+    """Check one URL now, or return a result younger than ``CHECK_CACHE_TTL_S``."""
+    client = request.client.host if request.client else "unknown"
+    wait = request.app.state.check_limiter.acquire(client)
+    if wait:
+        raise HTTPException(
+            status_code=429,
+            detail="Rate limit exceeded",
+            headers={"Retry-After": str(max(1, round(wait)))}
+        )
+    if not is_http_url(url):
+        raise HTTPException(status_code=422, detail="url must be an absolute http(s) URL")
+
+    result, checked_at, cached = await sentry.ondemand.check(url)
+    return {"url": url, **result._asdict(), "checked_at": checked_at, "cached": cached}
+
+@router.post("/check/bulk", dependencies=[Depends(require_admin)])
+async def check_bulk(request: Request, sentry=Depends(get_sentry)):
+    """
+    Check an NDJSON stream of URLs, streaming NDJSON results as checks complete.
+
+    Input is only read as fast as checks finish, so clients sending large
+    inputs must read the response while they are still uploading.
+    """
+    async def results():
+        async for result in bulk_check(sentry.checker, ndjson_lines(request.stream()), settings.BULK_CONCURRENCY):
+            yield json.dumps(result) + "\n"
+    return DuplexStreamingResponse(results(), media_type="application/x-ndjson")
+
+def iso_utc(value: Optional[datetime]) -> Optional[str]:
+    """Query bound in the format the cache stores check times in (naive means UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def conditional_json(request: Request, body) -> Response:
+    """
+    JSON response with an ETag taken from its content.
+
+    The tag only changes when the returned data does, so writes to other
+    bookmarks during a cycle still let clients revalidate with 304. The
+    body is built either way; a 304 saves the transfer, not the query.
+    """
+    content = json.dumps(body).encode()
+    etag = f'W/"{hashlib.blake2b(content, digest_size=12).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag in (tag.strip() for tag in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content, media_type="application/json", headers=headers)
+
+
+@router.get("/bookmarks", dependencies=[Depends(require_admin)])
+async def list_bookmark_status(
+    request: Request,
+    status: Optional[str] = None,
+    min_failures: Optional[int] = Query(None, ge=0),
+    host: Optional[str] = None,
+    checked_after: Optional[datetime] = None,
+    checked_before: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    sentry=Depends(get_sentry)
+):
+    """
+    Cached bookmark status filtered by status, failure count, host and check
+    time, ordered by ID as text ("10" before "9"). Pass ``next_cursor`` back
+    as ``cursor`` for the next page. A page whose content has not changed is
+    answered with 304 when its ETag is sent in If-None-Match.
+    """
+    records = sentry.cache.query(
+        status=status,
+        min_failures=min_failures,
+        host=host,
+        checked_after=iso_utc(checked_after),
+        checked_before=iso_utc(checked_before),
+        after_id=cursor,
+        limit=limit
+    )
+    body = {
+        "items": [record._asdict() for record in records],
+        "next_cursor": records[-1].id if len(records) == limit else None,
+    }
+    return conditional_json(request, body)
+
+@router.get("/bookmarks/{bookmark_id}", dependencies=[Depends(require_admin)])
+async def bookmark_status(bookmark_id: str, request: Request, sentry=Depends(get_sentry)):
+    record = sentry.cache.get_record(bookmark_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Bookmark not in cache")
+    return conditional_json(request, record._asdict())
+
+@router.get("/profile", dependencies=[Depends(require_admin)])
+async def profile_status(sentry=Depends(get_sentry)):
+    return sentry.profiler.status()
+
+@router.post("/profile", dependencies=[Depends(require_admin)], status_code=202)
+async def profile_cycles(cycles: int = Query(1, ge=1, le=100), sentry=Depends(get_sentry)):
+    """Profile the next ``cycles`` check cycles."""
+    sentry.profiler.arm(cycles)
+    return sentry.profiler.status()
+
+@router.get("/config", dependencies=[Depends(require_admin)])
+async def config(sentry=Depends(get_sentry)):
+    return sentry.runtime_config()
+
+@router.patch("/config", dependencies=[Depends(require_admin)])
+async def update_config(update: ConfigUpdate, sentry=Depends(get_sentry)):
+    """Change concurrency, per-host cap, check timeouts or interval without a restart."""
+    changed = sentry.reconfigure(**update.model_dump(exclude_none=True))
+    return {"changed": changed, "config": sentry.runtime_config()}
+
+@router.get("/jobs/{job_id}")
+async def job_status(job=Depends(get_job)):
+    return job.to_dict()
+
+@router.get("/jobs/{job_id}/events")
+async def job_events(job=Depends(get_job)):
+    """Server-Sent Events stream of the job's progress."""
+    return StreamingResponse(
+        progress_events(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,131 @@
+"""Adaptive check concurrency (additive increase, multiplicative decrease).
+
+``AIMDController`` watches check outcomes in windows of ``window``
+completed checks. After each window it adjusts the limit of the cycle's
+``ResizableSemaphore``:
+
+- cut it by ``decrease`` when the timeout/connection error rate or the
+  event loop lag (fed in by the loop monitor) in that window crossed its
+  threshold
+- raise it by ``increase`` when throughput held up or improved and
+  bookmarks were queued for a slot, i.e. the limit was what held them back
+- otherwise keep it
+
+Timeouts caused by overload would otherwise be reported as dead links,
+so the controller backs off faster than it probes upward.
+"""
+
+import logging
+import time
+from typing import Optional
+
+from . import metrics
+from .limits import ResizableSemaphore
+
+logger = logging.getLogger(__name__)
+
+# Check results that indicate overload rather than a dead link
+_OVERLOAD_RESULTS = ("timeout", "error")
+
+
+class AIMDController:
+    def __init__(
+        self,
+        semaphore: ResizableSemaphore,
+        min_limit: int = 2,
+        max_limit: int = 100,
+        window: int = 50,
+        increase: int = 1,
+        decrease: float = 0.5,
+        max_error_rate: float = 0.1,
+        max_lag_s: float = 0.2,
+        tolerance: float = 0.05
+    ):
+        """
+        Tune ``semaphore``'s limit from check outcomes and event loop lag.
+
+        Args:
+            semaphore: Limit being tuned; its current limit is the starting point
+            min_limit: Lowest limit the controller sets
+            max_limit: Highest limit the controller sets
+            window: Completed checks per adjustment
+            increase: Added to the limit when probing upward
+            decrease: Factor applied to the limit when backing off
+            max_error_rate: Fraction of timeouts and connection errors that triggers a back-off
+            max_lag_s: Event loop lag that triggers a back-off
+            tolerance: Relative throughput drop still counted as holding up
+        """
+        self.semaphore = semaphore
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.window = window
+        self.increase = increase
+        self.decrease = decrease
+        self.max_error_rate = max_error_rate
+        self.max_lag_s = max_lag_s
+        self.tolerance = tolerance
+        self.reset(int(semaphore.limit))
+
+    @property
+    def limit(self) -> int:
+        return int(self.semaphore.limit)
+
+    def reset(self, limit: int) -> None:
+        """Start over from ``limit``, e.g. after ``CONCURRENCY`` was set by hand."""
+        self._set_limit(limit)
+        self._best_throughput = 0.0
+        self._start_window(time.monotonic())
+
+    def _start_window(self, now: float) -> None:
+        self._window_started = now
+        self._checks = 0
+        self._overloaded = 0
+        self._saturated = False
+        self._max_lag = 0.0
+
+    def _set_limit(self, limit: int) -> None:
+        limit = max(self.min_limit, min(self.max_limit, limit))
+        self.semaphore.resize(limit)
+        metrics.CONCURRENCY_LIMIT.set(limit)
+
+    def observe_lag(self, lag_s: float) -> None:
+        """Take one event loop lag sample, e.g. from ``LoopMonitor``."""
+        self._max_lag = max(self._max_lag, lag_s)
+
+    def record(self, result_class: str, now: Optional[float] = None) -> None:
+        """Count one finished check, by ``metrics.classify`` result class."""
+        self._checks += 1
+        if result_class in _OVERLOAD_RESULTS:
+            self._overloaded += 1
+        if self.semaphore.waiting:
+            self._saturated = True
+        if self._checks >= self.window:
+            self._adjust(time.monotonic() if now is None else now)
+
+    def _adjust(self, now: float) -> None:
+        elapsed = max(now - self._window_started, 1e-6)
+        throughput = self._checks / elapsed
+        error_rate = self._overloaded / self._checks
+        limit = self.limit
+
+        if error_rate > self.max_error_rate or self._max_lag > self.max_lag_s:
+            new_limit = int(limit * self.decrease)
+            direction = "down"
+            # Throughput seen at the higher limit no longer applies
+            self._best_throughput = 0.0
+        elif self._saturated and throughput >= self._best_throughput * (1 - self.tolerance):
+            new_limit = limit + self.increase
+            direction = "up"
+        else:
+            new_limit = limit
+            direction = "hold"
+        self._best_throughput = max(self._best_throughput, throughput)
+
+        self._set_limit(new_limit)
+        if self.limit != limit:
+            metrics.CONCURRENCY_ADJUSTMENTS.labels(direction).inc()
+            logger.info(
+                "Concurrency %s: %d -> %d (%.1f checks/s, %.0f%% timeouts/errors, max loop lag %.3fs)",
+                direction, limit, self.limit, throughput, 100 * error_rate, self._max_lag
+            )
+        self._start_window(now)
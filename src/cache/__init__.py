@@ -0,0 +1,38 @@
+"""Bookmark status cache backends."""
+
+from typing import Optional
+
+from .base import CacheBackend
+from .memory import MemoryCache
+from .sqlite import SQLiteCache, retry_on_locked
+from .log import LogCache
+
+# Historical name; the SQLite backend is the default.
+Cache = SQLiteCache
+
+BACKENDS = {
+    "memory": MemoryCache,
+    "sqlite": SQLiteCache,
+    "log": LogCache,
+}
+
+
+def create_cache(backend: Optional[str] = None, path: Optional[str] = None) -> CacheBackend:
+    """Build the cache backend selected by ``CACHE_BACKEND``."""
+    from ..config import settings
+
+    backend = (backend or settings.CACHE_BACKEND).lower()
+    path = path or settings.cache_db_path
+    if backend == "memory":
+        return MemoryCache()
+    if backend == "sqlite":
+        return SQLiteCache(path)
+    if backend == "log":
+        return LogCache(path, snapshot_every=settings.CACHE_SNAPSHOT_EVERY)
+    raise ValueError(f"Unknown cache backend: {backend!r} (expected one of {sorted(BACKENDS)})")
+
+
+__all__ = [
+    'CacheBackend', 'MemoryCache', 'SQLiteCache', 'LogCache',
+    'Cache', 'create_cache', 'retry_on_locked',
+]
@@ -0,0 +1,284 @@
+"""Common interface for bookmark status cache backends."""
+
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+# (last_status, consecutive_failures, last_final_url)
+StatusRow = Tuple[str, int, Optional[str]]
+# (last_status, consecutive_failures, checked_at) of one bookmark
+CheckState = Tuple[str, int, str]
+# (entry id, payload, attempts so far)
+OutboxEntry = Tuple[int, Dict[str, Any], int]
+# (url, location, status code, expires_at as a Unix timestamp)
+RedirectRow = Tuple[str, str, int, float]
+
+
+class StatusRecord(NamedTuple):
+    """Full cached state of one bookmark, as returned by ``CacheBackend.query``."""
+    id: str
+    status: str
+    consecutive_failures: int
+    final_url: Optional[str]
+    url: Optional[str]
+    host: Optional[str]
+    checked_at: str  # ISO 8601, UTC
+    failing_since: Optional[str]  # ISO 8601, UTC; set while the bookmark is dead
+
+
+def host_of(url: Optional[str]) -> Optional[str]:
+    """Lower-cased host name of ``url``, used for host filtering."""
+    if not url:
+        return None
+    try:
+        return urlsplit(url).hostname
+    except ValueError:
+        return None
+
+
+def next_failure_count(previous: Optional[StatusRow], status: str) -> int:
+    """Compute the consecutive failure counter after recording ``status``."""
+    if status != "dead":
+        return 0
+    if previous and previous[0] == "dead":
+        return previous[1] + 1
+    return 1
+
+
+def utcnow() -> datetime:
+    """Timezone-aware current time used for ``updated_at`` stamps."""
+    return datetime.now(timezone.utc)
+
+
+def cutoff(days: int) -> datetime:
+    """Oldest ``updated_at`` that survives ``cleanup_old_entries(days)``."""
+    return utcnow() - timedelta(days=days)
+
+
+def next_failing_since(previous: Optional[StatusRecord], status: str, now: str) -> Optional[str]:
+    """Start of the current dead streak after recording ``status`` at ``now``."""
+    if status != "dead":
+        return None
+    if previous is not None and previous.status == "dead":
+        return previous.failing_since or now
+    return now
+
+
+def filter_records(
+    records: Iterable[StatusRecord],
+    status: Optional[str] = None,
+    min_failures: Optional[int] = None,
+    host: Optional[str] = None,
+    checked_after: Optional[str] = None,
+    checked_before: Optional[str] = None,
+    after_id: Optional[str] = None,
+    limit: int = 100
+) -> List[StatusRecord]:
+    """Apply ``CacheBackend.query`` filters to records held in memory."""
+    host = host.lower() if host else None
+    matches = [
+        record for record in records
+        if (status is None or record.status == status)
+        and (min_failures is None or record.consecutive_failures >= min_failures)
+        and (host is None or record.host == host)
+        and (checked_after is None or record.checked_at >= checked_after)
+        and (checked_before is None or record.checked_at < checked_before)
+        and (after_id is None or record.id > after_id)
+    ]
+    matches.sort(key=lambda record: record.id)
+    return matches[:limit]
+
+
+class CacheBackend(ABC):
+    """Abstract bookmark status cache.
+
+    Backends only need to implement raw storage; failure counting and the
+    derived helpers (``should_mark_dead``, ``get_final_url``) live here so
+    every backend behaves identically.
+
+    The notification outbox and its dead letters default to an in-process
+    implementation that does not survive a restart; backends with a transactional store
+    (SQLite) override it so a status change and its notification are
+    committed together. Cached redirect hops (see ``src.redirects``) and
+    cycle checkpoints follow the same scheme.
+    """
+
+    def __init__(self):
+        # entry id -> [payload, attempts, next_attempt_at]
+        self._outbox: Dict[int, list] = {}
+        self._outbox_seq = 0
+        # entry id -> [payload, attempts, error] of undeliverable notifications
+        self._dead_letters: Dict[int, list] = {}
+        # url -> (location, status, expires_at)
+        self._redirects: Dict[str, Tuple[str, int, float]] = {}
+        self._checkpoints: Dict[str, Dict[str, Any]] = {}
+
+    @abstractmethod
+    def get_status(self, bookmark_id: str) -> Optional[StatusRow]:
+        """Get bookmark status from cache."""
+
+    @abstractmethod
+    def update_status(
+        self,
+        bookmark_id: str,
+        status: str,
+        final_url: Optional[str] = None,
+        notification: Optional[Dict[str, Any]] = None,
+        url: Optional[str] = None
+    ) -> None:
+        """Update bookmark status in cache, queueing ``notification`` in the outbox with it.
+
+        ``url`` is the bookmark's own URL; it is stored (with its host) for
+        ``query`` and kept from earlier updates when omitted.
+        """
+
+    @abstractmethod
+    def get_record(self, bookmark_id: str) -> Optional[StatusRecord]:
+        """Full cached state of one bookmark."""
+
+    @abstractmethod
+    def query(
+        self,
+        status: Optional[str] = None,
+        min_failures: Optional[int] = None,
+        host: Optional[str] = None,
+        checked_after: Optional[str] = None,
+        checked_before: Optional[str] = None,
+        after_id: Optional[str] = None,
+        limit: int = 100
+    ) -> List[StatusRecord]:
+        """Cached bookmarks matching every given filter, ordered by ID.
+
+        IDs are compared as text ("10" sorts before "9"), which keeps the
+        keyset cursor on the primary key index. The order is stable, so
+        paging still visits every bookmark exactly once.
+
+        Args:
+            status: Only bookmarks whose last status is this
+            min_failures: Only bookmarks with at least this many consecutive failures
+            host: Only bookmarks on this host
+            checked_after: Only bookmarks checked at or after this ISO 8601 UTC time
+            checked_before: Only bookmarks checked before this ISO 8601 UTC time
+            after_id: Keyset pagination cursor: only IDs greater than this
+            limit: Maximum number of records returned
+        """
+
+    @abstractmethod
+    def check_states(self) -> Dict[str, CheckState]:
+        """Status, failure count and check time of every cached bookmark, in one pass.
+
+        Safe to call from a worker thread while the event loop keeps
+        writing, so large collections can be read off the loop.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Clear all entries from the cache."""
+
+    @abstractmethod
+    def cleanup_old_entries(self, days: int = 30) -> None:
+        """Clean up entries older than specified days."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of cached bookmarks."""
+
+    def close(self) -> None:
+        """Release any files or connections held by the backend."""
+
+    def enqueue_notification(self, payload: Dict[str, Any]) -> None:
+        """Add a notification to the outbox."""
+        self._outbox_seq += 1
+        self._outbox[self._outbox_seq] = [payload, 0, 0.0]
+
+    def fetch_outbox(self, limit: int) -> List[OutboxEntry]:
+        """Return up to ``limit`` notifications that are due for (re)sending, oldest first."""
+        now = time.time()
+        due = []
+        for entry_id, (payload, attempts, next_attempt_at) in self._outbox.items():
+            if next_attempt_at <= now:
+                due.append((entry_id, payload, attempts))
+                if len(due) >= limit:
+                    break
+        return due
+
+    def ack_outbox(self, entry_ids: Iterable[int]) -> None:
+        """Remove delivered notifications from the outbox."""
+        for entry_id in entry_ids:
+            self._outbox.pop(entry_id, None)
+
+    def retry_outbox(self, retries: Iterable[Tuple[int, float]]) -> None:
+        """Count a failed attempt and defer each ``(entry id, next_attempt_at)`` pair."""
+        for entry_id, next_attempt_at in retries:
+            entry = self._outbox.get(entry_id)
+            if entry:
+                entry[1] += 1
+                entry[2] = next_attempt_at
+
+    def dead_letter_outbox(self, failures: Iterable[Tuple[int, str]]) -> None:
+        """Count a last failed attempt and move each ``(entry id, error)`` to the dead letters."""
+        for entry_id, error in failures:
+            entry = self._outbox.pop(entry_id, None)
+            if entry:
+                self._dead_letters[entry_id] = [entry[0], entry[1] + 1, error]
+
+    def outbox_size(self) -> int:
+        """Number of undelivered notifications."""
+        return len(self._outbox)
+
+    def dead_letter_size(self) -> int:
+        """Number of notifications given up on."""
+        return len(self._dead_letters)
+
+    def put_redirect(self, url: str, location: str, status: int, expires_at: float) -> None:
+        """Store one redirect hop until ``expires_at``."""
+        self._redirects[url] = (location, status, expires_at)
+
+    def delete_redirects(self, urls: Iterable[str]) -> None:
+        """Forget the redirect hops starting at ``urls``."""
+        for url in urls:
+            self._redirects.pop(url, None)
+
+    def load_redirects(self, limit: int) -> List[RedirectRow]:
+        """Drop expired redirect hops and return up to ``limit`` of the rest, longest-lived first."""
+        now = time.time()
+        self._redirects = {url: hop for url, hop in self._redirects.items() if hop[2] > now}
+        rows = [(url, *hop) for url, hop in self._redirects.items()]
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows[:limit]
+
+    def get_checkpoint(self, name: str) -> Optional[Dict[str, Any]]:
+        """Last value saved with ``save_checkpoint(name, ...)``, if any."""
+        return self._checkpoints.get(name)
+
+    def save_checkpoint(self, name: str, value: Dict[str, Any]) -> None:
+        """Store a JSON-serializable progress marker under ``name``, replacing the previous one."""
+        self._checkpoints[name] = value
+
+    def clear_checkpoint(self, name: str) -> None:
+        """Forget the checkpoint ``name``."""
+        self._checkpoints.pop(name, None)
+
+    def should_mark_dead(self, bookmark_id: str) -> bool:
+        """Check if bookmark should be marked as dead (2+ consecutive failures)."""
+        status = self.get_status(bookmark_id)
+        if not status:
+            return False
+
+        _, consecutive_failures, _ = status
+        return consecutive_failures >= 2
+
+    def get_final_url(self, bookmark_id: str) -> Optional[str]:
+        """Get the final URL for a bookmark after redirection."""
+        status = self.get_status(bookmark_id)
+        if not status:
+            return None
+        return status[2]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
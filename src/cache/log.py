@@ -0,0 +1,215 @@
+"""Append-only log-structured cache backend with periodic snapshots."""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .base import (
+    CacheBackend, CheckState, StatusRecord, StatusRow, cutoff, filter_records, host_of,
+    next_failing_since, next_failure_count, utcnow,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class LogCache(CacheBackend):
+    """Cache that keeps state in memory and persists it as an append-only log.
+
+    Every update appends one JSON line to ``<path>.log``. After
+    ``snapshot_every`` appended records the log is moved aside to
+    ``<path>.log.1`` and a new one is started; the full state is then
+    written to ``<path>.snapshot`` (atomically, via rename) on a worker
+    thread and the old log is deleted. Startup replays the snapshot and
+    both logs, so a crash at any point loses nothing that was flushed.
+    The notification outbox is kept in memory only.
+    """
+
+    def __init__(self, path: str, snapshot_every: int = 100_000):
+        super().__init__()
+        self.path = Path(path)
+        self.snapshot_path = self.path.with_name(self.path.name + ".snapshot")
+        self.log_path = self.path.with_name(self.path.name + ".log")
+        self.rotated_path = self.path.with_name(self.path.name + ".log.1")
+        self.snapshot_every = snapshot_every
+        self._rows: Dict[str, StatusRecord] = {}
+        self._pending = 0
+        # Held while a snapshot is written, possibly by a worker thread
+        self._snapshot_lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        corrupt = self._load()
+        self._log = open(self.log_path, "a", encoding="utf-8")
+        if corrupt or self.rotated_path.exists():
+            # Appending behind a corrupt line would tear the next record
+            # too; start over from a clean snapshot instead
+            self.snapshot()
+
+    def _load(self) -> bool:
+        """Rebuild in-memory state from the snapshot plus the logs; returns whether a log was corrupt."""
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                for line in f:
+                    record = self._decode(line)
+                    self._rows[record.id] = record
+
+        corrupt = False
+        for log_path in (self.rotated_path, self.log_path):
+            if not log_path.exists():
+                continue
+            with open(log_path, encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    try:
+                        record = self._decode(line)
+                    except (ValueError, TypeError):
+                        # A torn line from a crash mid-write
+                        logger.warning("Skipping corrupt cache log record in %s", log_path)
+                        corrupt = True
+                        continue
+                    self._rows[record.id] = record
+                    self._pending += 1
+        return corrupt
+
+    @staticmethod
+    def _decode(line: str) -> StatusRecord:
+        fields = json.loads(line)
+        # Records written before url/host/failing_since were stored have 5 fields
+        return StatusRecord(*fields, *[None] * (len(StatusRecord._fields) - len(fields)))
+
+    def _append(self, record: StatusRecord) -> None:
+        self._log.write(json.dumps(record) + "\n")
+        self._log.flush()
+        self._pending += 1
+        if self._pending >= self.snapshot_every and self._snapshot_lock.acquire(blocking=False):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            try:
+                records = self._rotate()
+            except BaseException:
+                self._snapshot_lock.release()
+                raise
+            if loop is None:
+                self._write_snapshot(records)
+            else:
+                # Writing the full state takes a while; keep it off the event loop
+                loop.run_in_executor(None, self._write_snapshot, records)
+
+    def _rotate(self) -> List[StatusRecord]:
+        """Move the log aside, start a new one and return the state the old one ends at."""
+        self._log.close()
+        if self.rotated_path.exists():
+            # Left behind by a failed snapshot; keep its records until one succeeds
+            with open(self.log_path, "rb") as src, open(self.rotated_path, "ab") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(self.log_path)
+        else:
+            os.replace(self.log_path, self.rotated_path)
+        self._log = open(self.log_path, "a", encoding="utf-8")
+        self._pending = 0
+        return list(self._rows.values())
+
+    def _write_snapshot(self, records: List[StatusRecord]) -> None:
+        """Write ``records`` as the snapshot and drop the rotated log; releases the snapshot lock."""
+        try:
+            tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            self.rotated_path.unlink()
+        except Exception as e:
+            # The rotated log is kept and replayed on the next start
+            logger.error("Cache snapshot failed: %s", str(e))
+        finally:
+            self._snapshot_lock.release()
+
+    def snapshot(self) -> None:
+        """Write the full state to the snapshot file and truncate the log, waiting for it."""
+        self._snapshot_lock.acquire()
+        try:
+            records = self._rotate()
+        except BaseException:
+            self._snapshot_lock.release()
+            raise
+        self._write_snapshot(records)
+
+    def get_status(self, bookmark_id: str) -> Optional[StatusRow]:
+        """Get bookmark status from cache."""
+        row = self._rows.get(bookmark_id)
+        return row[1:4] if row else None
+
+    def get_record(self, bookmark_id: str) -> Optional[StatusRecord]:
+        """Full cached state of one bookmark."""
+        return self._rows.get(bookmark_id)
+
+    def update_status(
+        self,
+        bookmark_id: str,
+        status: str,
+        final_url: Optional[str] = None,
+        notification: Optional[Dict[str, Any]] = None,
+        url: Optional[str] = None
+    ) -> None:
+        """Update bookmark status in cache."""
+        if status is None:
+            raise ValueError("status cannot be None")
+
+        previous = self._rows.get(bookmark_id)
+        now = utcnow().isoformat()
+        if url is None and previous is not None:
+            url = previous.url
+        record = StatusRecord(
+            bookmark_id,
+            status,
+            next_failure_count(previous[1:4] if previous else None, status),
+            final_url,
+            url,
+            host_of(url),
+            now,
+            next_failing_since(previous, status, now),
+        )
+        self._rows[bookmark_id] = record
+        self._append(record)
+        if notification is not None:
+            self.enqueue_notification(notification)
+
+    def clear(self) -> None:
+        """Clear all entries from the cache."""
+        self._rows.clear()
+        self.snapshot()
+
+    def check_states(self) -> Dict[str, CheckState]:
+        """Status, failure count and check time of every cached bookmark, in one pass."""
+        # list() copies the rows in one step, so writes on the loop cannot
+        # change the dict while it is iterated
+        return {r.id: (r.status, r.consecutive_failures, r.checked_at) for r in list(self._rows.values())}
+
+    def query(self, **filters) -> List[StatusRecord]:
+        """Cached bookmarks matching every given filter, ordered by ID (full scan)."""
+        return filter_records(self._rows.values(), **filters)
+
+    def cleanup_old_entries(self, days: int = 30) -> None:
+        """Clean up entries older than specified days."""
+        oldest = cutoff(days).isoformat()
+        self._rows = {k: v for k, v in self._rows.items() if v.checked_at >= oldest}
+        self.snapshot()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def close(self) -> None:
+        """Wait for a running snapshot, then flush and close the log file."""
+        with self._snapshot_lock:
+            pass
+        if not self._log.closed:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._log.close()
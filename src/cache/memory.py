@@ -0,0 +1,80 @@
+"""In-process dict cache backend."""
+
+from typing import Any, Dict, List, Optional
+
+from .base import (
+    CacheBackend, CheckState, StatusRecord, StatusRow, cutoff, filter_records, host_of,
+    next_failing_since, next_failure_count, utcnow,
+)
+
+
+class MemoryCache(CacheBackend):
+    """Non-persistent cache kept in a plain dict.
+
+    Fastest option and the right choice for tests and one-shot runs; all
+    state is lost when the process exits.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._rows: Dict[str, StatusRecord] = {}
+
+    def get_status(self, bookmark_id: str) -> Optional[StatusRow]:
+        """Get bookmark status from cache."""
+        row = self._rows.get(bookmark_id)
+        return row[1:4] if row else None
+
+    def get_record(self, bookmark_id: str) -> Optional[StatusRecord]:
+        """Full cached state of one bookmark."""
+        return self._rows.get(bookmark_id)
+
+    def update_status(
+        self,
+        bookmark_id: str,
+        status: str,
+        final_url: Optional[str] = None,
+        notification: Optional[Dict[str, Any]] = None,
+        url: Optional[str] = None
+    ) -> None:
+        """Update bookmark status in cache."""
+        if status is None:
+            raise ValueError("status cannot be None")
+
+        previous = self._rows.get(bookmark_id)
+        now = utcnow().isoformat()
+        if url is None and previous is not None:
+            url = previous.url
+        self._rows[bookmark_id] = StatusRecord(
+            bookmark_id,
+            status,
+            next_failure_count(previous[1:4] if previous else None, status),
+            final_url,
+            url,
+            host_of(url),
+            now,
+            next_failing_since(previous, status, now),
+        )
+        if notification is not None:
+            self.enqueue_notification(notification)
+
+    def check_states(self) -> Dict[str, CheckState]:
+        """Status, failure count and check time of every cached bookmark, in one pass."""
+        # list() copies the rows in one step, so writes on the loop cannot
+        # change the dict while it is iterated
+        return {r.id: (r.status, r.consecutive_failures, r.checked_at) for r in list(self._rows.values())}
+
+    def query(self, **filters) -> List[StatusRecord]:
+        """Cached bookmarks matching every given filter, ordered by ID (full scan)."""
+        return filter_records(self._rows.values(), **filters)
+
+    def clear(self) -> None:
+        """Clear all entries from the cache."""
+        self._rows.clear()
+
+    def cleanup_old_entries(self, days: int = 30) -> None:
+        """Clean up entries older than specified days."""
+        oldest = cutoff(days).isoformat()
+        self._rows = {k: v for k, v in self._rows.items() if v.checked_at >= oldest}
+
+    def __len__(self) -> int:
+        return len(self._rows)
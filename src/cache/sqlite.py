@@ -0,0 +1,376 @@
+"""SQLite cache for bookmark status tracking."""
+
+import json
+import sqlite3
+import logging
+import time
+from functools import wraps
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+
+from .base import CacheBackend, CheckState, OutboxEntry, RedirectRow, StatusRecord, StatusRow, cutoff, host_of, utcnow
+
+logger = logging.getLogger(__name__)
+
+# Columns added after the first release, migrated with ALTER TABLE
+_ADDED_COLUMNS = {
+    "url": "TEXT",
+    "host": "TEXT",
+    "failing_since": "TEXT",
+}
+
+_RECORD_COLUMNS = """
+    id, last_status, consecutive_failures, last_final_url, url, host, updated_at, failing_since
+"""
+
+def retry_on_locked(func: Any) -> Any:
+    """Retry function on database locked error."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        max_retries = 5
+        for i in range(max_retries):
+            try:
+                return func(*args, **kwargs)
+            except sqlite3.OperationalError as e:
+                if "database is locked" in str(e) and i < max_retries - 1:
+                    logger.warning("Database locked, retrying... (%d/%d)", i + 1, max_retries)
+                    continue
+                raise
+    return wrapper
+
+
+class SQLiteCache(CacheBackend):
+    """SQLite cache for bookmark status tracking.
+
+    A single connection is kept open for the lifetime of the cache, so file
+    databases and ``:memory:`` share the same code path. File databases run
+    in WAL mode so readers never block the writer. Notifications are kept
+    in an ``outbox`` table written in the same transaction as the status
+    change they describe; those that keep failing are moved to
+    ``outbox_dead``. ``query`` filters are served from indexes on
+    status, host, failure count and check time. Redirect hops and cycle
+    checkpoints have tables of their own so they survive restarts.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        super().__init__()
+        if db_path is None:
+            from ..config import settings
+            db_path = settings.cache_db_path
+        self.db_path = db_path
+        self._ensure_db_dir()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._configure(self._conn)
+        self._create_schema(self._conn)
+
+    def _ensure_db_dir(self):
+        """Ensure database directory exists."""
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    def _configure(self, conn):
+        """Apply connection pragmas."""
+        if self.db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            # WAL keeps the database consistent with NORMAL; only the last
+            # transactions before a power loss can be lost.
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+
+    def _create_schema(self, conn):
+        """Create database schema."""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS bookmarks (
+                id TEXT PRIMARY KEY,
+                last_status TEXT NOT NULL,
+                consecutive_failures INTEGER NOT NULL DEFAULT 0,
+                last_final_url TEXT,
+                updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(bookmarks)")}
+        for column, column_type in _ADDED_COLUMNS.items():
+            if column not in existing:
+                conn.execute(f"ALTER TABLE bookmarks ADD COLUMN {column} {column_type}")
+        conn.execute("CREATE INDEX IF NOT EXISTS bookmarks_status ON bookmarks (last_status, id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS bookmarks_host ON bookmarks (host, id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS bookmarks_failures ON bookmarks (consecutive_failures)")
+        conn.execute("CREATE INDEX IF NOT EXISTS bookmarks_checked ON bookmarks (updated_at)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS outbox_due ON outbox (next_attempt_at, id)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS outbox_dead (
+                id INTEGER PRIMARY KEY,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                error TEXT,
+                created_at TIMESTAMP NOT NULL,
+                failed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS redirects (
+                url TEXT PRIMARY KEY,
+                location TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS redirects_expiry ON redirects (expires_at)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.commit()
+
+    @retry_on_locked
+    def get_status(self, bookmark_id: str) -> Optional[StatusRow]:
+        """Get bookmark status from cache."""
+        cursor = self._conn.execute("""
+            SELECT last_status, consecutive_failures, last_final_url
+            FROM bookmarks WHERE id = ?
+        """, (bookmark_id,))
+        row = cursor.fetchone()
+        return row if row else None
+
+    @retry_on_locked
+    def get_record(self, bookmark_id: str) -> Optional[StatusRecord]:
+        """Full cached state of one bookmark."""
+        row = self._conn.execute(
+            f"SELECT {_RECORD_COLUMNS} FROM bookmarks WHERE id = ?", (bookmark_id,)
+        ).fetchone()
+        return StatusRecord(*row) if row else None
+
+    @retry_on_locked
+    def check_states(self) -> Dict[str, CheckState]:
+        """Status, failure count and check time of every cached bookmark, in one pass."""
+        sql = "SELECT id, last_status, consecutive_failures, updated_at FROM bookmarks"
+        if self.db_path == ":memory:":
+            rows = self._conn.execute(sql).fetchall()
+        else:
+            # A connection of its own, so a read from a worker thread never
+            # shares a transaction with writes on the main connection
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows = conn.execute(sql).fetchall()
+            finally:
+                conn.close()
+        return {bookmark_id: (status, failures, checked_at) for bookmark_id, status, failures, checked_at in rows}
+
+    @retry_on_locked
+    def query(
+        self,
+        status: Optional[str] = None,
+        min_failures: Optional[int] = None,
+        host: Optional[str] = None,
+        checked_after: Optional[str] = None,
+        checked_before: Optional[str] = None,
+        after_id: Optional[str] = None,
+        limit: int = 100
+    ) -> List[StatusRecord]:
+        """Cached bookmarks matching every given filter, ordered by ID."""
+        clauses, params = [], []
+        for clause, value in (
+            ("last_status = ?", status),
+            ("consecutive_failures >= ?", min_failures),
+            ("host = ?", host.lower() if host else None),
+            ("updated_at >= ?", checked_after),
+            ("updated_at < ?", checked_before),
+            ("id > ?", after_id),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(
+            f"SELECT {_RECORD_COLUMNS} FROM bookmarks {where} ORDER BY id LIMIT ?",
+            (*params, limit)
+        ).fetchall()
+        return [StatusRecord(*row) for row in rows]
+
+    @retry_on_locked
+    def update_status(
+        self,
+        bookmark_id: str,
+        status: str,
+        final_url: Optional[str] = None,
+        notification: Optional[Dict[str, Any]] = None,
+        url: Optional[str] = None
+    ) -> None:
+        """Update bookmark status in cache, queueing ``notification`` in the outbox with it."""
+        if status is None:
+            raise ValueError("status cannot be None")
+
+        now = utcnow().isoformat()
+        # Failure counting happens inside the upsert so the update is a
+        # single statement instead of a read followed by a write.
+        with self._conn:
+            self._conn.execute("""
+                INSERT INTO bookmarks (
+                    id, last_status, consecutive_failures, last_final_url, updated_at,
+                    url, host, failing_since
+                ) VALUES (
+                    ?, ?, CASE WHEN ? = 'dead' THEN 1 ELSE 0 END, ?, ?,
+                    ?, ?, CASE WHEN ? = 'dead' THEN ? END
+                )
+                ON CONFLICT(id) DO UPDATE SET
+                    consecutive_failures = CASE
+                        WHEN excluded.last_status != 'dead' THEN 0
+                        WHEN bookmarks.last_status = 'dead'
+                            THEN bookmarks.consecutive_failures + 1
+                        ELSE 1
+                    END,
+                    failing_since = CASE
+                        WHEN excluded.last_status != 'dead' THEN NULL
+                        WHEN bookmarks.last_status = 'dead'
+                            THEN COALESCE(bookmarks.failing_since, excluded.failing_since)
+                        ELSE excluded.failing_since
+                    END,
+                    last_status = excluded.last_status,
+                    last_final_url = excluded.last_final_url,
+                    updated_at = excluded.updated_at,
+                    url = COALESCE(excluded.url, bookmarks.url),
+                    host = COALESCE(excluded.host, bookmarks.host)
+            """, (
+                bookmark_id,
+                status,
+                status,
+                final_url,
+                now,
+                url,
+                host_of(url),
+                status,
+                now
+            ))
+            if notification is not None:
+                self._insert_outbox(notification)
+
+    @retry_on_locked
+    def clear(self) -> None:
+        """Clear all entries from the cache."""
+        with self._conn:
+            self._conn.execute("DELETE FROM bookmarks")
+
+    @retry_on_locked
+    def cleanup_old_entries(self, days: int = 30) -> None:
+        """Clean up entries older than specified days."""
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM bookmarks WHERE updated_at < ?",
+                (cutoff(days).isoformat(),)
+            )
+
+    def _insert_outbox(self, payload: Dict[str, Any]) -> None:
+        self._conn.execute("INSERT INTO outbox (payload) VALUES (?)", (json.dumps(payload),))
+
+    @retry_on_locked
+    def enqueue_notification(self, payload: Dict[str, Any]) -> None:
+        """Add a notification to the outbox."""
+        with self._conn:
+            self._insert_outbox(payload)
+
+    @retry_on_locked
+    def fetch_outbox(self, limit: int) -> List[OutboxEntry]:
+        """Return up to ``limit`` notifications that are due for (re)sending, oldest first."""
+        rows = self._conn.execute("""
+            SELECT id, payload, attempts FROM outbox
+            WHERE next_attempt_at <= ? ORDER BY id LIMIT ?
+        """, (time.time(), limit)).fetchall()
+        return [(entry_id, json.loads(payload), attempts) for entry_id, payload, attempts in rows]
+
+    @retry_on_locked
+    def ack_outbox(self, entry_ids: Iterable[int]) -> None:
+        """Remove delivered notifications from the outbox."""
+        with self._conn:
+            self._conn.executemany("DELETE FROM outbox WHERE id = ?", ((i,) for i in entry_ids))
+
+    @retry_on_locked
+    def retry_outbox(self, retries: Iterable[Tuple[int, float]]) -> None:
+        """Count a failed attempt and defer each ``(entry id, next_attempt_at)`` pair."""
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE outbox SET attempts = attempts + 1, next_attempt_at = ? WHERE id = ?",
+                ((next_attempt_at, entry_id) for entry_id, next_attempt_at in retries)
+            )
+
+    @retry_on_locked
+    def dead_letter_outbox(self, failures: Iterable[Tuple[int, str]]) -> None:
+        """Count a last failed attempt and move each ``(entry id, error)`` to the dead letters."""
+        with self._conn:
+            for entry_id, error in failures:
+                self._conn.execute("""
+                    INSERT INTO outbox_dead (id, payload, attempts, error, created_at)
+                    SELECT id, payload, attempts + 1, ?, created_at FROM outbox WHERE id = ?
+                """, (error, entry_id))
+                self._conn.execute("DELETE FROM outbox WHERE id = ?", (entry_id,))
+
+    def outbox_size(self) -> int:
+        """Number of undelivered notifications."""
+        return self._conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def dead_letter_size(self) -> int:
+        """Number of notifications given up on."""
+        return self._conn.execute("SELECT COUNT(*) FROM outbox_dead").fetchone()[0]
+
+    @retry_on_locked
+    def put_redirect(self, url: str, location: str, status: int, expires_at: float) -> None:
+        """Store one redirect hop until ``expires_at``."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO redirects (url, location, status, expires_at) VALUES (?, ?, ?, ?)",
+                (url, location, status, expires_at)
+            )
+
+    @retry_on_locked
+    def delete_redirects(self, urls: Iterable[str]) -> None:
+        """Forget the redirect hops starting at ``urls``."""
+        with self._conn:
+            self._conn.executemany("DELETE FROM redirects WHERE url = ?", ((url,) for url in urls))
+
+    @retry_on_locked
+    def load_redirects(self, limit: int) -> List[RedirectRow]:
+        """Drop expired redirect hops and return up to ``limit`` of the rest, longest-lived first."""
+        with self._conn:
+            self._conn.execute("DELETE FROM redirects WHERE expires_at <= ?", (time.time(),))
+        return self._conn.execute(
+            "SELECT url, location, status, expires_at FROM redirects ORDER BY expires_at DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+
+    def get_checkpoint(self, name: str) -> Optional[Dict[str, Any]]:
+        """Last value saved with ``save_checkpoint(name, ...)``, if any."""
+        row = self._conn.execute("SELECT value FROM checkpoints WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    @retry_on_locked
+    def save_checkpoint(self, name: str, value: Dict[str, Any]) -> None:
+        """Store a JSON-serializable progress marker under ``name``, replacing the previous one."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (name, value) VALUES (?, ?)",
+                (name, json.dumps(value))
+            )
+
+    @retry_on_locked
+    def clear_checkpoint(self, name: str) -> None:
+        """Forget the checkpoint ``name``."""
+        with self._conn:
+            self._conn.execute("DELETE FROM checkpoints WHERE name = ?", (name,))
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM bookmarks").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
@@ -3,57 +3,97 @@
 import httpx
 import logging
 import asyncio
-from urllib.parse import urlparse
-from typing import Optional
+from urllib.parse import urljoin, urlparse
+from typing import List, Optional
 
+from . import metrics
+from .cache.base import CacheBackend
 from .config import settings
 from .models import CheckResult
+from .redirects import HopCache
 
 logger = logging.getLogger(__name__)
 
+_CACHED_HOPS = metrics.REDIRECT_HOPS.labels("cache")
+_FETCHED_HOPS = metrics.REDIRECT_HOPS.labels("request")
+
 
 class URLChecker:
     """Service for checking URL status."""
     
-    def __init__(self):
+    def __init__(self, max_connections: Optional[int] = None, hop_store: Optional[CacheBackend] = None):
         self.timeout = settings.request_timeout_s
+        # Wall-clock limit for a whole check; httpx timeouts apply per phase
+        self.deadline = settings.CHECK_DEADLINE_S
         self.max_redirects = settings.max_redirects
+        self.max_connections = max_connections or settings.CONCURRENCY
+        self._client: Optional[httpx.AsyncClient] = None
+        # Redirect hops seen by earlier checks, persisted through hop_store
+        self.hops = HopCache(
+            hop_store,
+            max_entries=settings.REDIRECT_CACHE_SIZE,
+            default_ttl=settings.REDIRECT_CACHE_TTL_S,
+            max_ttl=settings.REDIRECT_CACHE_MAX_TTL_S
+        )
     
-    async def check_url(self, url: str) -> CheckResult:
-        """Check URL status with HEAD request, fallback to GET."""
-        try:
-            async with httpx.AsyncClient(
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client shared by all checks, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
                 timeout=self.timeout,
-                follow_redirects=False  # Handle redirects manually
-            ) as client:
-                # Try HEAD first
-                try:
-                    response = await client.head(url)
-                    if response.status_code in [403, 405, 501]:
-                        # Fallback to GET for endpoints that don't support HEAD
-                        response = await client.get(url)
-                except httpx.HTTPError:
-                    # Any HTTP error, try GET
-                    response = await client.get(url)
-                
-                # Handle redirects
-                if 300 <= response.status_code < 400:
-                    return await self._handle_redirect(client, url, response)
-                
-                # Handle success/error
-                if response.status_code >= 400:
-                    return CheckResult(
-                        is_alive=False,
-                        status_code=response.status_code,
-                        error=f"HTTP {response.status_code}"
-                    )
-                
-                return CheckResult(
-                    is_alive=True,
-                    status_code=response.status_code,
-                    final_url=str(response.url)
+                follow_redirects=False,  # Handle redirects manually
+                # Callers bound concurrency themselves (cycle semaphore, bulk
+                # endpoint), so only the idle pool is capped here
+                limits=httpx.Limits(
+                    max_connections=None,
+                    max_keepalive_connections=self.max_connections
                 )
-                
+            )
+        return self._client
+    
+    def set_timeout(self, timeout: float) -> None:
+        """Change the request timeout; requests already sent keep the old one."""
+        self.timeout = timeout
+        if self._client is not None:
+            self._client.timeout = timeout
+    
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def check_url(self, url: str) -> CheckResult:
+        """
+        Check URL status with HEAD request, fallback to GET.
+        
+        Redirects are followed hop by hop the same way; hops found in the
+        hop cache are skipped without a request.
+        
+        The whole check, including fallbacks and redirect hops, is cancelled
+        once it runs longer than ``deadline`` seconds, so a server trickling
+        bytes cannot hold a concurrency slot indefinitely.
+        """
+        try:
+            return await asyncio.wait_for(self._check_url(url), self.deadline)
+        except asyncio.TimeoutError:
+            return CheckResult(
+                is_alive=False,
+                error=f"Check timeout: deadline of {self.deadline:g}s exceeded"
+            )
+    
+    async def _check_url(self, url: str) -> CheckResult:
+        try:
+            client = self.client
+            chain = self.hops.resolve(url, self.max_redirects)
+            result = await self._follow(client, url, chain)
+            if len(chain) > 1 and not result.is_alive:
+                # The cached hops may be stale; check once more without them
+                self.hops.discard(chain[:-1])
+                result = await self._follow(client, url, [url])
+            return result
+
         except httpx.TimeoutException:
             return CheckResult(
                 is_alive=False,
@@ -70,64 +110,87 @@ class URLChecker:
                 error=str(e)
             )
     
-    async def _handle_redirect(
-        self, 
-        client: httpx.AsyncClient,
-        original_url: str,
-        response: httpx.Response
-    ) -> CheckResult:
-        """Handle URL redirects."""
-        redirects = 0
-        current_url = original_url
+    async def _request(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """HEAD ``url``, falling back to a GET that stops after the response headers."""
+        try:
+            response = await client.head(url)
+            if response.status_code not in (403, 405, 501):
+                return response
+        except (httpx.TimeoutException, httpx.ConnectError):
+            # A GET would fail the same way
+            raise
+        except httpx.HTTPError:
+            pass
+        # Fallback to GET for endpoints that don't support HEAD; the body is
+        # never read
+        async with client.stream("GET", url) as response:
+            return response
+    
+    async def _follow(self, client: httpx.AsyncClient, original_url: str, chain: List[str]) -> CheckResult:
+        """
+        Request the end of ``chain`` and follow redirects from there.
         
-        while redirects < self.max_redirects:
-            if "location" not in response.headers:
+        Args:
+            client: HTTP client
+            original_url: URL being checked
+            chain: URLs already resolved from the hop cache, starting with ``original_url``
+        """
+        current_url = chain[-1]
+        hops = len(chain) - 1
+        _CACHED_HOPS.inc(hops)
+        response = await self._request(client, current_url)
+        
+        while 300 <= response.status_code < 400 and response.status_code != 304:
+            location = response.headers.get("location")
+            if not location:
                 return CheckResult(
                     is_alive=False,
                     status_code=response.status_code,
+                    final_url=current_url if hops else None,
                     error="Redirect without location header"
                 )
-            
-            # Get redirect location
-            location = response.headers["location"]
-            if location.startswith("/"):
-                # Relative to domain
-                parsed = urlparse(current_url)
-                location = f"{parsed.scheme}://{parsed.netloc}{location}"
-            elif not location.startswith("http"):
-                # Relative to path
-                base = "/".join(current_url.split("/")[:-1])
-                location = f"{base}/{location}"
-            
-            # Follow redirect
+            next_url = urljoin(current_url, location)
+            self.hops.put(current_url, next_url, response.status_code, response.headers)
+            # Continue from wherever the cache already knows the chain leads
+            chain = self.hops.resolve(next_url, self.max_redirects)
+            _FETCHED_HOPS.inc()
+            _CACHED_HOPS.inc(len(chain) - 1)
+            hops += len(chain)
+            current_url = chain[-1]
+            if hops > self.max_redirects:
+                return CheckResult(
+                    is_alive=False,
+                    error=f"Too many redirects (>{self.max_redirects})"
+                )
             try:
-                response = await client.get(location)
-                current_url = location
-                redirects += 1
-                
-                if response.status_code < 300 or response.status_code >= 400:
-                    break
-                    
+                response = await self._request(client, current_url)
             except Exception as e:
                 return CheckResult(
                     is_alive=False,
                     error=f"Redirect failed: {e}",
-                    final_url=location
+                    final_url=current_url
                 )
         
-        if redirects >= self.max_redirects:
+        if not hops:
+            final_url = str(response.url)
+            redirected = False
+        else:
+            final_url = current_url
+            # Only a move to another host counts as a redirect worth reporting
+            redirected = urlparse(original_url).netloc != urlparse(current_url).netloc
+        
+        if response.status_code >= 400:
             return CheckResult(
                 is_alive=False,
-                error=f"Too many redirects (>{self.max_redirects})"
+                status_code=response.status_code,
+                final_url=final_url if hops else None,
+                error=f"HTTP {response.status_code}",
+                redirected=redirected
             )
         
-        # Check if redirected to different host
-        original_host = urlparse(original_url).netloc
-        final_host = urlparse(current_url).netloc
-        
         return CheckResult(
-            is_alive=response.status_code < 400,
+            is_alive=True,
             status_code=response.status_code,
-            final_url=current_url,
-            redirected=original_host != final_host
-        )
\ No newline at end of file
+            final_url=final_url,
+            redirected=redirected
+        )
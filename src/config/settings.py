@@ -9,14 +9,63 @@ class Settings(BaseSettings):
     LINKACE_API_TOKEN: str
     CHECK_INTERVAL_MIN: int = 30
     CONCURRENCY: int = 10
+    HOST_CONCURRENCY: int = 0  # Concurrent checks per host (0 = no per-host cap)
+    AUTOTUNE_ENABLED: bool = False  # Adjust concurrency (starting at CONCURRENCY) from check errors and loop lag
+    AUTOTUNE_MIN_CONCURRENCY: int = 2
+    AUTOTUNE_MAX_CONCURRENCY: int = 100
+    AUTOTUNE_WINDOW: int = 50  # Completed checks per adjustment
+    AUTOTUNE_MAX_ERROR_RATE: float = 0.1  # Timeout/connection error fraction that halves concurrency
+    AUTOTUNE_MAX_LAG_S: float = 0.2  # Event loop lag that halves concurrency (needs LOOP_MONITOR_ENABLED)
+    LOOP_MONITOR_ENABLED: bool = True  # Sample event loop lag and log blocking callbacks with their stack
+    LOOP_LAG_INTERVAL_S: float = 0.1  # Seconds between event loop lag samples
+    LOOP_SLOW_CALLBACK_S: float = 0.1  # Lag above which the blocking callback is logged
     TAG_DEAD_NAME: str = "dead"
     TAG_REDIRECTED_NAME: str = "redirected"
     UPDATE_MODE: str = "tags"
     ADMIN_TOKEN: str
     AWS_REGION: str = "eu-west-1"
     AWS_SNS_TOPIC_ARN: str
+    SNS_PUBLISH_WORKERS: int = 4  # Threads running blocking boto3 publish calls
+    NOTIFY_MODE: str = "digest"  # "digest" (per-cycle summary + PublishBatch) or "immediate"
+    DIGEST_INCLUDE_LINKS: bool = True  # Digest mode: also send one message per transition
+    OUTBOX_POLL_S: float = 5.0  # Seconds between notification outbox polls
+    OUTBOX_MAX_ATTEMPTS: int = 20  # Failed deliveries before a notification is dead-lettered (~1h of backoff)
+    NOTIFY_SINK: str = "sns"  # "sns", "webhook", "file" or "fake"
+    WEBHOOK_URL: Optional[str] = None  # Endpoint for NOTIFY_SINK=webhook
+    NOTIFY_FILE_PATH: str = "notifications.jsonl"  # File for NOTIFY_SINK=file
     request_timeout_s: int = 30  # Default timeout of 30 seconds
     max_redirects: int = 5  # Maximum number of redirects to follow
+    REDIRECT_CACHE_SIZE: int = 50_000  # Redirect hops kept in memory
+    REDIRECT_CACHE_TTL_S: float = 86_400  # Lifetime of cached 301/308 hops without cache headers
+    REDIRECT_CACHE_MAX_TTL_S: float = 604_800  # Cap on hop lifetimes taken from Cache-Control/Expires
     cache_db_path: str = "cache.db"  # SQLite database file for caching
+    CACHE_BACKEND: str = "sqlite"  # "sqlite", "memory" or "log"
+    CACHE_SNAPSHOT_EVERY: int = 100_000  # Log backend: records between snapshots
+    CHECK_DEADLINE_S: float = 60.0  # Wall-clock limit for one check, across fallbacks and redirect hops
+    STUCK_CHECK_S: float = 120.0  # Log and count bookmarks holding a concurrency slot longer than this
+    CYCLE_BUDGET_S: float = 0  # Stop starting checks this long into a cycle, most urgent first; 0 = no limit
+    CYCLE_MAX_CHECKS: int = 0  # Check at most this many bookmarks per cycle, most urgent first; 0 = no limit
+    SHUTDOWN_GRACE_S: float = 20.0  # On shutdown, time checks in flight get to finish before the cycle is cancelled
+    HTTP_ENABLED: bool = True  # Serve the control plane API from the service process
+    HTTP_HOST: str = "0.0.0.0"
+    HTTP_PORT: int = 8000
+    PROGRESS_INTERVAL_S: float = 1.0  # Seconds between job progress events on /jobs/{id}/events
+    CHECK_CACHE_TTL_S: float = 300.0  # GET /check: seconds a result is served from cache
+    CHECK_CACHE_SIZE: int = 10_000  # GET /check: results kept in memory
+    CHECK_RATE_PER_MIN: float = 60.0  # GET /check: sustained requests per client
+    CHECK_RATE_BURST: int = 10  # GET /check: burst allowance per client
+    BULK_CONCURRENCY: int = 20  # POST /check/bulk: concurrent checks per request
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"  # "text" or "json" (one object per line, with extra fields)
+    LOG_SAMPLE_RATE: float = 0.0  # Fraction of bookmarks whose per-check lines are logged at INFO instead of DEBUG
+    TRACE_EXPORT: str = "none"  # "none", "file" (OTLP/JSON lines) or "otlp" (OTLP/HTTP JSON)
+    TRACE_FILE_PATH: str = "traces.jsonl"  # File for TRACE_EXPORT=file
+    TRACE_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"  # Collector for TRACE_EXPORT=otlp
+    TRACE_SAMPLE_RATE: float = 0.05  # Fraction of bookmarks and notification batches traced
+    PROFILE_CYCLES: int = 0  # Profile this many cycles after startup (also armed by SIGUSR1 or POST /profile)
+    PROFILE_DIR: str = "profiles"  # Output directory for .pstats, .collapsed and .tracemalloc.txt files
+    PROFILE_SAMPLE_INTERVAL_S: float = 0.005  # Stack sampling interval for the collapsed-stack output
+    PROFILE_TRACEMALLOC: bool = True  # Record allocation growth while profiling
+    HEALTH_MAX_CYCLE_AGE_MIN: Optional[int] = None  # Unhealthy after this long without a finished cycle (default 2x interval)
 
 settings = Settings()
\ No newline at end of file
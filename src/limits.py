@@ -0,0 +1,106 @@
+"""Concurrency limits that can be resized while they are in use.
+
+``asyncio.Semaphore`` fixes its size at creation. The limiters here take a
+new limit at any time. Growing wakes waiters at once. Shrinking never
+interrupts holders: new acquisitions wait until enough permits have been
+released to fit under the new limit.
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, Dict
+
+
+class ResizableSemaphore:
+    """FIFO semaphore with a mutable limit."""
+
+    def __init__(self, limit: float):
+        self._limit = limit
+        self._in_use = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> float:
+        return self._limit
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def locked(self) -> bool:
+        return self._in_use >= self._limit
+
+    def resize(self, limit: float) -> None:
+        self._limit = limit
+        self._wake()
+
+    async def acquire(self) -> None:
+        if self._in_use < self._limit and not self._waiters:
+            self._in_use += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The permit was handed over just before the cancellation
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        self._in_use -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        # Permits are handed to waiters directly, so a newcomer cannot
+        # overtake a woken waiter
+        while self._waiters and self._in_use < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_use += 1
+                waiter.set_result(None)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc) -> None:
+        self.release()
+
+
+class HostLimiter:
+    """Cap on concurrent operations per host; a limit of 0 means no cap."""
+
+    def __init__(self, limit: int = 0):
+        self.limit = limit
+        self._hosts: Dict[str, ResizableSemaphore] = {}
+
+    @property
+    def active_hosts(self) -> int:
+        return len(self._hosts)
+
+    def _cap(self) -> float:
+        return self.limit or float("inf")
+
+    async def acquire(self, host: str) -> None:
+        semaphore = self._hosts.get(host)
+        if semaphore is None:
+            semaphore = self._hosts[host] = ResizableSemaphore(self._cap())
+        await semaphore.acquire()
+
+    def release(self, host: str) -> None:
+        semaphore = self._hosts[host]
+        semaphore.release()
+        if not semaphore.in_use and not semaphore.waiting:
+            del self._hosts[host]
+
+    def resize(self, limit: int) -> None:
+        self.limit = limit
+        for semaphore in self._hosts.values():
+            semaphore.resize(self._cap())
@@ -0,0 +1,92 @@
+"""Logging configuration for the service process.
+
+Records are handed to a background thread through a ``QueueHandler``, so
+emitting one from the event loop costs a queue put: message formatting
+and handler I/O happen on the listener thread. ``LOG_FORMAT=json``
+writes one JSON object per line, including any ``extra`` fields.
+"""
+
+import json
+import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from .config import settings
+
+# Attributes every LogRecord has; anything else came in through ``extra``
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record with timestamp, level, logger, message and extras."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    ``QueueHandler`` that leaves formatting to the listener thread.
+
+    The stock handler merges the message arguments before enqueueing; the
+    listener runs in this process, so the record can be passed on as is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def bookmark_log_level(sample_rate: Optional[float] = None) -> int:
+    """
+    Level for one bookmark's log lines: INFO for a sampled fraction of
+    bookmarks (``LOG_SAMPLE_RATE``), DEBUG for the rest.
+    """
+    rate = settings.LOG_SAMPLE_RATE if sample_rate is None else sample_rate
+    return logging.INFO if rate and random.random() < rate else logging.DEBUG
+
+
+def setup_logging(level: Optional[str] = None, fmt: Optional[str] = None) -> QueueListener:
+    """
+    Route all logging through a queue to a stream handler on a background thread.
+
+    Args:
+        level: Root log level, default ``LOG_LEVEL``
+        fmt: "text" or "json", default ``LOG_FORMAT``
+
+    Returns:
+        The started listener; call ``stop()`` on shutdown to flush it
+    """
+    fmt = (fmt or settings.LOG_FORMAT).lower()
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JSONFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(DeferredQueueHandler(log_queue))
+    root.setLevel((level or settings.LOG_LEVEL).upper())
+    # Per-request logs from httpx would dominate at INFO
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    listener.start()
+    return listener
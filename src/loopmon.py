@@ -0,0 +1,112 @@
+"""Event loop lag monitor and slow-callback detector.
+
+A task on the loop sleeps for ``interval`` seconds at a time and records
+how late it wakes up: that lateness is the time other callbacks held the
+loop. Each sample goes into a histogram.
+
+A watchdog thread notices when the loop has not come back for longer than
+``slow_threshold`` and captures the loop thread's stack while it is still
+blocked. This shows the blocking call itself, not just the task that
+happened to be scheduled. When the loop recovers, the stall is logged with
+that stack and counted.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, List, Optional
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class LoopMonitor:
+    def __init__(self, interval: float = 0.1, slow_threshold: float = 0.1, stack_limit: int = 30):
+        """
+        Watch the running event loop for lag and blocking callbacks.
+
+        Args:
+            interval: Seconds between lag samples
+            slow_threshold: Lag above which a callback counts as slow and is logged with its stack
+            stack_limit: Innermost frames kept in logged stacks
+        """
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.stack_limit = stack_limit
+        self.max_lag = 0.0
+        self.stalls = 0
+        self._listeners: List[Callable[[float], None]] = []
+        self._last_beat = time.monotonic()
+        self._stack: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def add_listener(self, listener: Callable[[float], None]) -> None:
+        """Call ``listener(lag_s)`` with every lag sample."""
+        self._listeners.append(listener)
+
+    def start(self) -> None:
+        """Start monitoring the running loop; call from the loop's thread."""
+        if self._task is not None:
+            return
+        self._last_beat = time.monotonic()
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._sample(), name="loop-monitor")
+        self._watchdog = threading.Thread(
+            target=self._watch, args=(threading.get_ident(),), name="loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop_event.set()
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._watchdog.join()
+        self._task = self._watchdog = None
+
+    async def _sample(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            self._last_beat = expected
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._last_beat = now
+            self.record(max(0.0, now - expected))
+
+    def record(self, lag: float) -> None:
+        """Handle one lag sample."""
+        metrics.LOOP_LAG.observe(lag)
+        self.max_lag = max(self.max_lag, lag)
+        for listener in self._listeners:
+            listener(lag)
+        if lag <= self.slow_threshold:
+            self._stack = None
+            return
+
+        stack, self._stack = self._stack, None
+        self.stalls += 1
+        metrics.SLOW_CALLBACKS.inc()
+        if stack:
+            logger.warning(
+                "Event loop blocked for %.3fs. Loop thread stack while blocked:\n%s",
+                lag, stack, extra={"loop_lag_s": round(lag, 4)}
+            )
+        else:
+            logger.warning("Event loop blocked for %.3fs", lag, extra={"loop_lag_s": round(lag, 4)})
+
+    def _watch(self, thread_id: int) -> None:
+        # Poll at half the threshold so every stall above it is seen at least once
+        period = max(self.slow_threshold / 2, 0.005)
+        while not self._stop_event.wait(period):
+            overdue = time.monotonic() - self._last_beat
+            if overdue > self.slow_threshold and self._stack is None:
+                frame = sys._current_frames().get(thread_id)
+                if frame is not None:
+                    self._stack = "".join(traceback.format_stack(frame)[-self.stack_limit:])
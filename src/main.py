@@ -4,45 +4,68 @@ import asyncio
 import logging
 import signal
 import sys
-from src.service import LinkAceSentry
-from src.utils import load_env
-import os
+from dotenv import load_dotenv
 
-# Load environment variables
-load_env()
+# Copy .env into the environment (without overriding it) before anything
+# reads it: the settings do too, but boto3 only looks at os.environ for
+# AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY and AWS_DEFAULT_REGION
+load_dotenv()
 
-# Debug: print settings
-print("LINKACE_BASE_URL:", os.getenv("LINKACE_BASE_URL"))
-print("LINKACE_API_TOKEN:", os.getenv("LINKACE_API_TOKEN"))
-print("AWS_SNS_TOPIC_ARN:", os.getenv("AWS_SNS_TOPIC_ARN"))
-print("CHECK_INTERVAL_MIN:", os.getenv("CHECK_INTERVAL_MIN", "30"))
+# Settings are read once, from the environment and .env, on this import
+from src.config import settings  # noqa: E402
+from src.log_setup import setup_logging  # noqa: E402
+from src.service import LinkAceSentry  # noqa: E402
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: records go through a queue to a background thread
+log_listener = setup_logging()
 
 logger = logging.getLogger(__name__)
 
 # Global variable to control service shutdown
 shutdown_event = asyncio.Event()
 
-def signal_handler(signum, frame):
+def signal_handler(signum):
     """Handle shutdown signals."""
     logger.info(f"Received signal {signum}, initiating graceful shutdown...")
     shutdown_event.set()
 
+def reload_config(service: LinkAceSentry):
+    """Apply changed settings from the environment and .env (SIGHUP)."""
+    try:
+        changed = service.reload_config()
+    except Exception as e:
+        logger.error(f"Config reload failed, keeping current settings: {e}")
+        return
+    if not changed:
+        logger.info("Config reloaded, nothing changed")
+
 async def main():
     """Run the LinkAce Sentry service."""
     logger.info("Starting LinkAce Sentry service...")
     
-    # Register signal handlers for graceful shutdown
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
+    # Register signal handlers for graceful shutdown. As loop callbacks
+    # they wake the loop at once, even while a cycle is running.
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, signal_handler, signum)
     
     service = LinkAceSentry()
+    # SIGUSR1 profiles the next check cycle
+    signal.signal(signal.SIGUSR1, lambda signum, frame: service.profiler.arm(1))
+    # SIGHUP reloads the runtime-adjustable settings. It runs as a loop
+    # callback, because resizing the limiters wakes waiting tasks.
+    loop.add_signal_handler(signal.SIGHUP, reload_config, service)
+    server = None
+    server_task = None
     try:
+        if settings.HTTP_ENABLED:
+            # Control plane API runs on this event loop, next to the scheduler.
+            # FastAPI is the slowest import; it is skipped when the API is off.
+            from src.api.app import create_server
+            server = create_server(service)
+            server_task = asyncio.create_task(server.serve(), name="control-plane")
+            logger.info(f"Control plane listening on {settings.HTTP_HOST}:{settings.HTTP_PORT}")
+        
         await service.start()
         logger.info("Service started successfully, scheduler is running...")
         
@@ -63,6 +86,9 @@ async def main():
         logger.error(f"Service error: {e}", exc_info=True)
         raise
     finally:
+        if server_task is not None:
+            server.should_exit = True
+            await asyncio.gather(server_task, return_exceptions=True)
         await service.stop()
         logger.info("Service stopped successfully")
 
@@ -74,4 +100,7 @@ if __name__ == "__main__":
         sys.exit(0)
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+    finally:
+        # Flush queued log records before the interpreter exits
+        log_listener.stop()
\ No newline at end of file
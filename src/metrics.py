@@ -0,0 +1,172 @@
+"""Prometheus instrumentation for LinkAce Sentry.
+
+Instruments are module level singletons registered on the default
+registry. Labelled children used on the check hot path are resolved once
+at import time, so recording a check costs a dict lookup plus two
+lock-protected increments.
+"""
+
+from functools import wraps
+
+from prometheus_client import Counter, Gauge, Histogram, generate_latest
+
+from .models import CheckResult
+
+# Result classes used as the ``result`` label on check metrics
+RESULT_CLASSES = ("alive", "redirected", "dead", "timeout", "error")
+
+CHECK_DURATION = Histogram(
+    "linkace_sentry_check_duration_seconds",
+    "Time spent checking one URL, by result class",
+    ["result"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+CHECKS = Counter(
+    "linkace_sentry_checks_total",
+    "URL checks performed, by result class",
+    ["result"],
+)
+CHECKS_IN_FLIGHT = Gauge(
+    "linkace_sentry_checks_in_flight",
+    "URL checks currently running",
+)
+CHECKS_WAITING = Gauge(
+    "linkace_sentry_checks_waiting",
+    "Bookmarks waiting for a free concurrency slot",
+)
+CHECKS_STUCK = Gauge(
+    "linkace_sentry_checks_stuck",
+    "Bookmarks currently holding a concurrency slot for longer than STUCK_CHECK_S",
+)
+STUCK_CHECKS = Counter(
+    "linkace_sentry_stuck_checks_total",
+    "Bookmarks that held a concurrency slot for longer than STUCK_CHECK_S",
+)
+CONCURRENCY_LIMIT = Gauge(
+    "linkace_sentry_concurrency_limit",
+    "Maximum number of concurrent URL checks (the current target when auto-tuned)",
+)
+CONCURRENCY_ADJUSTMENTS = Counter(
+    "linkace_sentry_concurrency_adjustments_total",
+    "Concurrency limit changes made by the auto-tuner",
+    ["direction"],
+)
+REDIRECT_HOPS = Counter(
+    "linkace_sentry_redirect_hops_total",
+    "Redirect hops followed by checks, from the hop cache or by request",
+    ["source"],
+)
+
+LOOP_LAG = Histogram(
+    "linkace_sentry_event_loop_lag_seconds",
+    "How late a timed wake-up on the event loop ran, sampled periodically",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+SLOW_CALLBACKS = Counter(
+    "linkace_sentry_slow_callbacks_total",
+    "Callbacks or task steps that blocked the event loop above LOOP_SLOW_CALLBACK_S",
+)
+
+LINKACE_API_CALLS = Counter(
+    "linkace_sentry_linkace_api_calls_total",
+    "Calls made to the LinkAce API",
+    ["operation", "outcome"],
+)
+
+NOTIFY_CALLS = Counter(
+    "linkace_sentry_notify_calls_total",
+    "Calls made to the notification sink (SNS publish / PublishBatch)",
+    ["outcome"],
+)
+NOTIFY_MESSAGES = Counter(
+    "linkace_sentry_notify_messages_total",
+    "Notification messages handed to the sink",
+    ["outcome"],
+)
+NOTIFY_DURATION = Histogram(
+    "linkace_sentry_notify_duration_seconds",
+    "Latency of one notification sink call",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+OUTBOX_PENDING = Gauge(
+    "linkace_sentry_outbox_pending",
+    "Undelivered notifications in the outbox",
+)
+OUTBOX_DEAD = Gauge(
+    "linkace_sentry_outbox_dead",
+    "Notifications given up on after OUTBOX_MAX_ATTEMPTS failed deliveries",
+)
+
+CYCLE_DURATION = Histogram(
+    "linkace_sentry_cycle_duration_seconds",
+    "Wall time of one complete check cycle",
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600),
+)
+CYCLE_BOOKMARKS = Counter(
+    "linkace_sentry_cycle_bookmarks_total",
+    "Bookmarks processed by check cycles",
+)
+CYCLE_BACKLOG = Gauge(
+    "linkace_sentry_cycle_backlog",
+    "Bookmarks the last cycle left unchecked because its budget ran out",
+)
+CYCLE_COVERAGE = Gauge(
+    "linkace_sentry_cycle_coverage_ratio",
+    "Fraction of the bookmark collection checked by the last cycle",
+)
+CYCLES_SKIPPED = Counter(
+    "linkace_sentry_cycles_skipped_total",
+    "Scheduled cycles dropped because the previous one was still running",
+)
+LAST_CYCLE_END = Gauge(
+    "linkace_sentry_last_cycle_end_timestamp_seconds",
+    "Unix time at which the last check cycle finished",
+)
+
+_CHECK_CHILDREN = {
+    result: (CHECKS.labels(result), CHECK_DURATION.labels(result))
+    for result in RESULT_CLASSES
+}
+
+
+def classify(result: CheckResult) -> str:
+    """Map a check result onto one of ``RESULT_CLASSES``."""
+    if result.is_alive:
+        return "redirected" if result.redirected else "alive"
+    if result.status_code is not None:
+        return "dead"
+    if result.error and "timeout" in result.error.lower():
+        return "timeout"
+    return "error"
+
+
+def observe_check(result_class: str, seconds: float) -> None:
+    """Record one finished check."""
+    counter, histogram = _CHECK_CHILDREN[result_class]
+    counter.inc()
+    histogram.observe(seconds)
+
+
+def count_api_call(operation: str):
+    """Decorate an async LinkAce client method to count its calls by outcome."""
+    ok = LINKACE_API_CALLS.labels(operation, "ok")
+    error = LINKACE_API_CALLS.labels(operation, "error")
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                result = await func(*args, **kwargs)
+            except Exception:
+                error.inc()
+                raise
+            ok.inc()
+            return result
+        return wrapper
+    return decorator
+
+
+def render() -> bytes:
+    """Current metrics in the Prometheus text exposition format."""
+    return generate_latest()
+
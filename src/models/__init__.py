@@ -1,17 +1,33 @@
-"""Models for LinkAce Sentry."""
+"""Models for LinkAce Sentry.
 
-from typing import List, Optional
+``Bookmark`` and ``CheckResult`` are created for every bookmark of every
+cycle, so they are plain ``NamedTuple`` records rather than pydantic
+models: no validation, and no per-instance ``__dict__``. Data entering
+through the HTTP API is validated there.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from pydantic import BaseModel
 
 
-class Bookmark(BaseModel):
-    """Bookmark model."""
+def tag_names(data: Dict[str, Any]) -> List[str]:
+    """Tag names of a LinkAce link; tags are listed as objects or plain names."""
+    return [tag['name'] if isinstance(tag, dict) else str(tag) for tag in data.get('tags') or ()]
+
+
+class Bookmark(NamedTuple):
+    """Bookmark as read from a LinkAce listing page."""
     id: str
     url: str
-    tags: List[str] = []
+    tags: Tuple[str, ...] = ()
     title: Optional[str] = None
     note: Optional[str] = None
 
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Bookmark":
+        """Build a bookmark from one entry of the LinkAce ``links`` listing."""
+        return cls(str(data['id']), data['url'], tuple(tag_names(data)), data.get('title', ''))
+
 
 class Tag(BaseModel):
     """Tag model."""
@@ -19,10 +35,10 @@ class Tag(BaseModel):
     name: str
 
 
-class CheckResult(BaseModel):
+class CheckResult(NamedTuple):
     """URL check result."""
     is_alive: bool
     status_code: Optional[int] = None
     final_url: Optional[str] = None
     error: Optional[str] = None
-    redirected: bool = False
\ No newline at end of file
+    redirected: bool = False
@@ -0,0 +1,180 @@
+"""On-demand URL checks for the control plane API."""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Tuple
+
+from .checker import URLChecker
+from .models import CheckResult
+from .utils.validators import is_valid_url
+
+# (result, Unix time of the check, served from cache)
+OnDemandResult = Tuple[CheckResult, float, bool]
+
+# Longest accepted NDJSON input line
+MAX_LINE_BYTES = 64 * 1024
+
+
+class OnDemandChecker:
+    """
+    Check single URLs through the service's pooled ``URLChecker``.
+
+    Results are kept for ``ttl_s`` seconds in a bounded LRU, and concurrent
+    requests for the same URL share one in-flight check.
+    """
+
+    def __init__(self, checker: URLChecker, ttl_s: float = 300.0, max_entries: int = 10_000):
+        self.checker = checker
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, Tuple[float, CheckResult, float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    async def check(self, url: str) -> OnDemandResult:
+        """Return a fresh cached result for ``url`` or check it now."""
+        entry = self._results.get(url)
+        if entry is not None:
+            expires, result, checked_at = entry
+            if expires > time.monotonic():
+                self._results.move_to_end(url)
+                return result, checked_at, True
+            del self._results[url]
+
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._run(url))
+            self._inflight[url] = task
+        # A caller that disconnects must not cancel the check others are waiting on
+        result, checked_at = await asyncio.shield(task)
+        return result, checked_at, False
+
+    async def _run(self, url: str) -> Tuple[CheckResult, float]:
+        try:
+            result = await self.checker.check_url(url)
+            checked_at = time.time()
+            self._results[url] = (time.monotonic() + self.ttl_s, result, checked_at)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+            return result, checked_at
+        finally:
+            del self._inflight[url]
+
+
+class RateLimiter:
+    """
+    Token bucket per client: ``burst`` requests at once, refilled at
+    ``rate_per_s``. Idle clients are forgotten once more than ``max_clients``
+    are tracked.
+    """
+
+    def __init__(self, rate_per_s: float, burst: int, max_clients: int = 10_000):
+        self.rate_per_s = rate_per_s
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def acquire(self, client: str) -> float:
+        """
+        Take one token for ``client``.
+
+        Returns:
+            0 if the request may proceed, otherwise seconds until a token is available
+        """
+        now = time.monotonic()
+        tokens, last = self._buckets.pop(client, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate_per_s)
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+        else:
+            wait = (1 - tokens) / self.rate_per_s
+        self._buckets[client] = (tokens, now)
+        while len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+def is_http_url(url: Any) -> bool:
+    """Whether ``url`` is an absolute http(s) URL."""
+    return isinstance(url, str) and url.startswith(("http://", "https://")) and is_valid_url(url)
+
+
+async def ndjson_lines(chunks: AsyncIterator[bytes], max_line_bytes: int = MAX_LINE_BYTES) -> AsyncIterator[bytes]:
+    """
+    Split a byte stream into non-empty lines without buffering more than one line.
+
+    Raises:
+        ValueError: If a line is longer than ``max_line_bytes``
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+        if len(buffer) > max_line_bytes:
+            raise ValueError(f"Line longer than {max_line_bytes} bytes")
+    if buffer.strip():
+        yield buffer
+
+
+async def _check_line(checker: URLChecker, index: int, line: bytes) -> Dict[str, Any]:
+    try:
+        item = json.loads(line)
+    except ValueError:
+        return {"index": index, "error": "Invalid JSON"}
+    if not isinstance(item, dict):
+        item = {"url": item}
+    url = item.get("url")
+    if not is_http_url(url):
+        return {"index": index, "url": url, "error": "url must be an absolute http(s) URL"}
+
+    result = await checker.check_url(url)
+    extra = {"id": item["id"]} if "id" in item else {}
+    return {"index": index, **extra, "url": url, **result._asdict()}
+
+
+async def bulk_check(
+    checker: URLChecker,
+    lines: AsyncIterator[bytes],
+    concurrency: int
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Check NDJSON input lines and yield results in completion order.
+
+    Each line is a JSON string URL or an object with ``url`` and optional
+    ``id``. At most ``concurrency`` checks run at once and no further
+    input is read while they are all busy, so memory stays bounded however
+    long the input is. Results carry the zero-based ``index`` of their line.
+    """
+    pending = set()
+    index = 0
+    try:
+        try:
+            async for line in lines:
+                if len(pending) >= concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.create_task(_check_line(checker, index, line)))
+                index += 1
+                # Emit whatever finished while we were reading
+                for task in [task for task in pending if task.done()]:
+                    pending.discard(task)
+                    yield task.result()
+        except ValueError as e:
+            yield {"index": index, "error": str(e)}
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,155 @@
+"""On-demand profiling of check cycles.
+
+``CycleProfiler.arm(n)`` profiles the next ``n`` cycles. Each profiled
+cycle writes, to the output directory:
+
+- ``<name>.pstats``: cProfile statistics, for ``python -m pstats`` or snakeviz
+- ``<name>.collapsed``: stack samples of the event loop thread in the
+  collapsed format read by flamegraph.pl and speedscope
+- ``<name>.tracemalloc.txt``: allocation growth over the cycle by line
+
+Nothing is hooked in while the profiler is not armed; ``run_once`` only
+checks an integer.
+"""
+
+import asyncio
+import cProfile
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StackSampler(threading.Thread):
+    """Sample the stack of one thread at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        super().__init__(name="cycle-profiler-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class CycleProfiler:
+    def __init__(
+        self,
+        output_dir: str,
+        sample_interval: float = 0.005,
+        trace_memory: bool = True
+    ):
+        """
+        Profile upcoming check cycles on request.
+
+        Args:
+            output_dir: Directory receiving the profile files
+            sample_interval: Seconds between stack samples
+            trace_memory: Also record allocations with tracemalloc
+        """
+        self.output_dir = Path(output_dir)
+        self.sample_interval = sample_interval
+        self.trace_memory = trace_memory
+        self.pending = 0
+        self.outputs: List[str] = []
+
+    def arm(self, cycles: int = 1) -> None:
+        """Profile the next ``cycles`` cycles. Safe to call from a signal handler."""
+        self.pending = max(0, cycles)
+
+    def status(self) -> dict:
+        return {
+            "pending_cycles": self.pending,
+            "output_dir": str(self.output_dir),
+            "outputs": self.outputs[-20:],
+        }
+
+    @asynccontextmanager
+    async def profile(self, name: str):
+        """Profile the enclosed cycle if armed, otherwise do nothing."""
+        if not self.pending:
+            yield
+            return
+        self.pending -= 1
+
+        started_tracemalloc = False
+        before: Optional[tracemalloc.Snapshot] = None
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracemalloc = True
+            before = tracemalloc.take_snapshot()
+
+        sampler = StackSampler(threading.get_ident(), self.sample_interval)
+        profile = cProfile.Profile()
+        sampler.start()
+        profile.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            profile.disable()
+            sampler.stop()
+            elapsed = time.perf_counter() - start
+            after = tracemalloc.take_snapshot() if before is not None else None
+            if started_tracemalloc:
+                tracemalloc.stop()
+            base = self.output_dir / f"cycle-{time.strftime('%Y%m%d-%H%M%S')}-{name}"
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write, base, profile, sampler, before, after
+            )
+            self.outputs.append(str(base))
+            logger.info("Profiled cycle in %.2fs, wrote %s.*", elapsed, base)
+
+    def _write(
+        self,
+        base: Path,
+        profile: cProfile.Profile,
+        sampler: StackSampler,
+        before: Optional[tracemalloc.Snapshot],
+        after: Optional[tracemalloc.Snapshot]
+    ) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        profile.dump_stats(f"{base}.pstats")
+        Path(f"{base}.collapsed").write_text(sampler.collapsed())
+        if before is not None and after is not None:
+            lines = [str(stat) for stat in after.compare_to(before, "lineno")[:50]]
+            Path(f"{base}.tracemalloc.txt").write_text("\n".join(lines) + "\n")
+
+
+def create_profiler() -> CycleProfiler:
+    """Build the profiler from ``PROFILE_*`` settings, armed for ``PROFILE_CYCLES`` cycles."""
+    from .config import settings
+
+    profiler = CycleProfiler(
+        settings.PROFILE_DIR,
+        sample_interval=settings.PROFILE_SAMPLE_INTERVAL_S,
+        trace_memory=settings.PROFILE_TRACEMALLOC
+    )
+    profiler.arm(settings.PROFILE_CYCLES)
+    return profiler
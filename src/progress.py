@@ -0,0 +1,92 @@
+"""Progress tracking for check cycles."""
+
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class CycleJob:
+    """One check cycle, scheduled or started through the API."""
+
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    trigger: str = "scheduler"
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    total: Optional[int] = None  # From LinkAce pagination meta, once the first page is in
+    checked: int = 0
+    dead: int = 0
+    error: Optional[str] = None
+    version: int = 0  # Bumped on every change so streams only send updates
+
+    @property
+    def done(self) -> bool:
+        return self.finished_at is not None
+
+    @property
+    def remaining(self) -> Optional[int]:
+        if self.total is None:
+            return None
+        return max(self.total - self.checked, 0)
+
+    def eta_s(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the cycle finishes at the rate observed so far."""
+        if self.done:
+            return 0.0
+        if not self.checked or self.remaining is None:
+            return None
+        elapsed = (now or time.time()) - self.started_at
+        return self.remaining * elapsed / self.checked
+
+    def record(self, dead: bool) -> None:
+        self.checked += 1
+        self.dead += dead
+        self.version += 1
+
+    def finish(self, error: Optional[str] = None) -> None:
+        self.finished_at = time.time()
+        self.error = error
+        self.version += 1
+
+    def to_dict(self) -> dict:
+        eta = self.eta_s()
+        return {
+            "job_id": self.id,
+            "trigger": self.trigger,
+            "state": ("failed" if self.error else "finished") if self.done else "running",
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "total": self.total,
+            "checked": self.checked,
+            "dead": self.dead,
+            "remaining": self.remaining,
+            "eta_s": round(eta, 1) if eta is not None else None,
+            "error": self.error,
+        }
+
+
+class JobRegistry:
+    """The current cycle plus the most recent finished ones, by job ID."""
+
+    def __init__(self, keep: int = 20):
+        self.keep = keep
+        self._jobs: "OrderedDict[str, CycleJob]" = OrderedDict()
+        self.current: Optional[CycleJob] = None
+
+    def start(self, trigger: str = "scheduler") -> CycleJob:
+        job = CycleJob(trigger=trigger)
+        self._jobs[job.id] = job
+        while len(self._jobs) > self.keep:
+            self._jobs.popitem(last=False)
+        self.current = job
+        return job
+
+    def running(self) -> Optional[CycleJob]:
+        if self.current is not None and not self.current.done:
+            return self.current
+        return None
+
+    def get(self, job_id: str) -> Optional[CycleJob]:
+        return self._jobs.get(job_id)
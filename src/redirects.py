@@ -0,0 +1,135 @@
+"""Cache of redirect hops shared by all checks.
+
+Many bookmarks go through the same redirects: http -> https upgrades,
+link shorteners, vanity domains. Each hop seen by the checker is stored
+as ``url -> (location, status, expires_at)``.
+
+How long a hop is kept:
+- ``Cache-Control: max-age`` or ``Expires`` when the response sends them
+- ``default_ttl`` for permanent redirects (301/308) without either
+- not at all for temporary redirects without either, or with
+  ``no-store``/``no-cache``
+
+Lookups are served from an in-memory LRU. Writes also go to the status
+cache backend, which persists them where it can (SQLite). The LRU is
+warmed from there on startup.
+"""
+
+import re
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import List, Mapping, NamedTuple, Optional
+
+from .cache.base import CacheBackend
+
+PERMANENT_REDIRECTS = (301, 308)
+
+_MAX_AGE = re.compile(r"\bmax-age=(\d+)")
+
+
+class Hop(NamedTuple):
+    location: str
+    status: int
+    expires_at: float
+
+
+def hop_ttl(
+    status: int,
+    headers: Mapping[str, str],
+    default_ttl: float,
+    max_ttl: float,
+    now: Optional[float] = None
+) -> float:
+    """Seconds a redirect response may be reused, from its cache headers and status."""
+    cache_control = (headers.get("cache-control") or "").lower()
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0.0
+    match = _MAX_AGE.search(cache_control)
+    if match:
+        return min(float(match.group(1)), max_ttl)
+    expires = headers.get("expires")
+    if expires:
+        try:
+            remaining = parsedate_to_datetime(expires).timestamp() - (time.time() if now is None else now)
+        except (TypeError, ValueError):
+            # An invalid Expires means already expired
+            return 0.0
+        return max(0.0, min(remaining, max_ttl))
+    return default_ttl if status in PERMANENT_REDIRECTS else 0.0
+
+
+class HopCache:
+    def __init__(
+        self,
+        store: Optional[CacheBackend] = None,
+        max_entries: int = 50_000,
+        default_ttl: float = 86_400,
+        max_ttl: float = 7 * 86_400
+    ):
+        """
+        In-memory LRU of redirect hops, persisted through ``store``.
+
+        Args:
+            store: Cache backend keeping hops across restarts; None keeps them in memory only
+            max_entries: Hops kept in memory
+            default_ttl: Lifetime of permanent redirects without cache headers
+            max_ttl: Upper bound for any lifetime taken from cache headers
+        """
+        self.store = store
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.max_ttl = max_ttl
+        self._hops: "OrderedDict[str, Hop]" = OrderedDict()
+        if store is not None:
+            for url, location, status, expires_at in store.load_redirects(max_entries):
+                self._hops[url] = Hop(location, status, expires_at)
+
+    def __len__(self) -> int:
+        return len(self._hops)
+
+    def get(self, url: str, now: Optional[float] = None) -> Optional[Hop]:
+        hop = self._hops.get(url)
+        if hop is None:
+            return None
+        if hop.expires_at <= (time.time() if now is None else now):
+            del self._hops[url]
+            return None
+        self._hops.move_to_end(url)
+        return hop
+
+    def put(self, url: str, location: str, status: int, headers: Mapping[str, str]) -> bool:
+        """Remember one hop if its response allows it; returns whether it was cached."""
+        now = time.time()
+        ttl = hop_ttl(status, headers, self.default_ttl, self.max_ttl, now)
+        if ttl <= 0:
+            return False
+        hop = self._hops[url] = Hop(location, status, now + ttl)
+        self._hops.move_to_end(url)
+        while len(self._hops) > self.max_entries:
+            self._hops.popitem(last=False)
+        if self.store is not None:
+            self.store.put_redirect(url, *hop)
+        return True
+
+    def discard(self, urls: List[str]) -> None:
+        for url in urls:
+            self._hops.pop(url, None)
+        if self.store is not None:
+            self.store.delete_redirects(urls)
+
+    def resolve(self, url: str, max_hops: int) -> List[str]:
+        """
+        Follow cached hops from ``url``.
+
+        Returns:
+            The chain of URLs starting with ``url``; the last one still has
+            to be fetched. Stops early on a loop or after ``max_hops`` hops.
+        """
+        chain = [url]
+        while len(chain) <= max_hops:
+            hop = self.get(chain[-1])
+            if hop is None or hop.location in chain:
+                break
+            chain.append(hop.location)
+        return chain
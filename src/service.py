@@ -2,40 +2,170 @@
 
 import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import List, Set
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
-from .config import settings
+from . import metrics
+from .config import Settings, settings
 from .services.linkace_client import LinkAceClient
 from .services.notification_service import NotificationService
+from .services.notification_sinks import create_sink
+from .services.notification_digest import NotificationDigest, transition_message
+from .services.outbox_sender import OutboxSender
 from .checker import URLChecker
-from .cache import Cache
+from .cache import create_cache
+from .cache.base import CheckState, StatusRow
 from .models import Bookmark, CheckResult
+from .progress import CycleJob, JobRegistry
+from .store import BookmarkStore
+from .limits import HostLimiter, ResizableSemaphore
+from .autotune import AIMDController
+from .loopmon import LoopMonitor
+from .watchdog import TaskWatchdog
+from .tracing import tracer
+from .log_setup import bookmark_log_level
+from .profiler import create_profiler
+from . import tracing
+from .ondemand import OnDemandChecker
 
 logger = logging.getLogger(__name__)
 
+# Cache checkpoint holding the position of an unfinished cycle
+CYCLE_CHECKPOINT = "cycle"
+# Bookmarks handed to the limiters at a time in budgeted cycles
+BUDGET_BATCH = 500
+# Dead bookmarks with fewer consecutive failures than this count as
+# recently failing and are checked first in budgeted cycles
+RECENT_FAILURES = 3
+
+# Settings that reconfigure() applies to a running service
+RELOADABLE_SETTINGS = (
+    "CONCURRENCY", "HOST_CONCURRENCY", "request_timeout_s", "CHECK_DEADLINE_S", "CHECK_INTERVAL_MIN"
+)
+
+
+def check_priority(state: Optional[CheckState]) -> Tuple[int, str]:
+    """
+    Sort key for budgeted cycles: failing, never checked, then stalest.
+    
+    Bookmarks that started failing recently come first, so that a
+    transient failure is confirmed or cleared quickly. Bookmarks dead for
+    longer are ordered with the live ones by last check time.
+    """
+    if state is None:
+        return 1, ""
+    status, failures, checked_at = state
+    if status == "dead" and failures < RECENT_FAILURES:
+        return 0, checked_at
+    return 2, checked_at
+
+
+def prioritize(ids: Sequence[int], states: Dict[str, CheckState]) -> List[int]:
+    """Rows of ``ids`` in ``check_priority`` order, given ``CacheBackend.check_states()``."""
+    get = states.get
+    return sorted(range(len(ids)), key=lambda row: check_priority(get(str(ids[row]))))
+
 
 class LinkAceSentry:
     """Main service for checking and updating bookmarks."""
     
     def __init__(self):
         self.api = LinkAceClient(settings.LINKACE_BASE_URL, settings.LINKACE_API_TOKEN)
-        self.checker = URLChecker()
-        self.cache = Cache()
-        self.scheduler = AsyncIOScheduler()
-        self.semaphore = asyncio.Semaphore(settings.CONCURRENCY)
-        self.notifier = NotificationService(settings.AWS_SNS_TOPIC_ARN, settings.AWS_REGION)
+        # One pooled client for all checks, shared with the control plane API
+        self.cache = create_cache()
+        self.checker = URLChecker(hop_store=self.cache)
+        self.ondemand = OnDemandChecker(self.checker, settings.CHECK_CACHE_TTL_S, settings.CHECK_CACHE_SIZE)
+        self._scheduler = None
+        # Both limits can be resized at runtime, see reconfigure()
+        self.semaphore = ResizableSemaphore(settings.CONCURRENCY)
+        self.host_limiter = HostLimiter(settings.HOST_CONCURRENCY)
+        # Moves the semaphore's limit between the AUTOTUNE_* bounds
+        self.autotune: Optional[AIMDController] = None
+        if settings.AUTOTUNE_ENABLED:
+            self.autotune = AIMDController(
+                self.semaphore,
+                min_limit=settings.AUTOTUNE_MIN_CONCURRENCY,
+                max_limit=settings.AUTOTUNE_MAX_CONCURRENCY,
+                window=settings.AUTOTUNE_WINDOW,
+                max_error_rate=settings.AUTOTUNE_MAX_ERROR_RATE,
+                max_lag_s=settings.AUTOTUNE_MAX_LAG_S
+            )
+        # Reports bookmarks holding a slot for longer than STUCK_CHECK_S
+        self.watchdog = TaskWatchdog(settings.STUCK_CHECK_S)
+        self.loop_monitor: Optional[LoopMonitor] = None
+        if settings.LOOP_MONITOR_ENABLED:
+            self.loop_monitor = LoopMonitor(settings.LOOP_LAG_INTERVAL_S, settings.LOOP_SLOW_CALLBACK_S)
+            if self.autotune is not None:
+                self.loop_monitor.add_listener(self.autotune.observe_lag)
+        self.notifier = NotificationService(
+            settings.AWS_SNS_TOPIC_ARN,
+            settings.AWS_REGION,
+            max_workers=settings.SNS_PUBLISH_WORKERS,
+            sink=create_sink()
+        )
+        self.outbox = OutboxSender(
+            self.cache,
+            self.notifier,
+            poll_interval=settings.OUTBOX_POLL_S,
+            max_attempts=settings.OUTBOX_MAX_ATTEMPTS
+        )
+        self._digest: Optional[NotificationDigest] = None
+        self._cycle_task: Optional[asyncio.Task] = None
+        # Set by stop(): no new checks start, running ones finish
+        self._draining = False
+        # IDs of the bookmarks checked on the current page of a page sweep,
+        # for the checkpoint; None outside a sweep
+        self._page_done: Optional[List[int]] = None
+        # Monotonic time after which a budgeted cycle starts no more checks
+        self._cycle_deadline = float("inf")
+        self.jobs = JobRegistry()
+        # Bookmarks of the current (or last) cycle
+        self.store = BookmarkStore()
+        self.profiler = create_profiler()
+        
+        # Cycle bookkeeping reported by the health check (Unix timestamps)
+        self.started_at = time.time()
+        self.last_cycle_started: Optional[float] = None
+        self.last_cycle_ended: Optional[float] = None
+        self.last_cycle_processed = 0
+        self.last_cycle_backlog = 0
+        self.last_cycle_coverage: Optional[float] = None
+        self.last_cycle_error: Optional[str] = None
+        
+        tracing.configure()
+        metrics.CONCURRENCY_LIMIT.set(settings.CONCURRENCY)
+        metrics.OUTBOX_PENDING.set_function(self.cache.outbox_size)
+        metrics.OUTBOX_DEAD.set_function(self.cache.dead_letter_size)
+        metrics.CHECKS_STUCK.set_function(lambda: self.watchdog.stuck)
+    
+    @property
+    def scheduler(self):
+        """APScheduler instance, imported and created on first use."""
+        if self._scheduler is None:
+            from apscheduler.schedulers.asyncio import AsyncIOScheduler
+            self._scheduler = AsyncIOScheduler()
+        return self._scheduler
+    
+    @property
+    def scheduler_running(self) -> bool:
+        """Whether the scheduler has been started and not shut down."""
+        return self._scheduler is not None and self._scheduler.running
     
     async def start(self):
         """Start the service."""
         logger.info("Initializing LinkAce Sentry service...")
-        logger.info(f"Check interval: {settings.CHECK_INTERVAL_MIN} minutes")
-        logger.info(f"Concurrency: {settings.CONCURRENCY}")
-        logger.info(f"LinkAce URL: {settings.LINKACE_BASE_URL}")
+        logger.info("Check interval: %d minutes", settings.CHECK_INTERVAL_MIN)
+        logger.info("Concurrency: %d", settings.CONCURRENCY)
+        logger.info("LinkAce URL: %s", settings.LINKACE_BASE_URL)
+        
+        await self.outbox.start()
+        if self.loop_monitor is not None:
+            self.loop_monitor.start()
+        self.watchdog.start()
         
         # Setup scheduled job
+        from apscheduler.triggers.interval import IntervalTrigger
         self.scheduler.add_job(
             self.run_once,
             trigger=IntervalTrigger(minutes=settings.CHECK_INTERVAL_MIN),
@@ -43,61 +173,339 @@ class LinkAceSentry:
             replace_existing=True,
             max_instances=1
         )
+        # APScheduler drops runs that are due while the last one still runs
+        from apscheduler.events import EVENT_JOB_MAX_INSTANCES
+        self.scheduler.add_listener(self._on_run_skipped, EVENT_JOB_MAX_INSTANCES)
         self.scheduler.start()
         
-        logger.info(f"✅ Scheduler started successfully!")
-        logger.info(f"📅 Next check will run in {settings.CHECK_INTERVAL_MIN} minutes")
-        logger.info(f"🔄 Subsequent checks will run every {settings.CHECK_INTERVAL_MIN} minutes")
+        logger.info("✅ Scheduler started successfully!")
+        logger.info("📅 Next check will run in %d minutes", settings.CHECK_INTERVAL_MIN)
+        logger.info("🔄 Subsequent checks will run every %d minutes", settings.CHECK_INTERVAL_MIN)
         
-        # Run initial check
+        # Run initial check in the background, so that a shutdown signal
+        # is handled while it runs
         logger.info("🚀 Running initial bookmark check...")
-        await self.run_once()
+        self._cycle_task = asyncio.create_task(self.run_once(), name="check-cycle-initial")
     
-    async def stop(self):
-        """Stop the service."""
-        self.scheduler.shutdown()
+    async def stop(self, grace: Optional[float] = None):
+        """
+        Stop the service.
+        
+        No new checks start. Checks in flight get ``grace`` seconds
+        (default ``SHUTDOWN_GRACE_S``) to finish, then the cycle is cancelled.
+        Either way its position is checkpointed and the next start resumes
+        there. Pending notifications are flushed and the cache is closed last.
+        """
+        self._draining = True
+        if self.scheduler_running:
+            self.scheduler.shutdown(wait=False)
+        await self._drain_cycle(settings.SHUTDOWN_GRACE_S if grace is None else grace)
+        await self.outbox.stop()
+        await self.notifier.stop()
+        if self.loop_monitor is not None:
+            await self.loop_monitor.stop()
+        await self.watchdog.stop()
+        await tracer.close()
+        await self.checker.aclose()
+        await self.api.aclose()
+        self.cache.close()
         logger.info("Service stopped")
     
-    async def run_once(self):
-        """Run one complete check cycle."""
+    async def _drain_cycle(self, grace: float) -> None:
+        """Wait up to ``grace`` seconds for the running cycle, then cancel it."""
+        task = self._cycle_task
+        if task is None or task.done() or task is asyncio.current_task():
+            return
+        logger.info("Waiting up to %gs for %d checks in flight", grace, self.semaphore.in_use)
+        done, _ = await asyncio.wait({task}, timeout=grace)
+        if not done:
+            logger.warning("Checks still running after %gs, cancelling the cycle", grace)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+    
+    def reconfigure(self, **changes) -> Dict[str, Dict[str, Any]]:
+        """
+        Apply new values for ``RELOADABLE_SETTINGS`` to the running service.
+        
+        Limiters are resized in place and the scheduled job gets a new
+        interval; checks in flight finish under the old limits and timeout.
+        
+        Returns:
+            The settings that changed, as ``{name: {"old": ..., "new": ...}}``
+        
+        Raises:
+            ValueError: If a setting cannot be changed at runtime
+        """
+        unknown = set(changes) - set(RELOADABLE_SETTINGS)
+        if unknown:
+            raise ValueError(f"Not reloadable: {', '.join(sorted(unknown))}")
+        
+        changed = {}
+        for name, value in changes.items():
+            old = getattr(settings, name)
+            if value is not None and value != old:
+                setattr(settings, name, value)
+                changed[name] = {"old": old, "new": value}
+        
+        if "CONCURRENCY" in changed:
+            if self.autotune is not None:
+                # Tuning continues from the new value
+                self.autotune.reset(settings.CONCURRENCY)
+            else:
+                self.semaphore.resize(settings.CONCURRENCY)
+                metrics.CONCURRENCY_LIMIT.set(settings.CONCURRENCY)
+        if "HOST_CONCURRENCY" in changed:
+            self.host_limiter.resize(settings.HOST_CONCURRENCY)
+        if "request_timeout_s" in changed:
+            self.checker.set_timeout(settings.request_timeout_s)
+        if "CHECK_DEADLINE_S" in changed:
+            self.checker.deadline = settings.CHECK_DEADLINE_S
+        if "CHECK_INTERVAL_MIN" in changed and self.scheduler_running:
+            if self.scheduler.get_job("check_bookmarks") is not None:
+                from apscheduler.triggers.interval import IntervalTrigger
+                self.scheduler.reschedule_job(
+                    "check_bookmarks", trigger=IntervalTrigger(minutes=settings.CHECK_INTERVAL_MIN)
+                )
+        
+        if changed:
+            logger.info(
+                "Reconfigured: %s",
+                ", ".join(f"{name} {c['old']} -> {c['new']}" for name, c in changed.items())
+            )
+        return changed
+    
+    def reload_config(self) -> Dict[str, Dict[str, Any]]:
+        """Re-read settings from the environment and .env and apply the reloadable ones."""
+        fresh = Settings()
+        return self.reconfigure(**{name: getattr(fresh, name) for name in RELOADABLE_SETTINGS})
+    
+    def runtime_config(self) -> Dict[str, Any]:
+        """Current values of the reloadable settings and the state of the limiters."""
+        return {
+            **{name: getattr(settings, name) for name in RELOADABLE_SETTINGS},
+            "concurrency_limit": self.semaphore.limit,
+            "autotune": self.autotune is not None,
+            "checks_in_use": self.semaphore.in_use,
+            "checks_waiting": self.semaphore.waiting,
+            "hosts_active": self.host_limiter.active_hosts,
+        }
+    
+    @property
+    def cycle_running(self) -> bool:
+        """Whether a check cycle is in progress."""
+        return self.jobs.running() is not None
+    
+    def trigger_cycle(self) -> Tuple[CycleJob, bool]:
+        """
+        Start a check cycle in the background, or join the one already running.
+        
+        Returns:
+            The cycle's job and whether it was started by this call
+        """
+        running = self.jobs.running()
+        if running is not None:
+            return running, False
+        job = self.jobs.start(trigger="api")
+        self._cycle_task = asyncio.create_task(self.run_once(job), name=f"check-cycle-{job.id}")
+        return job, True
+    
+    def health(self) -> dict:
+        """
+        Report scheduler liveness and the age of the last finished cycle.
+        
+        The service is healthy while the scheduler runs and a cycle has
+        finished within ``HEALTH_MAX_CYCLE_AGE_MIN`` (twice the check
+        interval by default), counting from startup until the first one.
+        """
+        now = time.time()
+        max_age = 60 * (settings.HEALTH_MAX_CYCLE_AGE_MIN or 2 * settings.CHECK_INTERVAL_MIN)
+        age = now - (self.last_cycle_ended or self.started_at)
+        
+        next_run = None
+        if self.scheduler_running:
+            job = self.scheduler.get_job("check_bookmarks")
+            if job is not None and job.next_run_time is not None:
+                next_run = job.next_run_time.isoformat()
+        
+        healthy = self.scheduler_running and age <= max_age
+        return {
+            "status": "healthy" if healthy else "unhealthy",
+            "scheduler_running": self.scheduler_running,
+            "next_run_at": next_run,
+            "cycle_running": self.cycle_running,
+            "last_cycle_started": self.last_cycle_started,
+            "last_cycle_ended": self.last_cycle_ended,
+            "last_cycle_age_s": round(now - self.last_cycle_ended, 3) if self.last_cycle_ended else None,
+            "last_cycle_processed": self.last_cycle_processed,
+            "last_cycle_backlog": self.last_cycle_backlog,
+            "last_cycle_coverage": self.last_cycle_coverage,
+            "last_cycle_error": self.last_cycle_error,
+            "max_cycle_age_s": max_age,
+            "outbox_pending": self.cache.outbox_size(),
+        }
+    
+    def _on_run_skipped(self, event=None) -> None:
+        """Count and report a scheduled run dropped because a cycle was still running."""
+        metrics.CYCLES_SKIPPED.inc()
+        logger.warning(
+            "Check cycle still running, scheduled run skipped; set CYCLE_BUDGET_S to bound cycle time"
+        )
+    
+    async def run_once(self, job: Optional[CycleJob] = None):
+        """
+        Run one complete check cycle.
+        
+        Args:
+            job: Progress record created by ``trigger_cycle``; scheduled runs
+                create their own and are skipped while another cycle runs
+        """
+        if job is None:
+            if self._draining:
+                return
+            if self.jobs.running() is not None:
+                self._on_run_skipped()
+                return
+            job = self.jobs.start()
+        self._cycle_task = asyncio.current_task()
+        if self.profiler.pending:
+            async with self.profiler.profile(job.id):
+                await self._run_cycle(job)
+        else:
+            await self._run_cycle(job)
+    
+    async def _run_cycle(self, job: CycleJob):
+        """
+        Check the bookmark collection once.
+        
+        Without a cycle budget every bookmark is checked, page by page (see
+        ``_sweep_pages``). With ``CYCLE_BUDGET_S`` or ``CYCLE_MAX_CHECKS`` set,
+        the most urgent bookmarks are checked until the budget runs out and
+        the rest carry over (see ``_run_budgeted``). Either way the cycle's
+        coverage and backlog are logged and exported as metrics.
+        """
         cycle_start = datetime.now()
+        self.last_cycle_started = time.time()
+        self.last_cycle_error = None
         logger.info("=" * 60)
-        logger.info(f"🔍 STARTING BOOKMARK CHECK CYCLE at {cycle_start.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("🔍 STARTING BOOKMARK CHECK CYCLE at %s", cycle_start.strftime('%Y-%m-%d %H:%M:%S'))
         logger.info("=" * 60)
         
+        if settings.NOTIFY_MODE == "digest":
+            self._digest = NotificationDigest(include_links=settings.DIGEST_INCLUDE_LINKS)
+        
+        total_processed = 0
+        store = self.store = BookmarkStore()
         try:
-            page = 1
-            total_processed = 0
+            with tracer.span("cycle", job_id=job.id, trigger=job.trigger) as cycle_span:
+                if settings.CYCLE_BUDGET_S or settings.CYCLE_MAX_CHECKS:
+                    total_processed, backlog = await self._run_budgeted(job, store)
+                else:
+                    total_processed, backlog = await self._sweep_pages(job, store), 0
+                cycle_span.set_attribute("bookmarks", total_processed)
             
+            if self._draining:
+                self.last_cycle_error = "Interrupted by shutdown"
+                return
+            
+            duration = (datetime.now() - cycle_start).total_seconds()
+            coverage = total_processed / (total_processed + backlog) if total_processed + backlog else 1.0
+            self.last_cycle_backlog = backlog
+            self.last_cycle_coverage = coverage
+            metrics.CYCLE_DURATION.observe(duration)
+            metrics.CYCLE_BOOKMARKS.inc(total_processed)
+            metrics.CYCLE_BACKLOG.set(backlog)
+            metrics.CYCLE_COVERAGE.set(coverage)
+            metrics.LAST_CYCLE_END.set_to_current_time()
+            logger.info("=" * 60)
+            logger.info(
+                "✅ CHECK CYCLE COMPLETED in %.2fs", duration,
+                extra={
+                    "total_processed": total_processed,
+                    "duration_seconds": round(duration, 2),
+                    "backlog": backlog,
+                    "coverage": round(coverage, 4)
+                }
+            )
+            logger.info(
+                "📊 Processed %d bookmarks, %.1f%% coverage, %d carried over",
+                total_processed, 100 * coverage, backlog
+            )
+            notify = self.notifier.metrics
+            logger.info(
+                "📨 SNS: %d published in %d calls, %d failed, avg %.3fs, max %.3fs, outbox pending %d",
+                notify.published, notify.calls, notify.failed,
+                notify.latency_avg_s, notify.latency_max_s, self.cache.outbox_size()
+            )
+            logger.info("⏰ Next check in %d minutes", settings.CHECK_INTERVAL_MIN)
+            logger.info("=" * 60)
+            
+        except asyncio.CancelledError:
+            self.last_cycle_error = "Cancelled"
+            raise
+        except Exception as e:
+            self.last_cycle_error = str(e)
+            logger.error("❌ Check cycle failed: %s", e)
+            logger.error("🔧 This error will not stop the scheduler - next check will continue as scheduled")
+            # Don't re-raise the exception to keep scheduler running
+        finally:
+            self._cycle_deadline = float("inf")
+            self._page_done = None
+            self.last_cycle_ended = time.time()
+            self.last_cycle_processed = job.checked
+            job.finish(self.last_cycle_error)
+            if self._digest is not None:
+                digest, self._digest = self._digest, None
+                if len(digest):
+                    for message in digest.summary_messages():
+                        self.cache.enqueue_notification(message)
+                    self.outbox.wake()
+            await tracer.flush()
+    
+    async def _sweep_pages(self, job: CycleJob, store: BookmarkStore) -> int:
+        """
+        Check every bookmark once, page by page.
+        
+        The position is checkpointed in the cache after every page and when
+        the cycle is interrupted, so a cycle cut short by a shutdown or an
+        error is resumed by the next one instead of starting over.
+        
+        Returns:
+            Number of bookmarks processed
+        """
+        page = 1
+        done: List[int] = []
+        checkpoint = self.cache.get_checkpoint(CYCLE_CHECKPOINT)
+        if checkpoint:
+            page, done = checkpoint["page"], checkpoint["done"]
+            logger.info(
+                "Resuming interrupted cycle at page %d, %d of its bookmarks already checked", page, len(done)
+            )
+        self._page_done = done
+        total_processed = 0
+        try:
             while True:
                 # Get batch of bookmarks
-                logger.info(f"Fetching bookmarks page {page}...")
-                response = await self.api.list_bookmarks(page)
-                logger.info(f"API Response: {response}")
+                logger.debug("Fetching bookmarks page %d", page)
+                with tracer.span("linkace.list_page", page=page):
+                    response = await self.api.list_bookmarks(page)
                 
-                bookmarks = []
-                for data in response.get('data', []):
-                    bookmarks.append(Bookmark(
-                        id=str(data['id']),
-                        url=data['url'],
-                        title=data.get('title', ''),
-                        tags=[]  # We'll update this if needed
-                    ))
-                logger.info(f"Found {len(bookmarks)} bookmarks on page {page}")
-                if not bookmarks:
+                rows = store.extend(response.get('data', []))
+                logger.info("Found %d bookmarks on page %d", len(rows), page)
+                if job.total is None:
+                    job.total = response.get('meta', {}).get('total')
+                if not rows:
                     break
+                if self._page_done:
+                    # Resumed page: skip what was checked before the restart
+                    skip = set(self._page_done)
+                    rows = [row for row in rows if store.ids[row] not in skip]
                 
-                # Process bookmarks concurrently
-                tasks = [self._process_bookmark(bookmark) for bookmark in bookmarks]
-                logger.info(f"Processing {len(tasks)} bookmarks concurrently...")
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Log any errors
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        logger.error(f"Error processing bookmark {bookmarks[i].id}: {result}")
+                # Process bookmarks concurrently, alternating between hosts
+                await self._check_rows(store, store.interleave(rows))
                 
-                total_processed += len(bookmarks)
+                total_processed += len(rows)
+                if self._draining:
+                    break
                 
                 # Check if there are more pages
                 meta = response.get('meta', {})
@@ -108,87 +516,205 @@ class LinkAceSentry:
                     break
                     
                 page += 1
-            
-            duration = (datetime.now() - cycle_start).total_seconds()
-            logger.info("=" * 60)
-            logger.info(
-                f"✅ CHECK CYCLE COMPLETED in {round(duration, 2)}s",
-                extra={
-                    "total_processed": total_processed,
-                    "duration_seconds": round(duration, 2)
-                }
+                self._page_done = []
+                self.cache.save_checkpoint(CYCLE_CHECKPOINT, {"page": page, "done": []})
+        except BaseException:
+            self.cache.save_checkpoint(CYCLE_CHECKPOINT, {"page": page, "done": list(self._page_done)})
+            raise
+        
+        if self._draining:
+            self.cache.save_checkpoint(CYCLE_CHECKPOINT, {"page": page, "done": list(self._page_done)})
+            logger.warning(
+                "⏸️ Check cycle interrupted by shutdown at page %d, it resumes there on the next start", page
             )
-            logger.info(f"📊 Processed {total_processed} bookmarks")
-            logger.info(f"⏰ Next check in {settings.CHECK_INTERVAL_MIN} minutes")
-            logger.info("=" * 60)
-            
-        except Exception as e:
-            logger.error(f"❌ Check cycle failed: {e}")
-            logger.error("🔧 This error will not stop the scheduler - next check will continue as scheduled")
-            # Don't re-raise the exception to keep scheduler running
+        else:
+            self.cache.clear_checkpoint(CYCLE_CHECKPOINT)
+        return total_processed
+    
+    async def _run_budgeted(self, job: CycleJob, store: BookmarkStore) -> Tuple[int, int]:
+        """
+        Check the most urgent bookmarks until the cycle budget is spent.
+        
+        The whole collection is listed first, then bookmarks are checked in
+        ``check_priority`` order until ``CYCLE_BUDGET_S`` seconds have passed
+        since the cycle started or ``CYCLE_MAX_CHECKS`` checks were made.
+        Bookmarks left over keep their old check time, so they rank among
+        the stalest and go first in the next cycle.
+        
+        Returns:
+            Number of bookmarks checked and number carried over
+        """
+        started = time.monotonic()
+        if settings.CYCLE_BUDGET_S:
+            self._cycle_deadline = started + settings.CYCLE_BUDGET_S
+        
+        page = 1
+        while True:
+            with tracer.span("linkace.list_page", page=page):
+                response = await self.api.list_bookmarks(page)
+            rows = store.extend(response.get('data', []))
+            meta = response.get('meta', {})
+            if not rows or meta.get('current_page', 0) >= meta.get('last_page', 0):
+                break
+            page += 1
+        
+        with tracer.span("cycle.prioritize", bookmarks=len(store)):
+            # One bulk read plus a sort; both run in a worker thread so the
+            # loop keeps serving the API and the watchdog meanwhile
+            order = await asyncio.get_running_loop().run_in_executor(
+                None, lambda: prioritize(store.ids, self.cache.check_states())
+            )
+        if settings.CYCLE_MAX_CHECKS:
+            order = order[:settings.CYCLE_MAX_CHECKS]
+        job.total = len(order)
+        logger.info(
+            "Listed %d bookmarks in %.2fs, checking up to %d within the cycle budget",
+            len(store), time.monotonic() - started, len(order)
+        )
+        
+        # Batches keep the number of pending tasks bounded; hosts alternate
+        # within a batch
+        for i in range(0, len(order), BUDGET_BATCH):
+            if self._draining or time.monotonic() >= self._cycle_deadline:
+                break
+            await self._check_rows(store, store.interleave(order[i:i + BUDGET_BATCH]))
+        
+        checked = job.checked
+        return checked, len(store) - checked
     
-    async def _process_bookmark(self, bookmark: Bookmark):
+    async def _check_rows(self, store: BookmarkStore, rows: List[int]) -> None:
+        """Process ``rows`` concurrently and log any unexpected errors."""
+        tasks = [self._process_bookmark(store, row) for row in rows]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for row, result in zip(rows, results):
+            if isinstance(result, Exception):
+                logger.error("Error processing bookmark %s: %s", store.ids[row], result)
+    
+    async def _process_bookmark(self, store: BookmarkStore, row: int):
         """Process a single bookmark."""
-        async with self.semaphore:
-            start_time = datetime.now()
-            
+        host = store.host(row)
+        with tracer.span("bookmark", sample=True, bookmark_id=store.ids[row], host=host):
+            metrics.CHECKS_WAITING.inc()
             try:
-                # Check URL
-                logger.info(f"Checking URL: {bookmark.url}")
-                result = await self.checker.check_url(bookmark.url)
-                logger.info(f"Check result for {bookmark.url}: {result}")
-                
-                # Update cache
-                status = "dead" if not result.is_alive else "alive"
-                logger.info(f"Setting status for bookmark {bookmark.id} to {status}")
+                with tracer.span("semaphore.wait"):
+                    # Host slot first, so checks queued behind a busy host
+                    # do not hold global slots
+                    await self.host_limiter.acquire(host)
+                    try:
+                        await self.semaphore.acquire()
+                    except BaseException:
+                        self.host_limiter.release(host)
+                        raise
+            finally:
+                metrics.CHECKS_WAITING.dec()
+            try:
+                if self._draining or time.monotonic() >= self._cycle_deadline:
+                    # Shutting down or out of cycle budget; a later cycle checks it
+                    return
+                # Only bookmarks holding a concurrency slot exist as records
+                with self.watchdog.track(bookmark_id=store.ids[row], host=host):
+                    await self._check_bookmark(store.bookmark(row))
+                if self._page_done is not None:
+                    self._page_done.append(store.ids[row])
+            finally:
+                self.semaphore.release()
+                self.host_limiter.release(host)
+    
+    async def _check_bookmark(self, bookmark: Bookmark):
+        """Check one bookmark and record the outcome; runs while holding a concurrency slot."""
+        start_time = time.perf_counter()
+        # Per-bookmark lines are DEBUG except for a LOG_SAMPLE_RATE sample
+        log_level = bookmark_log_level()
+        
+        try:
+            # Check URL
+            metrics.CHECKS_IN_FLIGHT.inc()
+            check_started = time.perf_counter()
+            try:
+                with tracer.span("check") as span:
+                    result = await self.checker.check_url(bookmark.url)
+                    result_class = metrics.classify(result)
+                    span.set_attribute("result", result_class)
+            finally:
+                metrics.CHECKS_IN_FLIGHT.dec()
+            metrics.observe_check(result_class, time.perf_counter() - check_started)
+            if self.autotune is not None:
+                self.autotune.record(result_class)
+            if self.jobs.current is not None:
+                self.jobs.current.record(not result.is_alive)
+            
+            # Update cache
+            status = "dead" if not result.is_alive else "alive"
+            with tracer.span("cache.write"):
+                previous = self.cache.get_status(bookmark.id)
+                transition = self._determine_transition(previous, result)
+                notification = self._record_transition(transition, bookmark, result, log_level) if transition else None
+                # The notification is committed to the outbox together with the status
                 self.cache.update_status(
                     bookmark.id,
                     status,
-                    result.final_url
+                    result.final_url,
+                    notification=notification,
+                    url=bookmark.url
                 )
-                
-                # Determine needed actions
-                actions = self._determine_actions(bookmark, result)
-                
-                # Apply actions
-                if actions:
+            if notification is not None:
+                self.outbox.wake()
+            
+            # Determine needed actions
+            actions = self._determine_actions(bookmark, result)
+            
+            # Apply actions
+            if actions:
+                with tracer.span("linkace.update", actions=",".join(sorted(actions))):
                     await self._apply_actions(bookmark, list(actions))
-                
-                # Convert bookmark data to dict (used for both types of notifications)
-                link_data = {
-                    "id": bookmark.id,
-                    "url": bookmark.url,
-                    "title": getattr(bookmark, 'title', ''),
-                    "last_checked_at": datetime.now().isoformat()
-                }
-                
-                # Convert result to dict (used for both types of notifications)
-                check_result = {
-                    "error": str(result.error) if result.error else None,
-                    "status_code": result.status_code if hasattr(result, 'status_code') else None,
-                    "response_time": 0,  # We'll add this feature later
-                    "final_url": result.final_url if hasattr(result, 'final_url') else None
-                }
-
-                # Send appropriate notification based on link status
-                if "add_dead" in actions:
-                    logger.info(f"Link {bookmark.url} is dead, sending notification...")
-                    await self.notifier.notify_dead_link(link_data, check_result)
-                    logger.info("Dead link notification sent successfully!")
-                elif result.is_alive:
-                    logger.info(f"Link {bookmark.url} is working, sending notification...")
-                    await self.notifier.notify_working_link(link_data, check_result)
-                    logger.info("Working link notification sent successfully!")
-                
-                duration = (datetime.now() - start_time).total_seconds()
-                logger.info(
-                    f"Processed bookmark {bookmark.id} ({bookmark.url}) in {round(duration, 2)}s with actions: {', '.join(actions)}"
-                )
-                
-            except Exception as e:
-                logger.error(
-                    f"Failed to process bookmark {bookmark.id} ({bookmark.url}): {str(e)}"
-                )
+            
+            logger.log(
+                log_level,
+                "Processed bookmark %s (%s) in %.2fs: %s, status %s, actions: %s",
+                bookmark.id, bookmark.url, time.perf_counter() - start_time,
+                status, result.status_code or result.error, ", ".join(actions)
+            )
+            
+        except Exception as e:
+            logger.error("Failed to process bookmark %s (%s): %s", bookmark.id, bookmark.url, e)
+    
+    def _determine_transition(self, previous: Optional[StatusRow], result: CheckResult) -> Optional[str]:
+        """Classify the change since the previous check: dead, restored, redirected or None."""
+        was_dead = previous is not None and previous[0] == "dead"
+        if not result.is_alive:
+            return None if was_dead else "dead"
+        if was_dead:
+            return "restored"
+        if result.redirected and (previous is None or previous[2] != result.final_url):
+            return "redirected"
+        return None
+    
+    def _record_transition(
+        self,
+        transition: str,
+        bookmark: Bookmark,
+        result: CheckResult,
+        log_level: int = logging.INFO
+    ) -> Optional[dict]:
+        """Add a transition to the cycle digest and build its per-link outbox message, if one is sent."""
+        # Fields used by transition_message() and kept in the digest
+        event = {
+            "id": bookmark.id,
+            "url": bookmark.url,
+            "title": bookmark.title,
+            "last_checked": datetime.now().isoformat(),
+            "status_code": result.status_code,
+            "error": str(result.error) if result.error else None,
+            "final_url": result.final_url,
+        }
+        
+        if self._digest is not None:
+            self._digest.add_event(transition, event)
+            if not self._digest.include_links:
+                return None
+        
+        logger.log(log_level, "Link %s is %s, queueing notification", bookmark.url, transition)
+        return transition_message(transition, event)
     
     def _determine_actions(self, bookmark: Bookmark, result: CheckResult) -> Set[str]:
         """Determine what actions to take based on check result."""
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from src.services.linkace_client import LinkAceClient
 from src.services.link_checker import LinkChecker
 from src.services.notification_service import NotificationService
+from src.services.notification_digest import transition_message
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -84,10 +85,16 @@ class LinkMonitoringService:
                         logger.info("Updated link %s as dead", url)
                         
                         # Send notification about dead link
-                        await self.notifier.notify_dead_link(
-                            link_data=next(link for link in links if link['id'] == link_id),
-                            check_result=result
-                        )
+                        link = next(link for link in links if link['id'] == link_id)
+                        await self.notifier.send_batch([transition_message("dead", {
+                            "id": link_id,
+                            "url": url,
+                            "title": link.get('title'),
+                            "last_checked": link.get('last_checked_at'),
+                            "status_code": result.get('status_code'),
+                            "error": result.get('error'),
+                            "final_url": None,
+                        })])
                     except Exception as e:
                         logger.error("Failed to update link %s: %s", url, str(e))
 
@@ -0,0 +1,79 @@
+import json
+from typing import Dict, Any, List
+
+# Transition kinds collected per cycle, with the per-link message type and subject prefix.
+TRANSITIONS = {
+    "dead": ("dead_link", "Dead Link Found"),
+    "restored": ("restored_link", "Link Restored"),
+    "redirected": ("redirected_link", "Link Redirected"),
+}
+
+# Keep digest messages well below the 256 KB SNS message limit.
+MAX_DIGEST_BYTES = 200_000
+
+
+def transition_message(kind: str, event: Dict[str, Any]) -> Dict[str, str]:
+    """Build the per-link SNS entry for one transition."""
+    message_type, subject = TRANSITIONS[kind]
+    return {
+        "Subject": f"{subject}: {event['title'] or event['url']}",
+        "Message": json.dumps({
+            "type": message_type,
+            "link": {k: event[k] for k in ("id", "url", "title", "last_checked")},
+            "check_result": {k: event[k] for k in ("error", "status_code", "final_url")},
+        }),
+    }
+
+
+class NotificationDigest:
+    def __init__(self, include_links: bool = True):
+        """
+        Collect link state transitions over one check cycle.
+
+        Args:
+            include_links: Also send one message per transition in addition
+                to the summary messages
+        """
+        self.include_links = include_links
+        self.events: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in TRANSITIONS}
+
+    def __len__(self) -> int:
+        return sum(len(events) for events in self.events.values())
+
+    def add_event(self, kind: str, event: Dict[str, Any]) -> None:
+        """
+        Record a transition.
+
+        Args:
+            kind: One of "dead", "restored" or "redirected"
+            event: Link and check fields of the transition, as used by
+                ``transition_message``
+        """
+        self.events[kind].append(event)
+
+    def summary_messages(self) -> List[Dict[str, str]]:
+        """
+        Build the cycle summary, split into as many messages as needed to stay
+        under the SNS size limit.
+        """
+        counts = {kind: len(events) for kind, events in self.events.items()}
+        messages = []
+        chunk: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in TRANSITIONS}
+        size = 0
+
+        def emit():
+            body = {"type": "cycle_digest", "counts": counts, "part": len(messages) + 1, **chunk}
+            subject = "Link Check Digest: " + ", ".join(f"{n} {kind}" for kind, n in counts.items())
+            messages.append({"Subject": subject, "Message": json.dumps(body)})
+
+        for kind, events in self.events.items():
+            for event in events:
+                event_size = len(json.dumps(event))
+                if size + event_size > MAX_DIGEST_BYTES and size:
+                    emit()
+                    chunk = {k: [] for k in TRANSITIONS}
+                    size = 0
+                chunk[kind].append(event)
+                size += event_size
+        emit()
+        return messages
@@ -1,129 +1,124 @@
-import boto3
-from typing import Dict, Any
-import json
+import time
+from dataclasses import dataclass
+from typing import List, Optional
 import logging
 
+from src import metrics
+from src.services.notification_sinks import NotificationSink, SNSSink, Entry
+
 logger = logging.getLogger(__name__)
 
+# SNS PublishBatch accepts at most 10 entries per call.
+SNS_BATCH_SIZE = 10
+# Total payload limit of a single PublishBatch call.
+SNS_MAX_BATCH_BYTES = 256 * 1024
+# SNS rejects subjects longer than 100 characters.
+SNS_MAX_SUBJECT = 100
+
+
+@dataclass
+class NotificationMetrics:
+    """Counters describing notification publishing behaviour."""
+    calls: int = 0
+    published: int = 0
+    failed: int = 0
+    latency_total_s: float = 0.0
+    latency_max_s: float = 0.0
+
+    @property
+    def latency_avg_s(self) -> float:
+        return self.latency_total_s / self.calls if self.calls else 0.0
+
+
 class NotificationService:
-    def __init__(self, topic_arn: str, aws_region: str = 'us-east-1'):
+    def __init__(
+        self,
+        topic_arn: str,
+        aws_region: str = 'us-east-1',
+        max_workers: int = 4,
+        sink: Optional[NotificationSink] = None
+    ):
         """
-        Initialize the notification service with AWS SNS.
+        Initialize the notification service.
         
         Args:
             topic_arn: The ARN of the SNS topic to publish to
             aws_region: AWS region where the SNS topic is located
+            max_workers: Threads available for blocking boto3 publish calls
+            sink: Where messages are delivered; defaults to the SNS topic
         """
         self.topic_arn = topic_arn
-        self.sns = boto3.client('sns', region_name=aws_region)
-    
-    async def notify_dead_link(self, link_data: Dict[str, Any], check_result: Dict[str, Any]) -> None:
-        """
-        Send a notification about a dead link.
-        
-        Args:
-            link_data: Information about the link from LinkAce
-            check_result: Results from the link check
-        """
-        try:
-            message = {
-                "type": "dead_link",
-                "link": {
-                    "id": link_data.get("id"),
-                    "url": link_data.get("url"),
-                    "title": link_data.get("title"),
-                    "last_checked": link_data.get("last_checked_at")
-                },
-                "check_result": {
-                    "error": check_result.get("error"),
-                    "status_code": check_result.get("status_code"),
-                    "response_time": check_result.get("response_time")
-                }
-            }
-            
-            # Log the attempt to send notification
-            logger.info(f"Attempting to send notification for dead link: {link_data.get('url')}")
-            logger.info(f"Using SNS topic: {self.topic_arn}")
-            logger.info(f"With region: {self.sns.meta.region_name}")
-            
-            # Send the notification
-            response = self.sns.publish(
-                TopicArn=self.topic_arn,
-                Message=json.dumps(message),
-                Subject=f"Dead Link Found: {link_data.get('title', link_data.get('url'))}"
-            )
-            
-            # Log successful notification
-            logger.info(f"Successfully sent notification. MessageId: {response.get('MessageId')}")
-            
-            logger.info("Sent notification for dead link: %s", link_data.get("url"))
-            
-        except Exception as e:
-            logger.error("Failed to send notification: %s", str(e))
-    
-    async def notify_restored_link(self, link_data: Dict[str, Any]) -> None:
+        self.sink = sink if sink is not None else SNSSink(topic_arn, aws_region, max_workers)
+        self.metrics = NotificationMetrics()
+
+    @property
+    def batch_size(self) -> int:
+        """Largest number of messages sent in one call."""
+        return min(SNS_BATCH_SIZE, self.sink.max_batch_size)
+
+    def batch_len(self, entries: List[Entry]) -> int:
         """
-        Send a notification about a previously dead link that is now working.
-        
-        Args:
-            link_data: Information about the link from LinkAce
+        Number of leading ``entries`` that fit in one call: at most
+        ``batch_size`` messages and 256 KB, counted in UTF-8 bytes as SNS
+        does. Always at least one, so an oversized message still gets
+        sent (and rejected) on its own.
         """
+        size = 0
+        for count, entry in enumerate(entries[:self.batch_size]):
+            size += len(entry["Message"].encode("utf-8")) + len((entry.get("Subject") or "").encode("utf-8"))
+            if count and size > SNS_MAX_BATCH_BYTES:
+                return count
+        return min(len(entries), self.batch_size)
+
+    async def stop(self) -> None:
+        """Close the sink."""
+        await self.sink.close()
+
+    async def _send(self, entries: List[Entry]) -> List[int]:
+        """Deliver one batch through the sink and record its latency."""
+        started = time.perf_counter()
         try:
-            message = {
-                "type": "restored_link",
-                "link": {
-                    "id": link_data.get("id"),
-                    "url": link_data.get("url"),
-                    "title": link_data.get("title"),
-                    "last_checked": link_data.get("last_checked_at")
-                }
-            }
-            
-            # Send the notification
-            self.sns.publish(
-                TopicArn=self.topic_arn,
-                Message=json.dumps(message),
-                Subject=f"Link Restored: {link_data.get('title', link_data.get('url'))}"
-            )
-            
-            logger.info("Sent notification for restored link: %s", link_data.get("url"))
-            
-        except Exception as e:
-            logger.error("Failed to send notification: %s", str(e))
+            failed = await self.sink.send_batch(entries)
+        except Exception:
+            self.metrics.failed += len(entries)
+            metrics.NOTIFY_CALLS.labels("error").inc()
+            metrics.NOTIFY_MESSAGES.labels("failed").inc(len(entries))
             raise
+        else:
+            for i in failed:
+                logger.error("Sink rejected notification: %s", entries[i].get("Subject"))
+            self.metrics.failed += len(failed)
+            self.metrics.published += len(entries) - len(failed)
+            metrics.NOTIFY_CALLS.labels("ok").inc()
+            metrics.NOTIFY_MESSAGES.labels("published").inc(len(entries) - len(failed))
+            if failed:
+                metrics.NOTIFY_MESSAGES.labels("failed").inc(len(failed))
+            return failed
+        finally:
+            latency = time.perf_counter() - started
+            metrics.NOTIFY_DURATION.observe(latency)
+            self.metrics.calls += 1
+            self.metrics.latency_total_s += latency
+            self.metrics.latency_max_s = max(self.metrics.latency_max_s, latency)
+
+    @staticmethod
+    def _entry(message: str, subject: Optional[str] = None) -> Entry:
+        entry = {"Message": message}
+        if subject:
+            entry["Subject"] = subject[:SNS_MAX_SUBJECT]
+        return entry
 
-    async def notify_working_link(self, link_data: Dict[str, Any], check_result: Dict[str, Any]) -> None:
+    async def send_batch(self, entries: List[Entry]) -> List[int]:
         """
-        Send a notification about a working link.
+        Publish up to 10 messages in one call and wait for the result.
         
         Args:
-            link_data: Information about the link from LinkAce
-            check_result: Results from the link check
-        """
-        try:
-            message = {
-                "type": "working_link",
-                "link": {
-                    "id": link_data.get("id"),
-                    "url": link_data.get("url"),
-                    "title": link_data.get("title"),
-                    "last_checked": link_data.get("last_checked_at")
-                },
-                "check_result": {
-                    "status_code": check_result.get("status_code"),
-                    "response_time": check_result.get("response_time"),
-                    "final_url": check_result.get("final_url")
-                }
-            }
+            entries: Dicts with a ``Message`` and optional ``Subject``
             
-            self.sns.publish(
-                TopicArn=self.topic_arn,
-                Message=json.dumps(message),
-                Subject=f"Link Check Successful: {link_data.get('title', link_data.get('url'))}"
-            )
-            
-            logger.info("Sent notification for working link: %s", link_data.get("url"))
-            
-        except Exception as e:
-            logger.error("Failed to send working link notification: %s", str(e))
-            raise
\ No newline at end of file
+        Returns:
+            Indexes into ``entries`` of the messages that were not accepted
+        """
+        return await self._send([
+            self._entry(entry["Message"], entry.get("Subject"))
+            for entry in entries[:self.batch_size]
+        ])
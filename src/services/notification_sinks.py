@@ -0,0 +1,240 @@
+import asyncio
+import json
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+# Messages handed to a sink are dicts with a "Message" and an optional "Subject".
+Entry = Dict[str, str]
+
+
+class ThrottlingError(Exception):
+    """Raised by a sink when the destination asks the caller to slow down."""
+
+
+class NotificationSink(ABC):
+    """Destination for notification messages."""
+
+    # Largest number of entries accepted by one send_batch call
+    max_batch_size = 10
+
+    @abstractmethod
+    async def send_batch(self, entries: List[Entry]) -> List[int]:
+        """
+        Deliver up to ``max_batch_size`` messages.
+
+        Args:
+            entries: Messages to deliver
+
+        Returns:
+            Indexes into ``entries`` of the messages that were rejected
+
+        Raises:
+            Exception: If the whole batch could not be delivered
+        """
+
+    async def close(self) -> None:
+        """Release connections, threads or files held by the sink."""
+
+
+class SNSSink(NotificationSink):
+    def __init__(self, topic_arn: str, aws_region: str = 'us-east-1', max_workers: int = 4):
+        """
+        Publish to an AWS SNS topic.
+
+        boto3 is blocking, so calls run on a bounded thread pool. It is
+        also slow to import, so the client is created on the first publish.
+
+        Args:
+            topic_arn: The ARN of the SNS topic to publish to
+            aws_region: AWS region where the SNS topic is located
+            max_workers: Threads available for blocking boto3 calls
+        """
+        self.topic_arn = topic_arn
+        self.aws_region = aws_region
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sns-publish")
+
+    @property
+    def client(self):
+        """boto3 SNS client, created on first access (usually on a publish thread)."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import boto3
+                    self._client = boto3.client('sns', region_name=self.aws_region)
+        return self._client
+
+    @client.setter
+    def client(self, client) -> None:
+        self._client = client
+
+    def __repr__(self) -> str:
+        return f"SNSSink({self.topic_arn!r}, region={self.aws_region!r})"
+
+    def _call(self, entries: List[Entry]) -> List[int]:
+        if len(entries) == 1:
+            self.client.publish(TopicArn=self.topic_arn, **entries[0])
+            return []
+        response = self.client.publish_batch(
+            TopicArn=self.topic_arn,
+            PublishBatchRequestEntries=[dict(entry, Id=str(i)) for i, entry in enumerate(entries)]
+        )
+        return [int(failed["Id"]) for failed in response.get("Failed") or []]
+
+    async def send_batch(self, entries: List[Entry]) -> List[int]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, entries)
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+class WebhookSink(NotificationSink):
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+        max_connections: int = 10
+    ):
+        """
+        POST messages as JSON to an HTTP endpoint.
+
+        Each batch is one request with body ``{"messages": [...]}``; any
+        non-2xx response fails the whole batch.
+
+        Args:
+            url: Endpoint receiving the notifications
+            headers: Extra request headers, e.g. authentication
+            timeout: Request timeout in seconds
+            max_connections: Size of the pooled connection limit
+        """
+        self.url = url
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        )
+
+    def __repr__(self) -> str:
+        return f"WebhookSink({self.url!r})"
+
+    async def send_batch(self, entries: List[Entry]) -> List[int]:
+        response = await self._client.post(self.url, json={"messages": entries})
+        if response.status_code == 429:
+            raise ThrottlingError(f"Webhook throttled: HTTP {response.status_code}")
+        response.raise_for_status()
+        return []
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class FileSink(NotificationSink):
+    def __init__(self, path: str):
+        """
+        Append messages to a JSON Lines file, one object per message.
+
+        Args:
+            path: File to append to; parent directories are created
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def __repr__(self) -> str:
+        return f"FileSink({str(self.path)!r})"
+
+    async def send_batch(self, entries: List[Entry]) -> List[int]:
+        sent_at = datetime.now(timezone.utc).isoformat()
+        self._file.write("".join(
+            json.dumps({"sent_at": sent_at, **entry}) + "\n" for entry in entries
+        ))
+        self._file.flush()
+        return []
+
+    async def close(self) -> None:
+        self._file.close()
+
+
+class FakeSNSSink(NotificationSink):
+    def __init__(
+        self,
+        latency: float = 0.0,
+        throttle_rate: float = 0.0,
+        max_calls_per_second: Optional[float] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        In-process stand-in for SNS for tests and offline benchmarks.
+
+        Records every call and can simulate network latency and AWS
+        throttling, either randomly or as a calls-per-second limit.
+
+        Args:
+            latency: Seconds each call takes
+            throttle_rate: Probability that a call is throttled
+            max_calls_per_second: Throttle calls beyond this rate, like the SNS API quota
+            seed: Seed for the throttling random generator
+        """
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.max_calls_per_second = max_calls_per_second
+        self.calls: List[List[Entry]] = []
+        self.throttled = 0
+        self._random = random.Random(seed)
+        self._window_start = 0.0
+        self._window_calls = 0
+
+    def __repr__(self) -> str:
+        return f"FakeSNSSink(latency={self.latency}, throttle_rate={self.throttle_rate})"
+
+    @property
+    def messages(self) -> List[Entry]:
+        """Every message accepted so far, in order."""
+        return [entry for call in self.calls for entry in call]
+
+    def _over_quota(self) -> bool:
+        if self.max_calls_per_second is None:
+            return False
+        now = time.monotonic()
+        if now - self._window_start >= 1.0:
+            self._window_start, self._window_calls = now, 0
+        self._window_calls += 1
+        return self._window_calls > self.max_calls_per_second
+
+    async def send_batch(self, entries: List[Entry]) -> List[int]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._over_quota() or self._random.random() < self.throttle_rate:
+            self.throttled += 1
+            raise ThrottlingError("Rate exceeded")
+        self.calls.append(list(entries))
+        return []
+
+
+def create_sink(kind: Optional[str] = None) -> NotificationSink:
+    """Build the notification sink selected by ``NOTIFY_SINK``."""
+    from ..config import settings
+
+    kind = (kind or settings.NOTIFY_SINK).lower()
+    if kind == "sns":
+        return SNSSink(settings.AWS_SNS_TOPIC_ARN, settings.AWS_REGION, settings.SNS_PUBLISH_WORKERS)
+    if kind == "webhook":
+        if not settings.WEBHOOK_URL:
+            raise ValueError("WEBHOOK_URL must be set when NOTIFY_SINK=webhook")
+        return WebhookSink(settings.WEBHOOK_URL)
+    if kind == "file":
+        return FileSink(settings.NOTIFY_FILE_PATH)
+    if kind == "fake":
+        return FakeSNSSink()
+    raise ValueError(f"Unknown notification sink: {kind!r} (expected sns, webhook, file or fake)")
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Optional
+
+from src import metrics
+from src.cache.base import CacheBackend
+from src.services.notification_service import NotificationService
+from src.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxSender:
+    def __init__(
+        self,
+        cache: CacheBackend,
+        notifier: NotificationService,
+        poll_interval: float = 5.0,
+        base_backoff: float = 2.0,
+        max_backoff: float = 300.0,
+        max_attempts: int = 20
+    ):
+        """
+        Background task that drains the notification outbox.
+
+        Notifications are committed to the outbox together with the status
+        change they describe, so checks never wait for SNS and nothing is
+        lost if SNS is down or the process restarts. The sender publishes
+        them in PublishBatch groups of 10 and retries failures with
+        exponential backoff. After ``max_attempts`` failed deliveries a
+        notification is moved to the outbox dead letters and logged.
+
+        Args:
+            cache: Cache backend holding the outbox
+            notifier: Service used to publish the messages
+            poll_interval: Seconds between outbox polls when not woken explicitly
+            base_backoff: Delay in seconds before the first retry
+            max_backoff: Upper bound for the retry delay in seconds
+            max_attempts: Failed deliveries before a notification is given up on
+        """
+        self.cache = cache
+        self.notifier = notifier
+        self.poll_interval = poll_interval
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_attempts = max_attempts
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        # Delay before polling again after SNS itself failed
+        self._pause = 0.0
+
+    def backoff(self, attempts: int) -> float:
+        """Retry delay after ``attempts`` failed attempts, with jitter."""
+        delay = min(self.max_backoff, self.base_backoff * (2 ** attempts))
+        return delay * random.uniform(0.5, 1.0)
+
+    def wake(self) -> None:
+        """Ask the sender to look at the outbox now instead of at the next poll."""
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the background sender task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="outbox-sender")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Make a last attempt to deliver pending notifications, then stop.
+
+        Whatever is still undelivered stays in the outbox for the next start.
+
+        Args:
+            timeout: Seconds to spend on the final drain
+        """
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            await asyncio.wait_for(self.drain(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Outbox not fully drained on shutdown, %d pending", self.cache.outbox_size())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.drain()
+            except Exception as e:
+                logger.error("Outbox sender error: %s", str(e))
+            timeout = self._pause or self.poll_interval
+            self._pause = 0.0
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def drain(self) -> int:
+        """
+        Send every notification that is currently due.
+
+        Returns:
+            Number of notifications delivered
+        """
+        delivered = 0
+        while True:
+            entries = self.cache.fetch_outbox(self.notifier.batch_size)
+            if not entries:
+                return delivered
+            # The rest stays due and leads the next batch
+            entries = entries[:self.notifier.batch_len([payload for _, payload, _ in entries])]
+            error = "Rejected by sink"
+            try:
+                with tracer.span("notify.publish", sample=True, messages=len(entries)):
+                    failed = set(await self.notifier.send_batch([payload for _, payload, _ in entries]))
+            except Exception as e:
+                # Sink unavailable or throttling: defer the whole batch and back off
+                logger.warning("Outbox batch failed, retrying later: %s", str(e))
+                error = str(e)
+                failed = set(range(len(entries)))
+                self._pause = self.backoff(min(attempts for _, _, attempts in entries))
+
+            now = time.time()
+            retries, given_up = [], []
+            for i, (entry_id, payload, attempts) in enumerate(entries):
+                if i not in failed:
+                    continue
+                if attempts + 1 >= self.max_attempts:
+                    logger.error(
+                        "Giving up on notification after %d attempts: %s (%s)",
+                        attempts + 1, payload.get("Subject"), error
+                    )
+                    given_up.append((entry_id, error))
+                else:
+                    retries.append((entry_id, now + self.backoff(attempts)))
+            self.cache.ack_outbox(
+                entry_id for i, (entry_id, _, _) in enumerate(entries) if i not in failed
+            )
+            self.cache.retry_outbox(retries)
+            if given_up:
+                self.cache.dead_letter_outbox(given_up)
+                metrics.NOTIFY_MESSAGES.labels("dead_lettered").inc(len(given_up))
+            if len(failed) < len(entries):
+                logger.debug("Sent %d notifications", len(entries) - len(failed))
+            delivered += len(entries) - len(failed)
+            if self._pause:
+                return delivered
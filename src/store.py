@@ -0,0 +1,135 @@
+"""Columnar in-memory store for the bookmarks of one check cycle.
+
+Rows are appended as listing pages arrive. Each column is a flat
+``array`` rather than a list of objects:
+
+- bookmark IDs
+- host and tag references into interned name tables
+- URLs and titles as offsets into one UTF-8 buffer each
+
+A host -> rows index lets the scheduler group and interleave work by host.
+The checker reads a row's URL directly. A ``Bookmark`` record is only
+built while a row is being checked.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .cache.base import host_of
+from .models import Bookmark, tag_names
+
+
+class InternTable:
+    """Bidirectional name <-> small integer mapping."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, ref: int) -> str:
+        return self.names[ref]
+
+    def intern(self, name: str) -> int:
+        ref = self._index.get(name)
+        if ref is None:
+            ref = self._index[name] = len(self.names)
+            self.names.append(name)
+        return ref
+
+    def get(self, name: str) -> Optional[int]:
+        return self._index.get(name)
+
+
+class BookmarkStore:
+    """Append-only columnar table of bookmarks, built from LinkAce listing entries."""
+
+    def __init__(self):
+        self.ids = array("q")
+        self.host_refs = array("I")
+        self.hosts = InternTable()
+        self.tags = InternTable()
+        self._url_offsets = array("Q", [0])
+        self._urls = bytearray()
+        self._title_offsets = array("Q", [0])
+        self._titles = bytearray()
+        self._tag_offsets = array("Q", [0])
+        self._tag_refs = array("I")
+        self._host_rows: Dict[int, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, data: Dict[str, Any]) -> int:
+        """Add one listing entry and return its row number."""
+        row = len(self.ids)
+        url = data['url']
+        self.ids.append(int(data['id']))
+        self._urls += url.encode()
+        self._url_offsets.append(len(self._urls))
+        self._titles += (data.get('title') or '').encode()
+        self._title_offsets.append(len(self._titles))
+        self._tag_refs.extend(self.tags.intern(name) for name in tag_names(data))
+        self._tag_offsets.append(len(self._tag_refs))
+
+        host_ref = self.hosts.intern(host_of(url) or "")
+        self.host_refs.append(host_ref)
+        rows = self._host_rows.get(host_ref)
+        if rows is None:
+            rows = self._host_rows[host_ref] = array("I")
+        rows.append(row)
+        return row
+
+    def extend(self, entries: Iterable[Dict[str, Any]]) -> range:
+        """Add one listing page and return the range of rows it became."""
+        start = len(self.ids)
+        for data in entries:
+            self.append(data)
+        return range(start, len(self.ids))
+
+    def url(self, row: int) -> str:
+        return self._urls[self._url_offsets[row]:self._url_offsets[row + 1]].decode()
+
+    def title(self, row: int) -> str:
+        return self._titles[self._title_offsets[row]:self._title_offsets[row + 1]].decode()
+
+    def host(self, row: int) -> str:
+        return self.hosts[self.host_refs[row]]
+
+    def row_tags(self, row: int) -> List[str]:
+        names = self.tags.names
+        return [names[ref] for ref in self._tag_refs[self._tag_offsets[row]:self._tag_offsets[row + 1]]]
+
+    def rows_for_host(self, host: str) -> Sequence[int]:
+        """Rows whose URL is on ``host``, in insertion order."""
+        ref = self.hosts.get(host)
+        return self._host_rows.get(ref, array("I")) if ref is not None else array("I")
+
+    def host_counts(self) -> Dict[str, int]:
+        return {self.hosts[ref]: len(rows) for ref, rows in self._host_rows.items()}
+
+    def interleave(self, rows: Iterable[int]) -> List[int]:
+        """
+        Order ``rows`` round-robin across hosts, so that consecutive checks
+        go to different hosts instead of one host's bookmarks back to back.
+        """
+        by_host: Dict[int, List[int]] = {}
+        for row in rows:
+            by_host.setdefault(self.host_refs[row], []).append(row)
+        queues = list(by_host.values())
+        ordered = []
+        for i in range(max(map(len, queues), default=0)):
+            ordered.extend(queue[i] for queue in queues if i < len(queue))
+        return ordered
+
+    def bookmark(self, row: int) -> Bookmark:
+        """Materialize one row as a ``Bookmark`` record."""
+        return Bookmark(str(self.ids[row]), self.url(row), tuple(self.row_tags(row)), self.title(row))
+
+    def nbytes(self) -> int:
+        """Approximate size of the columns and buffers, excluding the name tables."""
+        columns = (self.ids, self.host_refs, self._url_offsets, self._title_offsets, self._tag_offsets, self._tag_refs)
+        index = sum(rows.itemsize * len(rows) for rows in self._host_rows.values())
+        return sum(c.itemsize * len(c) for c in columns) + len(self._urls) + len(self._titles) + index
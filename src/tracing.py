@@ -0,0 +1,308 @@
+"""Lightweight tracing of check cycle stages.
+
+Spans are kept in memory and exported in the OTLP/JSON encoding, either
+appended to a file (one ``TracesData`` object per line, as written by the
+OpenTelemetry Collector file exporter) or POSTed to an OTLP/HTTP
+``/v1/traces`` endpoint. The OpenTelemetry SDK is not required.
+
+A span started with ``sample=True`` makes a new sampling decision at
+``sample_rate``; every other span follows its parent. Spans below an
+unsampled parent are empty placeholders that only carry the decision
+down, and while tracing is disabled every span is one shared no-op
+object, so instrumented code pays little more than a method call.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "linkace-sentry"
+
+# OTLP span status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """One timed operation. Use as a context manager."""
+
+    __slots__ = ("tracer", "name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns",
+                 "attributes", "error", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, trace_id: str, parent_id: Optional[str],
+                 attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self._token = _current.set(self)
+        self.start_ns = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.time_ns()
+        _current.reset(self._token)
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        self.tracer._finish(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": STATUS_ERROR, "message": self.error} if self.error else {"code": STATUS_OK},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class _NoopSpan:
+    """Stand-in for spans that are not recorded."""
+
+    __slots__ = ("_token",)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current.reset(self._token)
+
+
+class _DisabledSpan:
+    """Returned while tracing is off; does not even touch the context."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_DisabledSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_DISABLED = _DisabledSpan()
+_current: ContextVar[Any] = ContextVar("linkace_sentry_span", default=None)
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+class SpanExporter(ABC):
+    """Destination for finished spans."""
+
+    @abstractmethod
+    async def export(self, spans: List[Span]) -> None:
+        """Send one batch of finished spans."""
+
+    async def close(self) -> None:
+        pass
+
+
+def otlp_payload(spans: List[Span]) -> Dict[str, Any]:
+    """Encode spans as an OTLP/JSON ``TracesData`` object."""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_attribute("service.name", SERVICE_NAME)]},
+            "scopeSpans": [{
+                "scope": {"name": SERVICE_NAME},
+                "spans": [span.to_otlp() for span in spans],
+            }],
+        }]
+    }
+
+
+class FileSpanExporter(SpanExporter):
+    def __init__(self, path: str):
+        """
+        Append spans to a file, one OTLP/JSON object per export.
+
+        Args:
+            path: File to append to; parent directories are created
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _write(self, spans: List[Span]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(otlp_payload(spans)) + "\n")
+
+    async def export(self, spans: List[Span]) -> None:
+        # Encoding a full cycle's spans takes a while; keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self._write, spans)
+
+
+class OTLPHTTPSpanExporter(SpanExporter):
+    def __init__(self, endpoint: str, timeout: float = 10.0):
+        """
+        POST spans as OTLP/JSON to a collector.
+
+        Args:
+            endpoint: Full traces URL, e.g. ``http://localhost:4318/v1/traces``
+            timeout: Request timeout in seconds
+        """
+        self.endpoint = endpoint
+        self._client = httpx.AsyncClient(timeout=timeout)
+
+    async def export(self, spans: List[Span]) -> None:
+        response = await self._client.post(self.endpoint, json=otlp_payload(spans))
+        response.raise_for_status()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class Tracer:
+    def __init__(
+        self,
+        exporter: Optional[SpanExporter] = None,
+        sample_rate: float = 1.0,
+        max_buffered: int = 50_000
+    ):
+        """
+        Record spans and hand them to ``exporter`` on ``flush()``.
+
+        Once half of ``max_buffered`` spans are waiting they are exported in
+        the background, so long cycles are sent in batches instead of
+        overflowing the buffer before the cycle-end flush.
+
+        Args:
+            exporter: Where finished spans go; ``None`` disables tracing
+            sample_rate: Probability that a ``sample=True`` span is recorded
+            max_buffered: Finished spans kept between flushes; more are
+                dropped, except root spans, which are always kept
+        """
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.max_buffered = max_buffered
+        self.dropped = 0
+        self._buffer: List[Span] = []
+        self._exporting: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def span(self, name: str, sample: bool = False, **attributes: Any):
+        """
+        Start a span as a child of the current one.
+
+        Args:
+            name: Stage name, e.g. ``check`` or ``linkace.update``
+            sample: Make a fresh sampling decision instead of following the parent
+            **attributes: Span attributes, e.g. ``bookmark_id`` and ``host``
+        """
+        if self.exporter is None:
+            return _DISABLED
+        parent = _current.get()
+        if sample:
+            if random.random() >= self.sample_rate:
+                return _NoopSpan()
+        elif isinstance(parent, _NoopSpan):
+            return _NoopSpan()
+        if isinstance(parent, Span):
+            return Span(self, name, parent.trace_id, parent.span_id, attributes)
+        return Span(self, name, os.urandom(16).hex(), None, attributes)
+
+    def _finish(self, span: Span) -> None:
+        # A root span (e.g. ``cycle``) holds its trace together; never drop it
+        if len(self._buffer) >= self.max_buffered and span.parent_id is not None:
+            self.dropped += 1
+            return
+        self._buffer.append(span)
+        if len(self._buffer) >= self.max_buffered // 2 and (self._exporting is None or self._exporting.done()):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            spans, self._buffer = self._buffer, []
+            self._exporting = loop.create_task(self._export(spans))
+
+    async def _export(self, spans: List[Span]) -> None:
+        try:
+            await self.exporter.export(spans)
+        except Exception as e:
+            logger.warning("Span export failed, %d spans lost: %s", len(spans), str(e))
+
+    async def flush(self) -> None:
+        """Wait for a background export, then export every span finished since."""
+        exporting, self._exporting = self._exporting, None
+        if exporting is not None:
+            await exporting
+        if not self._buffer or self.exporter is None:
+            return
+        spans, self._buffer = self._buffer, []
+        await self._export(spans)
+        if self.dropped:
+            logger.warning("Tracing buffer full, %d spans dropped", self.dropped)
+            self.dropped = 0
+
+    async def close(self) -> None:
+        await self.flush()
+        if self.exporter is not None:
+            await self.exporter.close()
+
+
+# Process-wide tracer, disabled until ``configure`` is called
+tracer = Tracer()
+
+
+def configure(export: Optional[str] = None, sample_rate: Optional[float] = None) -> Tracer:
+    """Set up the process-wide tracer from ``TRACE_EXPORT`` and ``TRACE_SAMPLE_RATE``."""
+    from .config import settings
+
+    export = (export or settings.TRACE_EXPORT).lower()
+    if export == "none":
+        exporter = None
+    elif export == "file":
+        exporter = FileSpanExporter(settings.TRACE_FILE_PATH)
+    elif export == "otlp":
+        exporter = OTLPHTTPSpanExporter(settings.TRACE_OTLP_ENDPOINT)
+    else:
+        raise ValueError(f"Unknown trace export: {export!r} (expected none, file or otlp)")
+
+    tracer.exporter = exporter
+    tracer.sample_rate = settings.TRACE_SAMPLE_RATE if sample_rate is None else sample_rate
+    return tracer
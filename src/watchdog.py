@@ -0,0 +1,91 @@
+"""Watchdog for tasks that run far longer than they should.
+
+Work is registered with ``TaskWatchdog.track()`` while it runs. A
+background task scans the registrations and, once per tracked task, logs
+any that exceed the threshold together with the task's suspended stack,
+which shows what it is waiting on. Stuck tasks are counted in metrics.
+"""
+
+import asyncio
+import logging
+import time
+import traceback
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class TaskWatchdog:
+    def __init__(self, threshold: float, interval: Optional[float] = None):
+        """
+        Report tracked tasks running longer than ``threshold`` seconds.
+
+        Args:
+            threshold: Seconds after which a tracked task counts as stuck
+            interval: Seconds between scans, default a quarter of the threshold
+        """
+        self.threshold = threshold
+        self.interval = interval or max(threshold / 4, 0.01)
+        self.stuck_total = 0
+        # task -> [started, info, reported]
+        self._tracked: Dict[asyncio.Task, List[Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def stuck(self) -> int:
+        """Tracked tasks currently over the threshold."""
+        cutoff = time.monotonic() - self.threshold
+        return sum(1 for started, _, _ in self._tracked.values() if started < cutoff)
+
+    @contextmanager
+    def track(self, **info):
+        """Watch the current task until the block exits; ``info`` is logged if it gets stuck."""
+        task = asyncio.current_task()
+        self._tracked[task] = [time.monotonic(), info, False]
+        try:
+            yield
+        finally:
+            del self._tracked[task]
+
+    def scan(self, now: Optional[float] = None) -> int:
+        """Report newly stuck tasks and return how many there were."""
+        cutoff = (time.monotonic() if now is None else now) - self.threshold
+        found = 0
+        for task, entry in list(self._tracked.items()):
+            started, info, reported = entry
+            if reported or started >= cutoff:
+                continue
+            entry[2] = True
+            found += 1
+            frames = task.get_stack(limit=20)
+            stack = "".join(traceback.format_list(
+                traceback.StackSummary.extract((frame, frame.f_lineno) for frame in frames)
+            ))
+            logger.warning(
+                "Task %s stuck for %.0fs (%s), waiting at:\n%s",
+                task.get_name(), cutoff + self.threshold - started,
+                ", ".join(f"{k}={v}" for k, v in info.items()), stack,
+                extra=info
+            )
+        if found:
+            self.stuck_total += found
+            metrics.STUCK_CHECKS.inc(found)
+        return found
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.scan()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="task-watchdog")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
@@ -1,5 +1,6 @@
 import asyncio
 from src.services.notification_service import NotificationService
+from src.services.notification_digest import transition_message
 import os
 import boto3
 from dotenv import load_dotenv
@@ -46,9 +47,16 @@ async def test_notification():
     # Send test notification
     print("Sending test notification...")
     try:
-        response = await notifier.notify_dead_link(test_link, test_result)
+        failed = await notifier.send_batch([transition_message("dead", {
+            **test_link,
+            "last_checked": test_link["last_checked_at"],
+            "status_code": test_result["status_code"],
+            "error": test_result["error"],
+            "final_url": None,
+        })])
+        if failed:
+            raise RuntimeError("SNS rejected the test notification")
         print(f"Test notification sent successfully!")
-        print(f"SNS Response: {response}")
     except Exception as e:
         print(f"Error sending notification: {str(e)}")
         raise
@@ -0,0 +1,226 @@
+"""Tests for the embedded control plane API."""
+import asyncio
+import json
+import time
+import httpx
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock
+from src.api.app import create_app
+from src.config import settings
+from src.models import CheckResult
+from src.service import LinkAceSentry
+
+ADMIN = {"Authorization": f"Bearer {settings.ADMIN_TOKEN}"}
+
+
+@pytest.fixture
+def sentry(monkeypatch):
+    """Create a service with in-memory cache and fake notification sink."""
+    monkeypatch.setattr(settings, "CACHE_BACKEND", "memory")
+    monkeypatch.setattr(settings, "NOTIFY_SINK", "fake")
+    return LinkAceSentry()
+
+
+@pytest_asyncio.fixture
+async def client(sentry):
+    """HTTP client talking to the app in-process, on the test's event loop."""
+    sentry.scheduler.start()
+    transport = httpx.ASGITransport(app=create_app(sentry))
+    async with httpx.AsyncClient(transport=transport, base_url="http://sentry") as client:
+        yield client
+    await sentry.stop()
+
+
+@pytest.mark.asyncio
+async def test_healthz_reports_last_cycle_age(sentry, client):
+    """Health turns 503 once the last cycle is older than twice the interval."""
+    response = await client.get("/healthz")
+    assert response.status_code == 200
+    assert response.json()["scheduler_running"] is True
+
+    sentry.last_cycle_started = sentry.last_cycle_ended = time.time() - 3 * 60 * settings.CHECK_INTERVAL_MIN
+    response = await client.get("/healthz")
+    assert response.status_code == 503
+    assert response.json()["last_cycle_age_s"] > response.json()["max_cycle_age_s"]
+
+
+@pytest.mark.asyncio
+async def test_run_once_starts_job_and_streams_progress(sentry, client, monkeypatch):
+    """Manual cycles need the admin token, join a running cycle and stream progress."""
+    monkeypatch.setattr(settings, "PROGRESS_INTERVAL_S", 0.01)
+    release = asyncio.Event()
+
+    async def list_bookmarks(page=1):
+        data = [{"id": i, "url": f"https://example.com/{i}", "title": str(i)} for i in range(3)]
+        return {"data": data, "meta": {"current_page": 1, "last_page": 1, "total": 3}}
+
+    async def check_url(url):
+        await release.wait()
+        return CheckResult(is_alive=not url.endswith("/2"), status_code=200)
+
+    monkeypatch.setattr(sentry.api, "list_bookmarks", list_bookmarks)
+    monkeypatch.setattr(sentry.checker, "check_url", check_url)
+    monkeypatch.setattr(sentry, "_apply_actions", AsyncMock())
+
+    assert (await client.post("/run-once")).status_code == 401
+    started = await client.post("/run-once", headers=ADMIN)
+    assert started.status_code == 202
+    joined = await client.post("/run-once", headers=ADMIN)
+    assert joined.status_code == 200
+    assert joined.json()["joined"] is True
+    assert joined.json()["job_id"] == started.json()["job_id"]
+
+    asyncio.get_running_loop().call_later(0.05, release.set)
+    events = []
+    async with client.stream("GET", started.json()["events"]) as response:
+        async for line in response.aiter_lines():
+            if line.startswith("data: "):
+                events.append(json.loads(line[6:]))
+
+    assert events[-1]["state"] == "finished"
+    assert (events[-1]["checked"], events[-1]["dead"], events[-1]["remaining"]) == (3, 1, 0)
+    assert (await client.get(f"/jobs/{started.json()['job_id']}")).json()["checked"] == 3
+
+
+@pytest.mark.asyncio
+async def test_check_coalesces_and_caches(sentry, client):
+    """Concurrent requests for one URL share a check; later ones hit the cache."""
+    calls = []
+
+    async def check_url(url):
+        calls.append(url)
+        await asyncio.sleep(0.02)
+        return CheckResult(is_alive=True, status_code=200, final_url=url)
+    sentry.checker.check_url = check_url
+
+    responses = await asyncio.gather(*(
+        client.get("/check", params={"url": "https://example.com/"}, headers=ADMIN) for _ in range(5)
+    ))
+    assert [r.status_code for r in responses] == [200] * 5
+    assert calls == ["https://example.com/"]
+    assert not any(r.json()["cached"] for r in responses)
+
+    again = await client.get("/check", params={"url": "https://example.com/"}, headers=ADMIN)
+    assert again.json()["cached"] is True
+    assert again.json()["is_alive"] is True
+    assert len(calls) == 1
+
+    assert (await client.get("/check", params={"url": "ftp://example.com/"}, headers=ADMIN)).status_code == 422
+    # Fetching arbitrary URLs is an admin operation
+    assert (await client.get("/check", params={"url": "http://169.254.169.254/"})).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_check_rate_limited_per_client(sentry, monkeypatch):
+    """A client exceeding its burst gets 429 with Retry-After."""
+    monkeypatch.setattr(settings, "CHECK_RATE_BURST", 2)
+    sentry.checker.check_url = AsyncMock(return_value=CheckResult(is_alive=True, status_code=200))
+    transport = httpx.ASGITransport(app=create_app(sentry))
+    async with httpx.AsyncClient(transport=transport, base_url="http://sentry") as client:
+        statuses = [
+            (await client.get("/check", params={"url": "https://example.com/"}, headers=ADMIN)).status_code
+            for _ in range(3)
+        ]
+        assert statuses == [200, 200, 429]
+        limited = await client.get("/check", params={"url": "https://example.com/"}, headers=ADMIN)
+        assert int(limited.headers["Retry-After"]) >= 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_check_streams_ndjson_with_bounded_concurrency(sentry, client, monkeypatch):
+    """Bulk results stream back as NDJSON without exceeding BULK_CONCURRENCY."""
+    monkeypatch.setattr(settings, "BULK_CONCURRENCY", 3)
+    in_flight = []
+    peak = []
+
+    async def check_url(url):
+        in_flight.append(url)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.001)
+        in_flight.remove(url)
+        return CheckResult(is_alive=True, status_code=200, final_url=url)
+    sentry.checker.check_url = check_url
+
+    async def body():
+        for i in range(50):
+            yield (json.dumps({"id": i, "url": f"https://example.com/{i}"}) + "\n").encode()
+        yield b'"not a url"\n{broken\n'
+
+    response = await client.post("/check/bulk", content=body(), headers=ADMIN)
+    results = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert len(results) == 52
+    assert max(peak) == 3
+    assert sorted(r["id"] for r in results if "id" in r) == list(range(50))
+    assert {r["index"]: r["error"] for r in results if "is_alive" not in r} == {
+        50: "url must be an absolute http(s) URL",
+        51: "Invalid JSON",
+    }
+
+
+@pytest.mark.asyncio
+async def test_bookmark_query_uses_etag(sentry, client):
+    """Status queries need the admin token, page by cursor and answer 304 until the page changes."""
+    for i in range(3):
+        sentry.cache.update_status(str(i), "dead", url=f"https://example.com/{i}")
+    query = {"status": "dead", "limit": 2}
+
+    assert (await client.get("/bookmarks", params=query)).status_code == 401
+    assert (await client.get("/bookmarks/0")).status_code == 401
+
+    page = await client.get("/bookmarks", params=query, headers=ADMIN)
+    assert [item["id"] for item in page.json()["items"]] == ["0", "1"]
+    etag = page.headers["ETag"]
+
+    rest = await client.get("/bookmarks", params={"status": "dead", "cursor": page.json()["next_cursor"]}, headers=ADMIN)
+    assert [item["id"] for item in rest.json()["items"]] == ["2"]
+    assert rest.json()["next_cursor"] is None
+
+    # Checks of bookmarks outside the page leave its ETag alone
+    sentry.cache.update_status("7", "alive")
+    unchanged = await client.get("/bookmarks", params=query, headers={**ADMIN, "If-None-Match": etag})
+    assert unchanged.status_code == 304
+
+    sentry.cache.update_status("0", "alive")
+    changed = await client.get("/bookmarks", params=query, headers={**ADMIN, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert [item["id"] for item in changed.json()["items"]] == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_config_endpoint_resizes_limits(client, sentry, monkeypatch):
+    """PATCH /config applies new limits to the running service."""
+    for name in ("CONCURRENCY", "HOST_CONCURRENCY", "request_timeout_s", "CHECK_INTERVAL_MIN"):
+        monkeypatch.setattr(settings, name, getattr(settings, name))
+
+    response = await client.patch("/config", json={"CONCURRENCY": 3, "HOST_CONCURRENCY": 2}, headers=ADMIN)
+    assert response.status_code == 200
+    assert response.json()["changed"]["CONCURRENCY"]["new"] == 3
+    assert sentry.semaphore.limit == 3
+    assert sentry.host_limiter.limit == 2
+
+    assert (await client.patch("/config", json={"CONCURRENCY": 0}, headers=ADMIN)).status_code == 422
+    assert (await client.patch("/config", json={"LINKACE_API_TOKEN": "x"}, headers=ADMIN)).status_code == 422
+    assert (await client.get("/config")).status_code == 401
+    assert (await client.get("/config", headers=ADMIN)).json()["CONCURRENCY"] == 3
+
+
+def test_reconfigure_reschedules_job(sentry, monkeypatch):
+    """A new interval moves the scheduled job without touching other settings."""
+    from apscheduler.triggers.interval import IntervalTrigger
+
+    monkeypatch.setattr(settings, "CHECK_INTERVAL_MIN", 30)
+    loop = asyncio.new_event_loop()
+    try:
+        sentry.scheduler.configure(event_loop=loop)
+        sentry.scheduler.add_job(sentry.run_once, IntervalTrigger(minutes=30), id="check_bookmarks")
+        sentry.scheduler.start()
+        assert sentry.reconfigure(CHECK_INTERVAL_MIN=5) == {"CHECK_INTERVAL_MIN": {"old": 30, "new": 5}}
+        assert sentry.scheduler.get_job("check_bookmarks").trigger.interval.total_seconds() == 300
+        sentry.scheduler.shutdown(wait=False)
+    finally:
+        loop.close()
+    with pytest.raises(ValueError):
+        sentry.reconfigure(LINKACE_API_TOKEN="x")
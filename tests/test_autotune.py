@@ -0,0 +1,52 @@
+"""Tests for the AIMD concurrency controller."""
+from src.autotune import AIMDController
+from src.limits import ResizableSemaphore
+
+
+class Saturated(ResizableSemaphore):
+    """Semaphore that always reports queued bookmarks."""
+
+    @property
+    def waiting(self) -> int:
+        return 1
+
+
+def run_window(controller, result_class="alive", seconds=1.0):
+    """Record one full window of checks lasting ``seconds``."""
+    now = controller._window_started + seconds
+    for _ in range(controller.window):
+        controller.record(result_class, now=now)
+
+
+def test_increases_while_throughput_holds():
+    """Saturated windows with steady throughput probe upward one step at a time."""
+    controller = AIMDController(Saturated(4), window=10)
+    for _ in range(3):
+        run_window(controller)
+    assert controller.limit == 7
+
+
+def test_backs_off_on_timeouts_and_lag():
+    """Errors or loop lag halve the limit, down to the minimum."""
+    controller = AIMDController(Saturated(20), min_limit=3, window=10)
+    run_window(controller, "timeout")
+    assert controller.limit == 10
+
+    controller.observe_lag(1.0)
+    run_window(controller)
+    assert controller.limit == 5
+
+    run_window(controller, "error")
+    assert controller.limit == 3
+
+
+def test_holds_when_not_saturated_or_throughput_drops():
+    """No upward probing while the limit is not the bottleneck or throughput fell."""
+    controller = AIMDController(ResizableSemaphore(8), window=10)
+    run_window(controller)
+    assert controller.limit == 8
+
+    controller = AIMDController(Saturated(8), window=10)
+    run_window(controller, seconds=1.0)
+    run_window(controller, seconds=2.0)
+    assert controller.limit == 9
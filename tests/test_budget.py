@@ -0,0 +1,81 @@
+"""Tests for time- and count-budgeted check cycles."""
+import asyncio
+
+import pytest
+
+from src import metrics
+from src.config import settings
+from src.models import CheckResult
+from src.service import LinkAceSentry
+
+
+@pytest.fixture
+def sentry(monkeypatch):
+    """Service with an in-memory cache, one check at a time and a ten-bookmark listing."""
+    monkeypatch.setattr(settings, "CACHE_BACKEND", "memory")
+    monkeypatch.setattr(settings, "NOTIFY_SINK", "fake")
+    monkeypatch.setattr(settings, "AUTOTUNE_ENABLED", False)
+    monkeypatch.setattr(settings, "CONCURRENCY", 1)
+    sentry = LinkAceSentry()
+    sentry.checked = []
+
+    async def list_bookmarks(page=1):
+        data = [{"id": i, "url": f"https://example.com/{i}", "title": str(i)} for i in range(10)]
+        return {"data": data[5 * (page - 1):5 * page], "meta": {"current_page": page, "last_page": 2}}
+
+    async def check_url(url):
+        sentry.checked.append(int(url.rsplit("/", 1)[1]))
+        await asyncio.sleep(0.02)
+        return CheckResult(is_alive=True, status_code=200)
+
+    sentry.api.list_bookmarks = list_bookmarks
+    sentry.checker.check_url = check_url
+    return sentry
+
+
+@pytest.mark.asyncio
+async def test_budget_checks_failing_then_new_then_stalest(sentry, monkeypatch):
+    """Recently failing go first, then never checked, then stalest; the rest carries over."""
+    monkeypatch.setattr(settings, "CYCLE_MAX_CHECKS", 4)
+    cache = sentry.cache
+    for _ in range(5):
+        cache.update_status("9", "dead")  # Dead for long: ranked by staleness
+    for bookmark_id in ("3", "0", "1", "2", "5", "6", "7"):
+        cache.update_status(bookmark_id, "alive")
+    cache.update_status("4", "dead")  # Started failing
+    cache.update_status("6", "dead")
+
+    await sentry.run_once()
+    assert sentry.checked == [4, 6, 8, 9]
+    assert (sentry.last_cycle_processed, sentry.last_cycle_backlog) == (4, 6)
+    assert sentry.last_cycle_coverage == pytest.approx(0.4)
+
+    sentry.checked.clear()
+    await sentry.run_once()
+    assert sentry.checked == [3, 0, 1, 2]
+    # Checked IDs are only kept for page sweep checkpoints
+    assert sentry._page_done is None
+
+
+@pytest.mark.asyncio
+async def test_budget_stops_starting_checks_at_deadline(sentry, monkeypatch):
+    """No check starts once CYCLE_BUDGET_S is spent; coverage and backlog are exported."""
+    monkeypatch.setattr(settings, "CYCLE_BUDGET_S", 0.1)
+
+    await sentry.run_once()
+
+    checked = len(sentry.checked)
+    assert 0 < checked < 10
+    assert sentry.health()["last_cycle_backlog"] == 10 - checked
+    assert metrics.CYCLE_BACKLOG._value.get() == 10 - checked
+    assert metrics.CYCLE_COVERAGE._value.get() == pytest.approx(checked / 10)
+
+
+@pytest.mark.asyncio
+async def test_overlapping_run_is_counted(sentry):
+    """A scheduled run that finds a cycle still running is skipped and counted."""
+    before = metrics.CYCLES_SKIPPED._value.get()
+    sentry.jobs.start()
+    await sentry.run_once()
+    assert metrics.CYCLES_SKIPPED._value.get() == before + 1
+    assert sentry.checked == []
@@ -0,0 +1,156 @@
+"""Tests for the cache backends."""
+import threading
+
+import pytest
+from src.cache import MemoryCache, SQLiteCache, LogCache, create_cache
+
+
+@pytest.fixture(params=["memory", "sqlite", "log"])
+def cache(request, tmp_path):
+    """Create one instance of every cache backend."""
+    if request.param == "memory":
+        backend = MemoryCache()
+    elif request.param == "sqlite":
+        backend = SQLiteCache(str(tmp_path / "cache.db"))
+    else:
+        backend = LogCache(str(tmp_path / "cache"), snapshot_every=3)
+    yield backend
+    backend.close()
+
+
+def test_consecutive_failures(cache):
+    """Failures accumulate while dead and reset once alive."""
+    assert cache.get_status("1") is None
+
+    cache.update_status("1", "dead")
+    assert cache.get_status("1") == ("dead", 1, None)
+    assert cache.should_mark_dead("1") is False
+
+    cache.update_status("1", "dead")
+    assert cache.should_mark_dead("1") is True
+
+    cache.update_status("1", "alive", "https://example.com/")
+    assert cache.get_status("1") == ("alive", 0, "https://example.com/")
+    assert cache.get_final_url("1") == "https://example.com/"
+
+
+def test_check_states(cache):
+    """check_states returns status, failure count and check time of every bookmark."""
+    cache.update_status("1", "dead")
+    cache.update_status("1", "dead")
+    cache.update_status("2", "alive")
+
+    states = cache.check_states()
+    assert sorted(states) == ["1", "2"]
+    assert states["1"][:2] == ("dead", 2)
+    assert states["2"][:2] == ("alive", 0)
+    assert states["2"][2] == cache.get_record("2").checked_at
+
+
+def test_clear_and_cleanup(cache):
+    """Old entries are removed and clear empties the cache."""
+    cache.update_status("1", "alive")
+    cache.update_status("2", "dead")
+    assert len(cache) == 2
+
+    cache.cleanup_old_entries(days=1)
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_status_required(cache):
+    """A None status is rejected."""
+    with pytest.raises(ValueError):
+        cache.update_status("1", None)
+
+
+@pytest.mark.parametrize("factory", [
+    lambda path: SQLiteCache(str(path / "cache.db")),
+    lambda path: LogCache(str(path / "cache"), snapshot_every=4),
+])
+def test_persistent_backends_survive_restart(factory, tmp_path):
+    """SQLite and log backends reload their state on startup."""
+    cache = factory(tmp_path)
+    for i in range(10):
+        cache.update_status(str(i), "dead")
+    cache.update_status("3", "dead")
+    cache.close()
+
+    reopened = factory(tmp_path)
+    assert len(reopened) == 10
+    assert reopened.get_status("3") == ("dead", 2, None)
+    reopened.close()
+
+
+def test_log_cache_recovers_from_torn_write(tmp_path):
+    """Records written after a torn line are not lost on later restarts."""
+    cache = LogCache(str(tmp_path / "cache"))
+    cache.update_status("1", "dead")
+    cache.close()
+    with open(cache.log_path, "a", encoding="utf-8") as f:
+        f.write('["2", "de')
+
+    reopened = LogCache(str(tmp_path / "cache"))
+    reopened.update_status("3", "alive")
+    reopened.close()
+
+    reloaded = LogCache(str(tmp_path / "cache"))
+    assert reloaded.get_status("1") == ("dead", 1, None)
+    assert reloaded.get_status("3") == ("alive", 0, None)
+    assert reloaded.get_status("2") is None
+    reloaded.close()
+
+
+@pytest.mark.asyncio
+async def test_log_cache_snapshots_off_the_loop(tmp_path, monkeypatch):
+    """On the event loop, snapshots are written by a worker thread and nothing is lost."""
+    writer_threads = []
+    write_snapshot = LogCache._write_snapshot
+
+    def recording_write(self, records):
+        writer_threads.append(threading.current_thread())
+        write_snapshot(self, records)
+
+    monkeypatch.setattr(LogCache, "_write_snapshot", recording_write)
+    cache = LogCache(str(tmp_path / "cache"), snapshot_every=3)
+    for i in range(10):
+        cache.update_status(str(i), "dead")
+    cache.close()
+
+    assert writer_threads and threading.main_thread() not in writer_threads
+    assert not cache.rotated_path.exists()
+    reopened = LogCache(str(tmp_path / "cache"))
+    assert len(reopened) == 10
+    reopened.close()
+
+
+def test_create_cache_rejects_unknown_backend():
+    """Unknown backend names fail loudly."""
+    with pytest.raises(ValueError):
+        create_cache("redis", ":memory:")
+
+
+def test_query_filters_and_keyset_pagination(cache):
+    """Queries filter by status, failures and host and page by ID."""
+    for i in range(5):
+        cache.update_status(f"{i:02d}", "dead", url=f"https://Example.com/{i}")
+    cache.update_status("01", "dead")
+    cache.update_status("02", "alive")
+    cache.update_status("09", "dead", url="https://other.org/")
+
+    dead = cache.query(status="dead", host="example.com")
+    assert [r.id for r in dead] == ["00", "01", "03", "04"]
+    assert dead[1].url == "https://Example.com/1"
+    assert dead[1].failing_since < dead[1].checked_at
+
+    assert [r.id for r in cache.query(min_failures=2)] == ["01"]
+    assert cache.get_record("02").failing_since is None
+
+    first = cache.query(status="dead", limit=2)
+    rest = cache.query(status="dead", after_id=first[-1].id, limit=10)
+    assert [r.id for r in first + rest] == ["00", "01", "03", "04", "09"]
+
+    assert cache.query(checked_after="9999-01-01T00:00:00+00:00") == []
+    assert len(cache.query(checked_before="9999-01-01T00:00:00+00:00")) == 6
@@ -1,8 +1,10 @@
 """Tests for URL checking functionality."""
+import asyncio
 import pytest
 import allure
 from unittest.mock import patch, Mock
 import httpx
+from src import metrics
 from src.checker import URLChecker
 
 @pytest.fixture
@@ -77,22 +79,130 @@ async def test_check_dead_url(checker):
 @pytest.mark.asyncio
 async def test_check_redirect(checker):
     """Test URL redirection."""
-    with patch('httpx.AsyncClient.head') as mock_head, \
-         patch('httpx.AsyncClient.get') as mock_get:
+    with patch('httpx.AsyncClient.head') as mock_head:
 
         # First response - redirect
         mock_response1 = Mock()
         mock_response1.status_code = 301
         mock_response1.headers = {"location": "https://new.example.com"}
         mock_response1.url = "https://old.example.com"
-        mock_head.return_value = mock_response1
         
         # Second response - final destination
         mock_response2 = Mock()
         mock_response2.status_code = 200
         mock_response2.url = "https://new.example.com"
-        mock_get.return_value = mock_response2
+        mock_head.side_effect = [mock_response1, mock_response2]
 
         result = await checker.check_url("https://old.example.com")
         assert result.status_code == 200
-        assert result.final_url == "https://new.example.com"
\ No newline at end of file
+        assert result.final_url == "https://new.example.com"
+        assert result.redirected is True
+
+
+@allure.epic("LinkAce Sentry")
+@allure.feature("URL Checking")
+@allure.story("URL Redirection")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.asyncio
+async def test_redirect_hops_are_joined_and_cached(checker):
+    """Relative locations are resolved per RFC 3986 and permanent hops are reused."""
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, str(request.url)))
+        if request.url.path == "/a/b":
+            return httpx.Response(301, headers={"Location": "../c?x=1"})
+        if request.url.path == "/c":
+            return httpx.Response(302, headers={"Location": "//other.example.org/d"})
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        return httpx.Response(200)
+
+    checker._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        with allure.step("Resolve the chain by request"):
+            first = await checker.check_url("https://example.com/a/b")
+        with allure.step("Check again with the permanent hop cached"):
+            requests.clear()
+            second = await checker.check_url("https://example.com/a/b")
+    finally:
+        await checker.aclose()
+
+    assert first.is_alive is True
+    assert first.final_url == "https://other.example.org/d"
+    assert first.redirected is True
+    assert second == first
+    # The 301 is served from the cache; the uncacheable 302 is requested again
+    assert requests == [
+        ("HEAD", "https://example.com/c?x=1"),
+        ("HEAD", "https://other.example.org/d"),
+        ("GET", "https://other.example.org/d"),
+    ]
+
+
+@allure.epic("LinkAce Sentry")
+@allure.feature("URL Checking")
+@allure.story("URL Redirection")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.asyncio
+async def test_stale_cached_hop_is_rechecked(checker):
+    """A cached chain that now ends at a dead page is discarded and followed afresh."""
+    checker.hops.put("https://example.com/old", "https://example.com/gone", 301, {})
+
+    def handler(request):
+        if request.url.path == "/old":
+            return httpx.Response(308, headers={"Location": "/new"})
+        if request.url.path == "/gone":
+            return httpx.Response(404)
+        return httpx.Response(200)
+
+    checker._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        result = await checker.check_url("https://example.com/old")
+    finally:
+        await checker.aclose()
+
+    assert result.is_alive is True
+    assert result.final_url == "https://example.com/new"
+    assert result.redirected is False
+    assert checker.hops.get("https://example.com/old").location == "https://example.com/new"
+
+
+@allure.epic("LinkAce Sentry")
+@allure.feature("URL Checking")
+@allure.story("Check Deadline")
+@allure.severity(allure.severity_level.CRITICAL)
+@pytest.mark.asyncio
+async def test_trickling_server_hits_check_deadline(checker):
+    """A server trickling its response is cut off at the wall-clock deadline."""
+    async def tarpit(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 405 Method Not Allowed\r\nContent-Length: 0\r\n\r\n")
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nX-Padding: ")
+        try:
+            while True:
+                writer.write(b".")
+                await writer.drain()
+                # Each byte arrives well within the read timeout
+                await asyncio.sleep(0.05)
+        except (ConnectionError, asyncio.CancelledError):
+            writer.close()
+
+    server = await asyncio.start_server(tarpit, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    checker.deadline = 0.3
+    try:
+        with allure.step("Check URL served byte by byte"):
+            started = asyncio.get_running_loop().time()
+            result = await checker.check_url(f"http://127.0.0.1:{port}/slow")
+            elapsed = asyncio.get_running_loop().time() - started
+    finally:
+        await checker.aclose()
+        server.close()
+
+    with allure.step("Verify the check was cancelled and classified as a timeout"):
+        assert elapsed < 1.0
+        assert result.is_alive is False
+        assert "deadline" in result.error
+        assert metrics.classify(result) == "timeout"
@@ -0,0 +1,23 @@
+"""End-to-end cycle against the fake LinkAce API and fake web hosts."""
+import pytest
+from benchmarks import bench_e2e
+from src.config import settings
+
+
+@pytest.mark.asyncio
+async def test_full_cycle_against_fakes(monkeypatch):
+    """A full run_once checks every bookmark and tags the dead ones in LinkAce."""
+    for name in ("LINKACE_BASE_URL", "CONCURRENCY", "CACHE_BACKEND", "NOTIFY_SINK", "TRACE_EXPORT", "PROFILE_CYCLES"):
+        monkeypatch.setattr(settings, name, getattr(settings, name))
+
+    result = await bench_e2e.run(
+        bookmarks=120, hosts=3, latency=0.0, error_rate=0.2, redirect_rate=0.2, concurrency=8
+    )
+
+    assert result["checks"] == 120
+    assert result["linkace_calls"]["GET /api/v2/links"] == 5
+    dead = result["web_responses"].get("404", 0) + result["web_responses"].get("500", 0)
+    assert result["linkace_calls"]["PUT /api/v2/links/{id}"] == dead
+    # Each check ends in exactly one 200 or error response; the redirect that
+    # precedes the 200 for redirected bookmarks is counted under "301"
+    assert result["web_responses"]["200"] + dead == 120
@@ -0,0 +1,69 @@
+"""Tests for the resizable concurrency limits."""
+import asyncio
+
+import pytest
+
+from src.limits import HostLimiter, ResizableSemaphore
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_semaphore_grows_and_shrinks_while_held():
+    """Growing admits waiters at once; shrinking lets holders finish first."""
+    semaphore = ResizableSemaphore(1)
+    await semaphore.acquire()
+    waiters = [asyncio.create_task(semaphore.acquire()) for _ in range(3)]
+    await settle()
+    assert semaphore.waiting == 3
+
+    semaphore.resize(3)
+    await settle()
+    assert semaphore.in_use == 3 and semaphore.waiting == 1
+
+    semaphore.resize(1)
+    semaphore.release()
+    semaphore.release()
+    await settle()
+    # Two released, but one holder is still over the new limit of one
+    assert semaphore.in_use == 1 and semaphore.waiting == 1
+
+    semaphore.release()
+    await asyncio.gather(*waiters)
+    assert semaphore.in_use == 1 and semaphore.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_permits():
+    """A waiter cancelled after being handed a permit gives it back."""
+    semaphore = ResizableSemaphore(1)
+    await semaphore.acquire()
+    waiter = asyncio.create_task(semaphore.acquire())
+    await settle()
+
+    semaphore.release()
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert semaphore.in_use == 0 and semaphore.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_host_limiter_caps_each_host():
+    """Each host has its own cap; idle hosts are forgotten."""
+    limiter = HostLimiter(1)
+    await limiter.acquire("a.example")
+    await limiter.acquire("b.example")
+    blocked = asyncio.create_task(limiter.acquire("a.example"))
+    await settle()
+    assert not blocked.done()
+
+    limiter.resize(0)
+    await settle()
+    assert blocked.done()
+
+    for host in ("a.example", "a.example", "b.example"):
+        limiter.release(host)
+    assert limiter.active_hosts == 0
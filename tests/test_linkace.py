@@ -2,8 +2,11 @@
 import pytest
 from unittest.mock import patch, Mock
 import json
+import logging
 from src.services.linkace_client import LinkAceClient
 from src.services.notification_service import NotificationService
+from src.services.notification_digest import transition_message
+from src.services.notification_sinks import FakeSNSSink, FileSink, ThrottlingError
 
 @pytest.fixture
 def api_client():
@@ -42,6 +45,17 @@ async def test_list_links(api_client):
         assert len(links) == 2
         assert links[0]["url"] == "https://example1.com"
 
+
+@pytest.mark.asyncio
+async def test_list_links_does_not_log_token(api_client, caplog):
+    """The bearer token never reaches the logs, even at DEBUG."""
+    caplog.set_level(logging.DEBUG)
+    with patch('httpx.AsyncClient.get') as mock_get:
+        mock_get.return_value = Mock(status_code=200, json=lambda: {"data": []})
+        await api_client.list_bookmarks(page=1)
+    assert "test_token" not in caplog.text
+
+
 @pytest.mark.asyncio
 async def test_update_link(api_client):
     """Test updating a link in LinkAce."""
@@ -93,12 +107,50 @@ async def test_notify_dead_link(notification_service):
         "status_code": None
     }
 
-    with patch.object(notification_service, 'sns') as mock_sns:
-        mock_sns.publish = Mock(return_value={"MessageId": "test123"})
-        
-        await notification_service.notify_dead_link(link_data, check_result)
-        
-        mock_sns.publish.assert_called_once()
-        call_args = mock_sns.publish.call_args[1]
-        assert 'Message' in call_args
-        assert 'Subject' in call_args
\ No newline at end of file
+    event = {**link_data, "last_checked": None, "final_url": None, **check_result}
+
+    mock_sns = Mock()
+    mock_sns.publish = Mock(return_value={"MessageId": "test123"})
+    notification_service.sink.client = mock_sns
+
+    await notification_service.send_batch([transition_message("dead", event)])
+
+    mock_sns.publish.assert_called_once()
+    call_args = mock_sns.publish.call_args[1]
+    assert 'Message' in call_args
+    assert 'Subject' in call_args
+
+
+@pytest.mark.asyncio
+async def test_file_sink_writes_jsonl(tmp_path):
+    """Notifications can be delivered to a JSON Lines file instead of SNS."""
+    path = tmp_path / "notifications.jsonl"
+    service = NotificationService(topic_arn="unused", sink=FileSink(str(path)))
+
+    await service.send_batch([transition_message("dead", {
+        "id": 1, "url": "https://example.com", "title": "Test Link", "last_checked": None,
+        "error": "HTTP 404", "status_code": 404, "final_url": None,
+    })])
+    await service.stop()
+
+    [record] = [json.loads(line) for line in path.read_text().splitlines()]
+    assert record["Subject"] == "Dead Link Found: Test Link"
+    assert json.loads(record["Message"])["type"] == "dead_link"
+
+
+@pytest.mark.asyncio
+async def test_fake_sns_simulates_throttling():
+    """The fake SNS sink records calls and throttles beyond its quota."""
+    sink = FakeSNSSink(max_calls_per_second=2)
+    service = NotificationService(topic_arn="unused", sink=sink)
+    entry = {"Subject": "s", "Message": "m"}
+
+    await service.send_batch([entry])
+    await service.send_batch([entry, entry])
+    with pytest.raises(ThrottlingError):
+        await service.send_batch([entry])
+
+    assert len(sink.messages) == 3
+    assert sink.throttled == 1
+    assert service.metrics.published == 3
+    assert service.metrics.failed == 1
@@ -0,0 +1,40 @@
+"""Tests for queued, structured logging."""
+import json
+import logging
+import queue
+from src.log_setup import DeferredQueueHandler, JSONFormatter, bookmark_log_level
+
+
+def test_json_formatter_includes_extras():
+    """Extra fields become top-level JSON keys."""
+    record = logging.LogRecord("sentry", logging.INFO, __file__, 1, "Processed %d", (3,), None)
+    record.total_processed = 3
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["message"] == "Processed 3"
+    assert entry["level"] == "INFO"
+    assert entry["total_processed"] == 3
+
+
+def test_queue_handler_defers_formatting():
+    """Records are enqueued with their arguments unmerged."""
+    log_queue = queue.SimpleQueue()
+    logger = logging.getLogger("tests.deferred")
+    logger.handlers[:] = [DeferredQueueHandler(log_queue)]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    logger.info("Checked %s", "https://example.com/")
+    logger.debug("Skipped %s", "https://example.com/")
+
+    record = log_queue.get_nowait()
+    assert record.msg == "Checked %s"
+    assert record.args == ("https://example.com/",)
+    assert log_queue.empty()
+
+
+def test_bookmark_log_level_sampling():
+    """Per-bookmark lines are DEBUG unless sampled."""
+    assert bookmark_log_level(0.0) == logging.DEBUG
+    assert bookmark_log_level(1.0) == logging.INFO
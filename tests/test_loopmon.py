@@ -0,0 +1,46 @@
+"""Tests for the event loop lag monitor."""
+import asyncio
+import logging
+import time
+
+import pytest
+
+from src.loopmon import LoopMonitor
+
+
+def block_the_loop(seconds):
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_is_logged_with_its_stack(caplog):
+    """A stall above the threshold is counted and logged with the blocking frame."""
+    monitor = LoopMonitor(interval=0.01, slow_threshold=0.05)
+    lags = []
+    monitor.add_listener(lags.append)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        with caplog.at_level(logging.WARNING, logger="src.loopmon"):
+            block_the_loop(0.3)
+            await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    assert monitor.stalls == 1
+    assert monitor.max_lag >= 0.25
+    assert max(lags) == monitor.max_lag
+    [record] = [r for r in caplog.records if r.name == "src.loopmon"]
+    assert "block_the_loop" in record.getMessage()
+    assert record.loop_lag_s >= 0.25
+
+
+@pytest.mark.asyncio
+async def test_idle_loop_reports_no_stalls():
+    """Normal scheduling jitter stays below the threshold."""
+    monitor = LoopMonitor(interval=0.01, slow_threshold=0.1)
+    monitor.start()
+    await asyncio.sleep(0.1)
+    await monitor.stop()
+
+    assert monitor.stalls == 0
@@ -0,0 +1,46 @@
+"""Tests for Prometheus instrumentation."""
+import pytest
+from prometheus_client import REGISTRY
+from src import metrics
+from src.models import CheckResult
+
+
+@pytest.mark.parametrize("result,expected", [
+    (CheckResult(is_alive=True, status_code=200), "alive"),
+    (CheckResult(is_alive=True, status_code=200, redirected=True), "redirected"),
+    (CheckResult(is_alive=False, status_code=404, error="HTTP 404"), "dead"),
+    (CheckResult(is_alive=False, error="Request timeout"), "timeout"),
+    (CheckResult(is_alive=False, error="Connection error: refused"), "error"),
+])
+def test_classify(result, expected):
+    """Check results map onto result classes."""
+    assert metrics.classify(result) == expected
+
+
+def test_observe_check_is_exported():
+    """Recorded checks show up in the exposition output."""
+    before = REGISTRY.get_sample_value("linkace_sentry_checks_total", {"result": "dead"}) or 0
+
+    metrics.observe_check("dead", 0.3)
+
+    assert REGISTRY.get_sample_value("linkace_sentry_checks_total", {"result": "dead"}) == before + 1
+    body = metrics.render().decode()
+    assert 'linkace_sentry_check_duration_seconds_bucket{le="0.5",result="dead"}' in body
+
+
+@pytest.mark.asyncio
+async def test_api_calls_counted_by_outcome():
+    """Decorated LinkAce client calls are counted as ok or error."""
+    @metrics.count_api_call("test")
+    async def call(fail):
+        if fail:
+            raise RuntimeError("boom")
+
+    await call(False)
+    with pytest.raises(RuntimeError):
+        await call(True)
+
+    assert REGISTRY.get_sample_value(
+        "linkace_sentry_linkace_api_calls_total", {"operation": "test", "outcome": "ok"}) == 1
+    assert REGISTRY.get_sample_value(
+        "linkace_sentry_linkace_api_calls_total", {"operation": "test", "outcome": "error"}) == 1
@@ -0,0 +1,23 @@
+"""Tests for the per-bookmark records."""
+from src.models import Bookmark, CheckResult
+
+
+def test_bookmark_from_api_listing_entry():
+    """Listing entries become compact records with a string id."""
+    bookmark = Bookmark.from_api({"id": 7, "url": "https://example.com", "title": "Example", "tags": [{"name": "x"}]})
+
+    assert bookmark == Bookmark("7", "https://example.com", ("x",), "Example")
+    assert not hasattr(bookmark, "__dict__")
+
+
+def test_check_result_serializes_all_fields():
+    """API responses are built from every result field."""
+    result = CheckResult(is_alive=False, status_code=404, error="HTTP 404")
+
+    assert result._asdict() == {
+        "is_alive": False,
+        "status_code": 404,
+        "final_url": None,
+        "error": "HTTP 404",
+        "redirected": False,
+    }
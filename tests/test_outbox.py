@@ -0,0 +1,117 @@
+"""Tests for the durable notification outbox."""
+import json
+import pytest
+from src.cache import SQLiteCache
+from src.services.notification_service import NotificationService
+from src.services.notification_sinks import FakeSNSSink
+from src.services.outbox_sender import OutboxSender
+
+
+def notifier_for(sink):
+    """Create a notification service delivering to ``sink``."""
+    return NotificationService(topic_arn="arn:aws:sns:us-east-1:123456789012:test", sink=sink)
+
+
+def message(i):
+    return {"Subject": f"Dead Link Found: {i}", "Message": f'{{"id": {i}}}'}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a file-backed SQLite cache."""
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    yield cache
+    cache.close()
+
+
+def test_outbox_written_with_status(cache, tmp_path):
+    """A notification is committed with its status change and survives a restart."""
+    cache.update_status("1", "dead", notification=message(1))
+    cache.update_status("2", "alive")
+    cache.close()
+
+    reopened = SQLiteCache(str(tmp_path / "cache.db"))
+    assert reopened.get_status("1") == ("dead", 1, None)
+    assert reopened.outbox_size() == 1
+    [(_, payload, attempts)] = reopened.fetch_outbox(10)
+    assert payload == message(1)
+    assert attempts == 0
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_sender_batches_and_acks(cache):
+    """Due notifications go out in batches of 10 and are removed once delivered."""
+    for i in range(23):
+        cache.update_status(str(i), "dead", notification=message(i))
+    sink = FakeSNSSink()
+
+    delivered = await OutboxSender(cache, notifier_for(sink)).drain()
+
+    assert delivered == 23
+    assert [len(call) for call in sink.calls] == [10, 10, 3]
+    assert sink.messages[0] == message(0)
+    assert cache.outbox_size() == 0
+
+
+@pytest.mark.asyncio
+async def test_sender_limits_batches_to_256_kb(cache):
+    """Batches stay under the PublishBatch size limit counted in UTF-8 bytes, not characters."""
+    # 60k characters but 120 KB each in UTF-8
+    for i in range(3):
+        cache.enqueue_notification({"Subject": str(i), "Message": "é" * 60_000})
+    sink = FakeSNSSink()
+
+    assert await OutboxSender(cache, notifier_for(sink)).drain() == 3
+    assert [len(call) for call in sink.calls] == [2, 1]
+
+
+class RejectSecondSink(FakeSNSSink):
+    """Fake SNS that rejects the second entry of every batch."""
+
+    async def send_batch(self, entries):
+        await super().send_batch(entries)
+        return [1] if len(entries) > 1 else []
+
+
+@pytest.mark.asyncio
+async def test_sender_retries_with_backoff(cache):
+    """Failed entries stay in the outbox and are deferred, not lost."""
+    for i in range(3):
+        cache.enqueue_notification(message(i))
+    sink = FakeSNSSink(throttle_rate=1.0)
+
+    assert await OutboxSender(cache, notifier_for(sink), base_backoff=60).drain() == 0
+    assert sink.throttled == 1
+    assert cache.outbox_size() == 3
+    # Deferred entries are not due again right away
+    assert cache.fetch_outbox(10) == []
+
+    with cache._conn:
+        cache._conn.execute("UPDATE outbox SET next_attempt_at = 0")
+    sink = RejectSecondSink()
+    assert await OutboxSender(cache, notifier_for(sink), base_backoff=60).drain() == 2
+    [(payload, attempts)] = cache._conn.execute("SELECT payload, attempts FROM outbox").fetchall()
+    assert json.loads(payload) == message(1)
+    assert attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_sender_dead_letters_after_max_attempts(cache):
+    """A notification failing max_attempts times is moved to the dead letters instead of retried."""
+    cache.enqueue_notification(message(1))
+    sink = FakeSNSSink(throttle_rate=1.0)
+    sender = OutboxSender(cache, notifier_for(sink), base_backoff=60, max_attempts=2)
+
+    for _ in range(2):
+        with cache._conn:
+            cache._conn.execute("UPDATE outbox SET next_attempt_at = 0")
+        assert await sender.drain() == 0
+
+    assert sink.throttled == 2
+    assert cache.outbox_size() == 0
+    assert cache.dead_letter_size() == 1
+    [(payload, attempts, error)] = cache._conn.execute("SELECT payload, attempts, error FROM outbox_dead").fetchall()
+    assert json.loads(payload) == message(1)
+    assert attempts == 2
+    assert error == "Rate exceeded"
@@ -0,0 +1,36 @@
+"""Tests for the on-demand cycle profiler."""
+import asyncio
+import pstats
+import pytest
+from src.profiler import CycleProfiler
+
+
+async def busy_cycle():
+    for _ in range(5):
+        sum(i * i for i in range(20_000))
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_profiles_only_armed_cycles(tmp_path):
+    """Armed cycles write pstats, collapsed stacks and tracemalloc output; others nothing."""
+    profiler = CycleProfiler(str(tmp_path), sample_interval=0.001)
+
+    async with profiler.profile("idle"):
+        await busy_cycle()
+    assert list(tmp_path.iterdir()) == []
+
+    profiler.arm(1)
+    async with profiler.profile("job1"):
+        await busy_cycle()
+    async with profiler.profile("job2"):
+        await busy_cycle()
+
+    assert profiler.pending == 0
+    [base] = profiler.outputs
+    assert base.endswith("job1")
+    stats = pstats.Stats(f"{base}.pstats")
+    assert any(func[2] == "busy_cycle" for func in stats.stats)
+    collapsed = open(f"{base}.collapsed").read()
+    assert "test_profiler.py:busy_cycle" in collapsed
+    assert open(f"{base}.tracemalloc.txt").read()
@@ -0,0 +1,66 @@
+"""Tests for the redirect hop cache."""
+import time
+
+import pytest
+
+from src.cache import SQLiteCache
+from src.redirects import HopCache, hop_ttl
+
+
+@pytest.mark.parametrize("status, headers, expected", [
+    (301, {}, 100),
+    (308, {}, 100),
+    (302, {}, 0),
+    (302, {"cache-control": "public, max-age=30"}, 30),
+    (301, {"cache-control": "max-age=99999"}, 1000),
+    (301, {"cache-control": "no-store"}, 0),
+    (301, {"cache-control": "private, no-cache"}, 0),
+    (307, {"expires": "Thu, 01 Jan 1970 00:01:00 GMT"}, 60),
+    (301, {"expires": "0"}, 0),
+])
+def test_hop_ttl(status, headers, expected):
+    """Cache headers take precedence; permanent redirects get the default lifetime."""
+    assert hop_ttl(status, headers, default_ttl=100, max_ttl=1000, now=0) == expected
+
+
+def test_hops_expire_and_evict():
+    """Expired hops are dropped on lookup and the least recently used go first."""
+    hops = HopCache(max_entries=2)
+    assert hops.put("http://a/", "https://a/", 301, {})
+    assert not hops.put("http://tmp/", "http://tmp/x", 302, {})
+    hops.put("http://b/", "https://b/", 301, {"cache-control": "max-age=5"})
+    assert hops.get("http://b/", now=time.time() + 10) is None
+
+    hops.put("http://c/", "https://c/", 301, {})
+    hops.get("http://a/")
+    hops.put("http://d/", "https://d/", 301, {})
+    assert hops.get("http://c/") is None
+    assert hops.get("http://a/").location == "https://a/"
+
+
+def test_resolve_stops_at_loops_and_limit():
+    """Cached chains are followed up to the hop limit and never around a loop."""
+    hops = HopCache()
+    hops.put("http://a/", "http://b/", 301, {})
+    hops.put("http://b/", "http://c/", 301, {})
+    hops.put("http://c/", "http://a/", 301, {})
+    assert hops.resolve("http://a/", max_hops=5) == ["http://a/", "http://b/", "http://c/"]
+    assert hops.resolve("http://a/", max_hops=1) == ["http://a/", "http://b/"]
+
+
+def test_sqlite_persists_hops(tmp_path):
+    """Hops survive a restart through SQLite; expired and discarded ones do not."""
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    hops = HopCache(cache)
+    hops.put("http://a/", "https://a/", 301, {})
+    hops.put("http://b/", "https://b/", 301, {})
+    hops.discard(["http://b/"])
+    cache.put_redirect("http://old/", "https://old/", 301, time.time() - 1)
+    cache.close()
+
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    reloaded = HopCache(cache)
+    assert len(reloaded) == 1
+    assert reloaded.get("http://a/").location == "https://a/"
+    assert cache._conn.execute("SELECT COUNT(*) FROM redirects").fetchone()[0] == 1
+    cache.close()
@@ -0,0 +1,104 @@
+"""Tests for graceful shutdown and resuming interrupted cycles."""
+import asyncio
+
+import pytest
+
+from src.cache import SQLiteCache
+from src.config import settings
+from src.models import CheckResult
+from src.service import CYCLE_CHECKPOINT, LinkAceSentry
+
+PAGES = {
+    1: [{"id": i, "url": f"https://example.com/{i}", "title": str(i)} for i in range(3)],
+    2: [{"id": i, "url": f"https://example.com/{i}", "title": str(i)} for i in range(3, 6)],
+}
+
+
+@pytest.fixture
+def make_sentry(monkeypatch, tmp_path):
+    """Build services sharing one SQLite cache, with a two-page fake LinkAce listing."""
+    monkeypatch.setattr(settings, "CACHE_BACKEND", "sqlite")
+    monkeypatch.setattr(settings, "cache_db_path", str(tmp_path / "cache.db"))
+    monkeypatch.setattr(settings, "NOTIFY_SINK", "fake")
+    monkeypatch.setattr(settings, "AUTOTUNE_ENABLED", False)
+    monkeypatch.setattr(settings, "CONCURRENCY", 1)
+
+    def make(check_url):
+        sentry = LinkAceSentry()
+
+        async def list_bookmarks(page=1):
+            meta = {"current_page": page, "last_page": len(PAGES), "total": 6}
+            return {"data": PAGES.get(page, []), "meta": meta}
+
+        sentry.api.list_bookmarks = list_bookmarks
+        sentry.checker.check_url = check_url
+        return sentry
+    return make
+
+
+def checkpoint(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    try:
+        return cache.get_checkpoint(CYCLE_CHECKPOINT)
+    finally:
+        cache.close()
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_in_flight_checks_and_resumes(make_sentry, tmp_path):
+    """Shutdown lets the running check finish, starts no new ones and the next cycle resumes there."""
+    checked = []
+    in_flight = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_check(url):
+        if url.endswith("/4"):
+            in_flight.set()
+            await release.wait()
+        checked.append(url)
+        return CheckResult(is_alive=True, status_code=200)
+
+    sentry = make_sentry(slow_check)
+    cycle = asyncio.create_task(sentry.run_once())
+    await in_flight.wait()
+    asyncio.get_running_loop().call_later(0.05, release.set)
+    await sentry.stop(grace=5)
+
+    assert cycle.done()
+    assert [url[-1] for url in checked] == ["0", "1", "2", "3", "4"]
+    assert sentry.last_cycle_error == "Interrupted by shutdown"
+    assert checkpoint(tmp_path) == {"page": 2, "done": [3, 4]}
+
+    resumed = []
+
+    async def fast_check(url):
+        resumed.append(url)
+        return CheckResult(is_alive=True, status_code=200)
+
+    sentry = make_sentry(fast_check)
+    await sentry.run_once()
+    await sentry.stop()
+    assert resumed == ["https://example.com/5"]
+    assert sentry.last_cycle_error is None
+    assert checkpoint(tmp_path) is None
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_checks_over_grace(make_sentry, tmp_path):
+    """Checks still running after the grace period are cancelled and rechecked on resume."""
+    started = asyncio.Event()
+
+    async def hanging_check(url):
+        if url.endswith("/1"):
+            started.set()
+            await asyncio.Event().wait()
+        return CheckResult(is_alive=True, status_code=200)
+
+    sentry = make_sentry(hanging_check)
+    cycle = asyncio.create_task(sentry.run_once())
+    await started.wait()
+    await sentry.stop(grace=0.05)
+
+    assert cycle.done()
+    assert sentry.last_cycle_error == "Cancelled"
+    assert checkpoint(tmp_path) == {"page": 1, "done": [0]}
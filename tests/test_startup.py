@@ -0,0 +1,114 @@
+"""Startup budget: cold import of the service and time to the first check."""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Generous enough for a slow CI runner; a regression such as importing
+# boto3 or FastAPI eagerly again costs several hundred milliseconds.
+IMPORT_BUDGET_S = 1.5
+FIRST_CHECK_BUDGET_S = 3.0
+
+# Only needed once a notification is published, a job is scheduled or the
+# control plane is served
+LAZY_MODULES = ("boto3", "botocore", "apscheduler", "fastapi")
+
+SCRIPT = """
+import asyncio, json, sys, time
+from benchmarks.fakes import FakeLinkAce, start_fleet, synthetic_links
+
+async def main():
+    fleet = await start_fleet(1, latency=0, error_rate=0, redirect_rate=0)
+    linkace = await FakeLinkAce(synthetic_links(1, fleet)).start()
+
+    started = time.perf_counter()
+    from src.config import settings
+    from src.service import LinkAceSentry
+    imported = time.perf_counter()
+    settings.LINKACE_BASE_URL = linkace.base_url
+    sentry = LinkAceSentry()
+
+    first_check = {}
+    check_url = sentry.checker.check_url
+    async def timed_check(url):
+        first_check.setdefault("s", time.perf_counter() - started)
+        first_check.setdefault("modules", sorted(
+            name for name in ("boto3", "botocore", "apscheduler", "fastapi") if name in sys.modules
+        ))
+        return await check_url(url)
+    sentry.checker.check_url = timed_check
+
+    await sentry.run_once()
+    await sentry.stop()
+    await linkace.stop()
+    await fleet[0].stop()
+    print(json.dumps({
+        "import_s": imported - started,
+        "first_check_s": first_check["s"],
+        "loaded_at_first_check": first_check["modules"],
+    }))
+
+asyncio.run(main())
+"""
+
+
+@pytest.fixture(scope="module")
+def cold_start():
+    """Run one cycle in a fresh interpreter under ``-X importtime``."""
+    env = dict(
+        os.environ,
+        CACHE_BACKEND="memory",
+        NOTIFY_SINK="fake",
+        TRACE_EXPORT="none",
+        PROFILE_CYCLES="0",
+        PYTHONDONTWRITEBYTECODE="1",
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    # "import time: self [us] | cumulative | imported package"
+    imports = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "self [us]" not in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            imports[name.strip()] = int(cumulative) / 1e6
+    return json.loads(proc.stdout.strip().splitlines()[-1]), imports
+
+
+def test_cold_import_budget(cold_start):
+    """Importing the service stays fast and leaves heavy dependencies for later."""
+    result, imports = cold_start
+
+    assert imports["src.service"] < IMPORT_BUDGET_S
+    assert result["import_s"] < IMPORT_BUDGET_S
+    assert not [name for name in imports if name.split(".")[0] in LAZY_MODULES]
+
+
+def test_time_to_first_check_budget(cold_start):
+    """The first URL check starts soon after import, without loading boto3 or APScheduler."""
+    result, _ = cold_start
+
+    assert result["first_check_s"] < FIRST_CHECK_BUDGET_S
+    assert result["loaded_at_first_check"] == []
+
+
+def test_main_exports_dotenv_for_boto3(tmp_path):
+    """.env values reach os.environ, where boto3 reads AWS credentials."""
+    (tmp_path / ".env").write_text("AWS_ACCESS_KEY_ID=from-dotenv\nAWS_DEFAULT_REGION=eu-west-1\n")
+    env = {k: v for k, v in os.environ.items() if k not in ("AWS_ACCESS_KEY_ID", "AWS_DEFAULT_REGION")}
+    env["PYTHONPATH"] = str(ROOT)
+    proc = subprocess.run(
+        [sys.executable, "-c", "import os, src.main; print(os.environ['AWS_ACCESS_KEY_ID'], "
+         "os.environ['AWS_DEFAULT_REGION']); src.main.log_listener.stop()"],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    assert proc.stdout.split() == ["from-dotenv", "eu-west-1"]
@@ -0,0 +1,34 @@
+"""Tests for the columnar bookmark store."""
+from src.models import Bookmark
+from src.store import BookmarkStore
+
+
+def links(*hosts):
+    return [
+        {"id": i, "url": f"https://{host}/page/{i}", "title": f"Link {i}", "tags": [{"name": "news"}, {"name": "é"}]}
+        for i, host in enumerate(hosts, 1)
+    ]
+
+
+def test_store_builds_incrementally_and_interns_hosts_and_tags():
+    """Pages append rows; hosts and tags are stored once."""
+    store = BookmarkStore()
+    first = store.extend(links("a.example", "b.example"))
+    second = store.extend(links("a.example", "a.example", "c.example")[1:])
+
+    assert list(first) == [0, 1] and list(second) == [2, 3]
+    assert store.url(3) == "https://c.example/page/3"
+    assert store.host(2) == "a.example"
+    assert list(store.rows_for_host("a.example")) == [0, 2]
+    assert list(store.rows_for_host("unknown.example")) == []
+    assert store.host_counts() == {"a.example": 2, "b.example": 1, "c.example": 1}
+    assert store.tags.names == ["news", "é"]
+    assert store.bookmark(1) == Bookmark("2", "https://b.example/page/2", ("news", "é"), "Link 2")
+
+
+def test_interleave_alternates_hosts():
+    """Consecutive rows go to different hosts while more than one host is left."""
+    store = BookmarkStore()
+    rows = store.extend(links("a", "a", "a", "b", "b", "c"))
+
+    assert [store.host(row) for row in store.interleave(rows)] == ["a", "b", "c", "a", "b", "a"]
@@ -0,0 +1,85 @@
+"""Tests for cycle stage tracing."""
+import asyncio
+import json
+import pytest
+from src.tracing import FileSpanExporter, SpanExporter, Tracer
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_and_export_as_otlp_json(tmp_path):
+    """Child spans share the trace and point at their parent in the OTLP output."""
+    tracer = Tracer(FileSpanExporter(str(tmp_path / "traces.jsonl")))
+
+    with tracer.span("cycle"):
+        with tracer.span("bookmark", sample=True, bookmark_id="7", host="example.com"):
+            with tracer.span("check"):
+                pass
+    await tracer.flush()
+
+    [line] = (tmp_path / "traces.jsonl").read_text().splitlines()
+    spans = {s["name"]: s for s in json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]}
+    assert set(spans) == {"cycle", "bookmark", "check"}
+    assert len({s["traceId"] for s in spans.values()}) == 1
+    assert spans["check"]["parentSpanId"] == spans["bookmark"]["spanId"]
+    assert spans["bookmark"]["parentSpanId"] == spans["cycle"]["spanId"]
+    assert {"key": "host", "value": {"stringValue": "example.com"}} in spans["bookmark"]["attributes"]
+
+
+@pytest.mark.asyncio
+async def test_unsampled_subtree_is_dropped(tmp_path):
+    """Children of an unsampled span are not recorded."""
+    tracer = Tracer(FileSpanExporter(str(tmp_path / "traces.jsonl")), sample_rate=0.0)
+
+    with tracer.span("cycle"):
+        for _ in range(10):
+            with tracer.span("bookmark", sample=True):
+                with tracer.span("check"):
+                    pass
+    await tracer.flush()
+
+    spans = json.loads((tmp_path / "traces.jsonl").read_text())["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert [s["name"] for s in spans] == ["cycle"]
+
+
+class RecordingExporter(SpanExporter):
+    """Exporter keeping the names of every exported batch."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def export(self, spans):
+        self.batches.append([span.name for span in spans])
+
+
+@pytest.mark.asyncio
+async def test_long_cycle_exports_in_batches_and_keeps_root():
+    """Half-full buffers are exported in the background; the root span survives an overflow."""
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter, max_buffered=8)
+
+    with tracer.span("cycle"):
+        for _ in range(20):
+            with tracer.span("check"):
+                pass
+            # Background exports run between checks, as they would in a cycle
+            await asyncio.sleep(0)
+        assert tracer.dropped == 0
+        for _ in range(20):
+            with tracer.span("stalled"):
+                pass
+    await tracer.flush()
+
+    names = [name for batch in exporter.batches for name in batch]
+    assert len(exporter.batches) > 5
+    assert names.count("check") == 20
+    assert names.count("stalled") < 20  # Buffer overflowed with no chance to export
+    assert names[-1] == "cycle"
+
+
+def test_disabled_tracer_records_nothing():
+    """Without an exporter spans are a shared no-op."""
+    tracer = Tracer()
+    with tracer.span("cycle") as span:
+        span.set_attribute("x", 1)
+    assert tracer.span("a") is tracer.span("b")
+    assert tracer._buffer == []
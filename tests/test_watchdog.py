@@ -0,0 +1,35 @@
+"""Tests for the stuck-task watchdog."""
+import asyncio
+import logging
+
+import pytest
+
+from src.watchdog import TaskWatchdog
+
+
+async def wait_on_tarpit(watchdog, release):
+    with watchdog.track(bookmark_id=7, host="tarpit.example"):
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_stuck_task_is_reported_once_with_its_stack(caplog):
+    """A tracked task over the threshold is logged once, with where it waits."""
+    watchdog = TaskWatchdog(threshold=0.05)
+    release = asyncio.Event()
+    task = asyncio.create_task(wait_on_tarpit(watchdog, release))
+    await asyncio.sleep(0.01)
+    assert watchdog.scan() == 0
+
+    await asyncio.sleep(0.06)
+    with caplog.at_level(logging.WARNING, logger="src.watchdog"):
+        assert watchdog.scan() == 1
+        assert watchdog.scan() == 0
+    assert watchdog.stuck == 1
+
+    release.set()
+    await task
+    assert watchdog.stuck == 0 and watchdog.stuck_total == 1
+    [record] = caplog.records
+    assert "wait_on_tarpit" in record.getMessage()
+    assert record.host == "tarpit.example"